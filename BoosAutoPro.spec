@@ -13,7 +13,7 @@ a = Analysis(
         # 如果你想把 msedgedriver 打包进去，也加在这里
         ('utils/edge/msedgedriver.exe', 'utils/edge'),
     ],
-    hiddenimports=[],
+    hiddenimports=['gui_driver'],  # gui_main 中延迟导入
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1 @@
+"""性能基准脚本（不随程序打包，使用 `python -m benchmarks.<name>` 运行）。"""
@@ -0,0 +1,174 @@
+"""卡片扫描与匹配队列基准。
+
+1. 扫描开销：列表分别加载到 50/100/250/500/1000/2000 张卡片时，对比
+   全量扫描（SNAPSHOT_CARDS_JS 从下标 0 读取）与增量扫描（游标只读最后一页新增卡片）
+   的耗时中位数和返回数据量；
+2. 每次打招呼的 WebDriver 命令数：分别以 match_queue_enabled=False（每次打招呼后全量重扫）
+   与 True（一次扫描的全部匹配排队依次处理）驱动 _run_greet_loop。
+
+用法：
+    python -m benchmarks.bench_card_scan --greets 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks.browser import make_headless_driver, open_recommend_page
+from benchmarks.fake_site import FakeSite, FakeSiteConfig
+from common.processed_store import ProcessedStore
+from core import selectors
+from core.boos_driver import BoosDriver
+from core.card_snapshot import SNAPSHOT_CARDS_JS
+
+DEFAULT_OUTPUT = os.path.join("bench_results", "card_scan.json")
+DEFAULT_CHECKPOINTS = [50, 100, 250, 500, 1000, 2000]
+# 增量扫描时模拟“上次扫描后新加载了一页”
+NEW_CARDS = 15
+
+
+def make_boos(args, site: FakeSite, tmp: str, name: str) -> BoosDriver:
+    driver = make_headless_driver(args.browser, headless=not args.headed)
+    return BoosDriver(
+        logger=logging.getLogger("bench_card_scan"),
+        driver=driver,
+        base_url=site.url,
+        processed_store=ProcessedStore(os.path.join(tmp, f"{name}.db")),
+        instrument_commands=True,
+    )
+
+
+def load_cards(driver, count: int, timeout: float = 30) -> int:
+    """直接调用替身页面的 loadMore，直到列表至少有 count 张卡片"""
+    css = selectors.CARD_SELECTOR_CANDIDATES[0]
+
+    def loaded(d):
+        total = d.execute_script(
+            "var n = document.querySelectorAll(arguments[0]).length;"
+            "if (n < arguments[1]) loadMore(arguments[1] - n);"
+            "return n;",
+            css, count,
+        )
+        return total if total >= count else False
+
+    return WebDriverWait(driver, timeout, poll_frequency=0.05).until(loaded)
+
+
+def time_scan(driver, start: int, anchor: str | None, repeats: int) -> tuple[float, int]:
+    """返回单次扫描耗时中位数（ms）与返回数据的 JSON 字节数"""
+    durations, raw = [], None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        raw = driver.execute_script(SNAPSHOT_CARDS_JS, selectors.CARD_SELECTOR_CANDIDATES, start, anchor)
+        durations.append(time.perf_counter() - t0)
+    payload = len(json.dumps(raw, ensure_ascii=False).encode("utf-8"))
+    return statistics.median(durations) * 1000, payload
+
+
+def bench_scan_cost(args, site: FakeSite, tmp: str) -> list[dict]:
+    boos = make_boos(args, site, tmp, "scan")
+    driver = boos.driver
+    rows = []
+    try:
+        open_recommend_page(boos)
+        driver.switch_to.frame(driver.find_element(By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS))
+        for checkpoint in args.checkpoints:
+            total = load_cards(driver, checkpoint)
+            start = max(total - NEW_CARDS, 0)
+            anchor = driver.execute_script(
+                "var nodes = document.querySelectorAll(arguments[0]);"
+                "return arguments[1] > 0 ? nodes[arguments[1] - 1].getAttribute('data-geekid') : null;",
+                selectors.CARD_SELECTOR_CANDIDATES[0], start,
+            )
+            full_ms, full_bytes = time_scan(driver, 0, None, args.repeats)
+            incr_ms, incr_bytes = time_scan(driver, start, anchor, args.repeats)
+            rows.append({
+                "cards": total,
+                "full_ms": round(full_ms, 2),
+                "incremental_ms": round(incr_ms, 2),
+                "full_bytes": full_bytes,
+                "incremental_bytes": incr_bytes,
+            })
+    finally:
+        boos.close()
+    return rows
+
+
+def bench_greet(args, site: FakeSite, tmp: str, queued: bool) -> dict:
+    boos = make_boos(args, site, tmp, f"greet-{int(queued)}")
+    boos.match_queue_enabled = queued
+    try:
+        open_recommend_page(boos)
+        boos.phases.reset()
+        boos.command_stats.reset()
+        start = time.perf_counter()
+        boos._run_greet_loop(args.greets)
+        wall = time.perf_counter() - start
+        commands = boos.command_stats.total
+    finally:
+        boos.close()
+
+    greets = boos.phases.counters.get("greeted", 0)
+    return {
+        "greets": greets,
+        "commands_per_greet": round(commands / greets, 1) if greets else None,
+        "wall_s_per_greet": round(wall / greets, 3) if greets else None,
+        "scans": boos.phases.summary().get("scan", {}).get("count", 0),
+    }
+
+
+def run_benchmark(args) -> dict:
+    config = FakeSiteConfig(
+        card_total=max(args.checkpoints) + 100,
+        page_size=100,
+        api_latency_ms=0,
+        detail_latency_ms=args.detail_latency_ms,
+        show_download_popup=False,
+        decoy_assets=False,
+    )
+    with FakeSite(config) as site, tempfile.TemporaryDirectory() as tmp:
+        scan = bench_scan_cost(args, site, tmp)
+        before = bench_greet(args, site, tmp, queued=False)
+        after = bench_greet(args, site, tmp, queued=True)
+    return {
+        "config": {"greets": args.greets, "repeats": args.repeats, "browser": args.browser},
+        "scan_cost": scan,
+        "greet": {"rescan_each_greet": before, "match_queue": after},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="全量/增量卡片扫描与匹配队列的对比")
+    parser.add_argument("--greets", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=7, help="每个检查点的扫描次数")
+    parser.add_argument("--checkpoints", type=int, nargs="+", default=DEFAULT_CHECKPOINTS)
+    parser.add_argument("--detail-latency-ms", type=int, default=300)
+    parser.add_argument("--browser", choices=["edge", "chrome"], default="edge")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run_benchmark(args)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"{'卡片数':>8}{'全量(ms)':>12}{'增量(ms)':>12}{'全量(B)':>12}{'增量(B)':>12}")
+    for row in result["scan_cost"]:
+        print(f"{row['cards']:>8}{row['full_ms']:>12.2f}{row['incremental_ms']:>12.2f}"
+              f"{row['full_bytes']:>12}{row['incremental_bytes']:>12}")
+    for name, stats in result["greet"].items():
+        print(f"{name:<20} 命令数/次={stats['commands_per_greet']} 耗时/次={stats['wall_s_per_greet']}s 扫描={stats['scans']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""打招呼流程端到端吞吐基准。
+
+在本地替身站点上驱动真实的 BoosDriver._run_greet_loop，输出：
+每秒扫描卡片数、每次成功打招呼的耗时、每次打招呼的 WebDriver 命令数，
+以及各阶段（scan / match / click / detail / close / scroll）的 p50/p95 延迟。
+结果写入 JSON，并与保存的基线比较，超过阈值即视为性能回退（退出码 1）；
+基线文件缺失或指标未测量时无法比较，同样以退出码 1 结束。
+另外运行一个上限场景：替身站点达到每日上限后按钮文字先变化、上限弹窗延迟出现，
+驱动必须识别出上限并停止（否则同样以退出码 1 结束）。
+
+基线保存在 benchmarks/baselines/greet.json 并随代码提交（测量环境见其中的 note，使用 --browser chrome）。
+刷新基线：在参考机器上以相同参数运行 --save-baseline（会覆盖该文件），确认各项指标合理后
+与引起性能变化的改动一起提交；只有参数与基线 config 一致时比较才有意义，参数不同会给出提示。
+
+用法：
+    python -m benchmarks.bench_greet --browser chrome
+    python -m benchmarks.bench_greet --browser chrome --save-baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.browser import make_headless_driver, open_recommend_page
+from benchmarks.fake_site import FakeSite, FakeSiteConfig
+from common.processed_store import ProcessedStore
+from core.boos_driver import BoosDriver
+from core.pacing import PACING_PROFILES
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baselines", "greet.json")
+DEFAULT_OUTPUT = os.path.join("bench_results", "greet.json")
+
+# 指标名 -> 越大越好(True) / 越小越好(False)
+HIGHER_IS_BETTER = {
+    "cards_scanned_per_s": True,
+    "wall_s_per_greet": False,
+    "commands_per_greet": False,
+}
+# 阶段 p95 的增量低于该毫秒数时视为计时噪声（如亚毫秒级的 match 阶段），不算回退
+MIN_PHASE_DELTA_MS = 5.0
+
+
+def run_benchmark(args) -> dict:
+    config = FakeSiteConfig(
+        card_total=args.cards,
+        api_latency_ms=args.latency_ms,
+        detail_latency_ms=args.detail_latency_ms,
+        show_download_popup=False,
+    )
+    with FakeSite(config) as site, tempfile.TemporaryDirectory() as tmp:
+        driver = make_headless_driver(args.browser, headless=not args.headed)
+        store = ProcessedStore(os.path.join(tmp, "processed.db"))
+        boos = BoosDriver(
+            logger=logging.getLogger("bench_greet"),
+            driver=driver,
+            base_url=site.url,
+            pacing=PACING_PROFILES[args.pacing],
+            processed_store=store,
+            instrument_commands=True,
+        )
+        try:
+            open_recommend_page(boos)
+            boos.phases.reset()
+            boos.command_stats.reset()
+
+            start = time.perf_counter()
+            boos._run_greet_loop(args.greets)
+            wall = time.perf_counter() - start
+            commands = boos.command_stats.total
+            command_breakdown = boos.command_stats.by_phase()
+        finally:
+            boos.close()
+
+        greets = boos.phases.counters.get("greeted", 0)
+        scanned = boos.phases.counters.get("cards_scanned", 0)
+        return {
+            "config": {
+                "greets": args.greets,
+                "cards": args.cards,
+                "latency_ms": args.latency_ms,
+                "detail_latency_ms": args.detail_latency_ms,
+                "pacing": args.pacing,
+                "browser": args.browser,
+            },
+            "metrics": {
+                "cards_scanned_per_s": round(scanned / wall, 2) if wall else 0.0,
+                "wall_s_per_greet": round(wall / greets, 3) if greets else None,
+                "commands_per_greet": round(commands / greets, 1) if greets else None,
+            },
+            "totals": {
+                "wall_s": round(wall, 3),
+                "greets": greets,
+                "cards_scanned": scanned,
+                "commands": commands,
+                "site": site.stats(),
+            },
+            "phases": boos.phases.summary(),
+            "commands": command_breakdown,
+        }
+
+
+def run_limit_case(args) -> dict:
+    """上限弹窗晚于按钮状态变化出现时，驱动应在第 daily_limit 人之后识别上限并停止"""
+    daily_limit = 3
+    config = FakeSiteConfig(
+        card_total=args.cards,
+        api_latency_ms=0,
+        detail_latency_ms=0,
+        daily_limit=daily_limit,
+        limit_dialog_delay_ms=args.limit_dialog_delay_ms,
+        show_download_popup=False,
+        decoy_assets=False,
+    )
+    with FakeSite(config) as site, tempfile.TemporaryDirectory() as tmp:
+        driver = make_headless_driver(args.browser, headless=not args.headed)
+        boos = BoosDriver(
+            logger=logging.getLogger("bench_greet"),
+            driver=driver,
+            base_url=site.url,
+            pacing=PACING_PROFILES[args.pacing],
+            processed_store=ProcessedStore(os.path.join(tmp, "processed.db")),
+        )
+        try:
+            open_recommend_page(boos)
+            boos._run_greet_loop(daily_limit + 5)
+        finally:
+            boos.close()
+        greets = boos.phases.counters.get("greeted", 0)
+        detected = boos.funnel.limit_hit.value > 0
+        return {
+            "daily_limit": daily_limit,
+            "limit_dialog_delay_ms": args.limit_dialog_delay_ms,
+            "greets": greets,
+            "limit_detected": detected,
+            "ok": detected and greets == daily_limit,
+        }
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> list[str]:
+    """与基线比较，返回超过阈值的回退项说明"""
+    regressions = []
+    for name, higher_better in HIGHER_IS_BETTER.items():
+        new, old = result["metrics"].get(name), baseline.get("metrics", {}).get(name)
+        if not new or not old:
+            continue
+        change = (new - old) / old
+        if (higher_better and change < -threshold) or (not higher_better and change > threshold):
+            regressions.append(f"{name}: {old} -> {new} ({change:+.1%})")
+
+    for phase, stats in result["phases"].items():
+        old = baseline.get("phases", {}).get(phase, {}).get("p95_ms")
+        if old and stats["p95_ms"] > old * (1 + threshold) and stats["p95_ms"] - old >= MIN_PHASE_DELTA_MS:
+            regressions.append(f"{phase}.p95_ms: {old} -> {stats['p95_ms']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="打招呼流程端到端吞吐基准")
+    parser.add_argument("--greets", type=int, default=20)
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--detail-latency-ms", type=int, default=300)
+    parser.add_argument("--pacing", choices=sorted(PACING_PROFILES), default="none")
+    parser.add_argument("--browser", choices=["edge", "chrome"], default="edge")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.15, help="允许的回退比例")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--limit-dialog-delay-ms", type=int, default=300, help="上限场景中弹窗晚于按钮变化的毫秒数")
+    parser.add_argument("--skip-limit-case", action="store_true", help="不运行上限场景")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run_benchmark(args)
+    if not args.skip_limit_case:
+        result["limit_case"] = run_limit_case(args)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(json.dumps(result["metrics"], ensure_ascii=False, indent=2))
+    for phase, stats in result["phases"].items():
+        print(f"  {phase:<8} n={stats['count']:<5} p50={stats['p50_ms']:>8.1f}ms p95={stats['p95_ms']:>8.1f}ms")
+
+    limit_case = result.get("limit_case")
+    if limit_case is not None:
+        print(f"上限场景（弹窗延迟 {limit_case['limit_dialog_delay_ms']}ms）：打招呼 {limit_case['greets']} 人，"
+              f"{'已' if limit_case['limit_detected'] else '未'}识别上限")
+        if not limit_case["ok"]:
+            print("上限场景失败：驱动没有在达到每日上限后停止")
+            sys.exit(1)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"已保存基线：{args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"未找到基线文件 {args.baseline}，无法做回退检查（可使用 --save-baseline 生成）")
+        sys.exit(1)
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if not all(baseline.get("metrics", {}).get(name) for name in HIGHER_IS_BETTER):
+        # 缺少指标时无法判断是否回退，不能当作通过
+        print(f"基线缺少指标，无法做回退检查（在参考机器上使用 --save-baseline 刷新 {args.baseline}）")
+        sys.exit(1)
+    if baseline.get("config") != result["config"]:
+        print(f"提示：本次参数与基线不同，比较结果仅供参考\n  基线：{baseline.get('config')}\n  本次：{result['config']}")
+    regressions = compare(result, baseline, args.threshold)
+    if regressions:
+        print("性能回退：")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print("与基线相比无明显回退")
+
+
+if __name__ == "__main__":
+    main()
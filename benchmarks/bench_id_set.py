@@ -0,0 +1,91 @@
+"""已评估卡片去重集合微基准：Python set 与 CompactIdSet（有无 Bloom 过滤器）的对比。
+
+对每种实现记录：
+- 每个 ID 的内存占用（set 计入 geekid 字符串本身，CompactIdSet 只保存哈希）；
+- 命中 / 未命中两种查询的平均耗时（ns）；
+- 查询过程中 tracemalloc 记录的内存峰值（应接近 0，即查询不分配内存）。
+
+用法：
+    python -m benchmarks.bench_id_set [--sizes 10000 100000 500000] [--lookups 200000]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from common.compact_id_set import CompactIdSet
+
+
+def make_ids(count: int, seed: int) -> list[str]:
+    """生成与 data-geekid 形态相近的长字符串 ID"""
+    rnd = random.Random(seed)
+    return [f"{rnd.getrandbits(128):032x}{rnd.getrandbits(32):08x}~~" for _ in range(count)]
+
+
+def set_nbytes(ids: set[str]) -> int:
+    return sys.getsizeof(ids) + sum(sys.getsizeof(i) for i in ids)
+
+
+def count_hits(container, probes: list[str]) -> int:
+    hits = 0
+    for probe in probes:
+        if probe in container:
+            hits += 1
+    return hits
+
+
+def bench_lookups(container, probes: list[str]) -> tuple[float, int, int]:
+    """返回 (每次查询 ns, 命中数, 查询期间内存峰值字节)；计时与内存跟踪分开进行"""
+    start = time.perf_counter()
+    hits = count_hits(container, probes)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    count_hits(container, probes)
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return elapsed / len(probes) * 1e9, hits, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--bloom-bits-per-id", type=int, default=10)
+    args = parser.parse_args()
+
+    print(
+        f"{'ID 数':>8} {'实现':<14} {'字节/ID':>9} {'命中(ns)':>10} {'未命中(ns)':>11} {'查询峰值(B)':>12}"
+    )
+    for size in args.sizes:
+        ids = make_ids(size, seed=size)
+        rnd = random.Random(0)
+        hit_probes = [rnd.choice(ids) for _ in range(args.lookups)]
+        miss_probes = make_ids(args.lookups, seed=size + 1)
+
+        plain = set(ids)
+        compact = CompactIdSet(max_items=size)
+        compact.update(ids)
+        bloom = CompactIdSet(max_items=size, bloom_bits=size * args.bloom_bits_per_id)
+        bloom.update(ids)
+
+        rows = [
+            ("set", plain, set_nbytes(plain) / size),
+            ("compact", compact, compact.bytes_per_id()),
+            ("compact+bloom", bloom, bloom.bytes_per_id()),
+        ]
+        for name, container, per_id in rows:
+            hit_ns, hits, hit_peak = bench_lookups(container, hit_probes)
+            miss_ns, misses, miss_peak = bench_lookups(container, miss_probes)
+            assert hits == len(hit_probes), f"{name} 漏判"
+            print(
+                f"{size:>8} {name:<14} {per_id:>9.1f} {hit_ns:>10.0f} {miss_ns:>11.0f} "
+                f"{max(hit_peak, miss_peak):>12}  误判 {misses}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""GUI 冷启动基准：导入耗时表 + 首帧绘制时间。
+
+1. 用 `python -X importtime -c "import gui_main"` 统计导入耗时，按累计耗时列出最重的顶层包，
+   并检查 selenium 等重依赖是否仍在启动路径上；
+2. 在子进程中（QT_QPA_PLATFORM=offscreen）创建 MainWindow 并显示，记录从进程启动到
+   主窗口第一次绘制的耗时。
+首帧绘制超过 --target-ms、导入耗时超过 --import-target-ms（--skip-paint 时同样检查）
+或重依赖出现在启动路径上，均视为回退（退出码 1）。
+
+测量报告随代码提交在 benchmarks/baselines/import_time.json；启动路径有改动时用
+--save-report 在参考机器上重新生成并一起提交。
+
+用法：
+    python -m benchmarks.bench_import_time --runs 3 --target-ms 1500
+    python -m benchmarks.bench_import_time --runs 5 --save-report
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join("bench_results", "import_time.json")
+DEFAULT_REPORT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "import_time.json")
+DEFAULT_TARGET_MS = 1500
+DEFAULT_IMPORT_TARGET_MS = 500
+# 不应出现在首帧之前的重依赖
+DEFERRED_MODULES = ("selenium", "requests", "core.boos_driver")
+
+FIRST_PAINT_SCRIPT = r"""
+import json, sys, time
+import gui_main
+from PySide6 import QtCore, QtWidgets
+
+app = QtWidgets.QApplication(sys.argv)
+window = gui_main.MainWindow()
+
+
+class PaintProbe(QtCore.QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            obj.removeEventFilter(self)
+            print(json.dumps({
+                "paint_epoch": time.time(),
+                "loaded_before_paint": [m for m in sys.argv[1:] if m in sys.modules],
+            }), flush=True)
+            QtCore.QTimer.singleShot(0, app.quit)
+        return False
+
+
+probe = PaintProbe()
+window.installEventFilter(probe)
+window.show()
+app.exec()
+"""
+
+
+def child_env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """解析 -X importtime 输出：每行 `import time: self | cumulative | 缩进+模块名`"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        raw_name = parts[2].rstrip()
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        rows.append({
+            "module": raw_name.strip(),
+            "self_us": int(parts[0]),
+            "cumulative_us": int(parts[1]),
+            "depth": depth,
+        })
+    return rows
+
+
+def import_report(module: str, top: int) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=tempfile.gettempdir(), env=child_env(), capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败：\n{proc.stderr[-2000:]}")
+    rows = parse_importtime(proc.stderr)
+    roots = [r for r in rows if r["depth"] == 0]
+    target = next((r for r in reversed(roots) if r["module"] == module), None)
+    loaded = {r["module"] for r in rows}
+    return {
+        "module": module,
+        "total_ms": round((target or {"cumulative_us": 0})["cumulative_us"] / 1000, 1),
+        "modules": len(rows),
+        "deferred_loaded": [m for m in DEFERRED_MODULES if m in loaded],
+        "top": [
+            {"module": r["module"], "cumulative_ms": round(r["cumulative_us"] / 1000, 1), "self_ms": round(r["self_us"] / 1000, 1)}
+            # 顶层导入及其直接依赖，便于看出是哪个包拖慢了启动
+            for r in sorted((r for r in rows if r["depth"] <= 1), key=lambda r: -r["cumulative_us"])[:top]
+        ],
+    }
+
+
+def first_paint_once() -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        # 在临时目录中运行，日志文件等不会写进仓库
+        start = time.time()
+        proc = subprocess.run(
+            [sys.executable, "-c", FIRST_PAINT_SCRIPT, *DEFERRED_MODULES],
+            cwd=tmp, env=child_env(), capture_output=True, text=True, timeout=60,
+        )
+    lines = [line for line in proc.stdout.splitlines() if line.startswith("{")]
+    if not lines:
+        raise RuntimeError(f"未检测到首帧绘制：\n{proc.stderr[-2000:]}")
+    result = json.loads(lines[0])
+    return {
+        "first_paint_ms": round((result["paint_epoch"] - start) * 1000, 1),
+        "loaded_before_paint": result["loaded_before_paint"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI 冷启动：导入耗时与首帧绘制时间")
+    parser.add_argument("--module", default="gui_main")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS, help="首帧绘制目标耗时")
+    parser.add_argument("--import-target-ms", type=float, default=DEFAULT_IMPORT_TARGET_MS, help="导入耗时目标")
+    parser.add_argument("--skip-paint", action="store_true", help="只统计导入耗时（无 Qt 环境时）")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    parser.add_argument("--save-report", action="store_true", help=f"同时写入提交到仓库的测量报告 {DEFAULT_REPORT}")
+    args = parser.parse_args()
+
+    report = import_report(args.module, args.top)
+    print(f"import {report['module']}: {report['total_ms']} ms，共 {report['modules']} 个模块")
+    print(f"{'模块':<36}{'累计(ms)':>12}{'自身(ms)':>12}")
+    for row in report["top"]:
+        print(f"{row['module']:<36}{row['cumulative_ms']:>12.1f}{row['self_ms']:>12.1f}")
+
+    result = {
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "qt_platform": child_env()["QT_QPA_PLATFORM"]},
+        "imports": report,
+        "target_ms": args.target_ms,
+        "import_target_ms": args.import_target_ms,
+    }
+    failures = []
+    if report["total_ms"] > args.import_target_ms:
+        failures.append(f"导入 {report['module']} {report['total_ms']:.1f} ms 超过目标 {args.import_target_ms:.0f} ms")
+    if report["deferred_loaded"]:
+        failures.append(f"启动路径上仍导入了：{', '.join(report['deferred_loaded'])}")
+
+    if not args.skip_paint:
+        runs = [first_paint_once() for _ in range(args.runs)]
+        first_paint = statistics.median(r["first_paint_ms"] for r in runs)
+        result["first_paint"] = {"median_ms": first_paint, "runs": runs}
+        print(f"首帧绘制：中位数 {first_paint:.1f} ms（目标 {args.target_ms:.0f} ms）")
+        if first_paint > args.target_ms:
+            failures.append(f"首帧绘制 {first_paint:.1f} ms 超过目标 {args.target_ms:.0f} ms")
+        for r in runs:
+            if r["loaded_before_paint"]:
+                failures.append(f"首帧前已加载：{', '.join(r['loaded_before_paint'])}")
+                break
+
+    result["passed"] = not failures
+    outputs = [args.out] + ([DEFAULT_REPORT] if args.save_report else [])
+    for path in outputs:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if failures:
+        print("未达标：")
+        for line in failures:
+            print(f"  - {line}")
+        sys.exit(1)
+    print("达标")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""关键词匹配微基准：`any(kw in text ...)` 与 KeywordMatcher 的对比。
+
+两组关键词分别测量，精简与自动机的效果分列：
+- synonyms：在默认关键词上加前缀/后缀/城市生成的同义词，几乎全部能被精简回默认关键词，
+  加速主要来自“剔除冗余关键词”，精简后数量低于阈值时 matches 根本不走自动机；
+- distinct：互不包含的随机关键词，精简不起作用，用来测量自动机本身的效果。
+每组列出：原始列表逐个 in、精简后逐个 in（只有精简的效果）、强制自动机（精简后 / 不精简）、
+以及 matches 实际走的路径与耗时。
+
+用法：
+    python -m benchmarks.bench_keyword_matcher [--sizes 57 500 2000 5000] [--texts 2000]
+"""
+
+import argparse
+import random
+import time
+
+from core.boos_driver import DEFAULT_TARGET_KEYWORDS
+from core.keyword_matcher import KeywordMatcher
+
+PREFIXES = ["", "急招", "高薪", "日结", "长期", "夜班", "白班", "包吃住", "周结", "五险"]
+SUFFIXES = ["", "兼职", "全职", "学徒", "主管", "组长", "助理", "师傅", "储备", "专员"]
+CITIES = ["", "北京", "上海", "广州", "深圳", "杭州", "成都", "武汉", "西安", "南京", "苏州"]
+FILLER = "本科 3年经验 期望薪资 8-12K 离职-随时到岗 沟通能力强 吃苦耐劳 有驾照 熟悉办公软件 "
+
+
+def expand_keywords(base: list[str], size: int) -> list[str]:
+    """用前缀/后缀/城市组合生成同义词，直到达到目标数量"""
+    result = list(base)
+    seen = set(result)
+    for city in CITIES:
+        for prefix in PREFIXES:
+            for suffix in SUFFIXES:
+                for kw in base:
+                    if len(result) >= size:
+                        return result
+                    word = f"{city}{prefix}{kw}{suffix}"
+                    if word not in seen:
+                        seen.add(word)
+                        result.append(word)
+    return result
+
+
+def distinct_keywords(size: int, seed: int = 1) -> list[str]:
+    """生成 size 个互不包含的 2~4 字关键词（不会被精简）"""
+    chars = "".join(dict.fromkeys("".join(DEFAULT_TARGET_KEYWORDS + CITIES + PREFIXES + SUFFIXES)))
+    rnd = random.Random(seed)
+    result: list[str] = []
+    while len(result) < size:
+        word = "".join(rnd.choice(chars) for _ in range(rnd.randint(2, 4)))
+        if not any(word in kw or kw in word for kw in result):
+            result.append(word)
+    return result
+
+
+def make_texts(base: list[str], count: int, hit_ratio: float = 0.3) -> list[str]:
+    rnd = random.Random(42)
+    texts = []
+    for i in range(count):
+        text = FILLER * rnd.randint(1, 3)
+        if rnd.random() < hit_ratio:
+            pos = rnd.randint(0, len(text))
+            text = text[:pos] + rnd.choice(base) + text[pos:]
+        texts.append(f"牛人{i} {text}")
+    return texts
+
+
+def bench(fn, texts: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    hits = sum(1 for t in texts if fn(t))
+    return time.perf_counter() - start, hits
+
+
+def run_family(name: str, keywords_for, sizes: list[int], texts_for) -> None:
+    print(f"\n[{name}]")
+    print(
+        f"{'关键词数':>8} {'精简后':>8} {'原始in(ms)':>12} {'精简in(ms)':>12} "
+        f"{'自动机(ms)':>12} {'自动机不精简(ms)':>16} {'matches(ms)':>12} {'路径':>6}"
+    )
+    for size in sizes:
+        keywords = keywords_for(size)
+        texts = texts_for(keywords)
+        matcher = KeywordMatcher(keywords)
+        pruned = list(matcher.keywords)
+
+        raw_s, raw_hits = bench(lambda t: any(kw in t for kw in keywords), texts)
+        pruned_s, pruned_hits = bench(lambda t: any(kw in t for kw in pruned), texts)
+        ac_s, ac_hits = bench(KeywordMatcher(keywords, small_set_threshold=0).matches, texts)
+        full_s, full_hits = bench(
+            KeywordMatcher(keywords, prune_redundant=False, small_set_threshold=0).matches, texts
+        )
+        actual_s, actual_hits = bench(matcher.matches, texts)
+        assert raw_hits == pruned_hits == ac_hits == full_hits == actual_hits, "匹配结果不一致"
+
+        print(
+            f"{len(keywords):>8} {len(pruned):>8} {raw_s * 1000:>12.1f} {pruned_s * 1000:>12.1f} "
+            f"{ac_s * 1000:>12.1f} {full_s * 1000:>16.1f} {actual_s * 1000:>12.1f} "
+            f"{'自动机' if matcher.uses_automaton else 'in':>6}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[57, 500, 2000, 5000])
+    parser.add_argument("--texts", type=int, default=2000)
+    args = parser.parse_args()
+
+    base = DEFAULT_TARGET_KEYWORDS
+    base_texts = make_texts(base, args.texts)
+    run_family("synonyms", lambda size: expand_keywords(base, size), args.sizes, lambda _: base_texts)
+    run_family(
+        "distinct",
+        distinct_keywords,
+        args.sizes,
+        lambda keywords: make_texts(keywords, args.texts),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""长时间运行基准：页面回收对浏览器内存与扫描耗时的影响。
+
+在本地替身站点（无限列表）上持续运行打招呼流程，分别以
+不回收（none）、删除已处理卡片（prune）、重新加载列表（reload）三种方式各跑一段时间，
+按固定间隔记录：DOM 中的卡片数、JS 堆大小、浏览器进程树 RSS（仅 Linux）、
+该间隔内单次扫描与单次打招呼的 p50/p95 耗时。
+同时核对点击是否打中目标：替身站点收到打招呼请求的牛人必须都是驱动当时要点击的牛人，
+且同一人不应被打招呼两次（回收删除卡片后按过期下标点错卡片会在这里暴露），出现异常时退出码为 1。
+
+用法：
+    python -m benchmarks.bench_marathon --minutes 120 --interval 60
+    python -m benchmarks.bench_marathon --modes none prune --minutes 10 --interval 15
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_page_load import process_tree_rss_mb
+from benchmarks.browser import make_headless_driver, open_recommend_page
+from benchmarks.fake_site import FakeSite, FakeSiteConfig
+from common.processed_store import ProcessedStore
+from core import selectors
+from core.boos_driver import BoosDriver
+from core.pacing import PACING_PROFILES
+from core.page_recycler import PAGE_STATS_JS, RecyclePolicy
+from core.phase_timer import percentile
+
+DEFAULT_OUTPUT = os.path.join("bench_results", "marathon.json")
+MODES = ("none", "prune", "reload")
+
+
+class MarathonFinished(Exception):
+    """达到设定时长，结束本轮运行"""
+
+
+class MarathonDriver(BoosDriver):
+    """在每次扫描前（页面回收检查处）按间隔采样，到时后结束打招呼循环"""
+
+    def __init__(self, *args, minutes: float, interval: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.samples: list[dict] = []
+        self._start = time.monotonic()
+        self._deadline = self._start + minutes * 60
+        self._interval = interval
+        self._next_sample = self._start + interval
+        self._scan_mark = 0
+        self._greet_mark = 0
+        # 每次打开详情页前要点击的牛人
+        self.targets: list[str | None] = []
+        self._target: str | None = None
+
+    def _recycle_page_if_due(self, frame, cursor, job) -> bool:
+        now = time.monotonic()
+        if now >= self._next_sample:
+            self._next_sample = now + self._interval
+            self.sample(frame)
+        if now >= self._deadline:
+            raise MarathonFinished()
+        return super()._recycle_page_if_due(frame, cursor, job)
+
+    def _locate_card(self, snapshot):
+        self._target = snapshot.geekid
+        return super()._locate_card(snapshot)
+
+    def _perform_detail_actions(self):
+        self.targets.append(self._target)
+        return super()._perform_detail_actions()
+
+    def _interval_latency(self, phase: str, mark: str) -> dict:
+        values = self.phases.samples.get(phase, [])
+        fresh = values[getattr(self, mark):]
+        setattr(self, mark, len(values))
+        return {
+            "count": len(fresh),
+            "p50_ms": round(percentile(fresh, 50) * 1000, 1),
+            "p95_ms": round(percentile(fresh, 95) * 1000, 1),
+        }
+
+    def sample(self, frame):
+        try:
+            self._switch_to_card_frame(frame)
+            stats = self.driver.execute_script(PAGE_STATS_JS, selectors.CARD_SELECTOR_CANDIDATES) or {}
+        except Exception:
+            stats = {}
+        heap = stats.get("heap_bytes")
+        self.samples.append({
+            "elapsed_min": round((time.monotonic() - self._start) / 60, 2),
+            "dom_cards": stats.get("cards"),
+            "heap_mb": None if heap is None else round(heap / (1024 * 1024), 1),
+            "rss_mb": process_tree_rss_mb(self.driver.service.process.pid),
+            "greeted": self.phases.counters.get("greeted", 0),
+            "scan": self._interval_latency("scan", "_scan_mark"),
+            "greet": self._interval_latency("detail", "_greet_mark"),
+        })
+        last = self.samples[-1]
+        print(f"  {last['elapsed_min']:>7.1f}min 卡片={last['dom_cards']} 堆={last['heap_mb']}MB "
+              f"RSS={last['rss_mb']}MB 扫描p50={last['scan']['p50_ms']}ms", flush=True)
+
+
+def make_policy(mode: str, args) -> RecyclePolicy:
+    if mode == "none":
+        return RecyclePolicy.off()
+    return RecyclePolicy(
+        max_cards=args.max_cards,
+        max_heap_mb=args.max_heap_mb,
+        max_age_s=args.max_age_min * 60,
+        mode=mode,
+    )
+
+
+def run_mode(args, site: FakeSite, tmp: str, mode: str) -> dict:
+    print(f"[{mode}] 运行 {args.minutes} 分钟...", flush=True)
+    driver = make_headless_driver(args.browser, headless=not args.headed)
+    boos = MarathonDriver(
+        logger=logging.getLogger("bench_marathon"),
+        driver=driver,
+        base_url=site.url,
+        pacing=PACING_PROFILES[args.pacing],
+        processed_store=ProcessedStore(os.path.join(tmp, f"processed-{mode}.db")),
+        recycle_policy=make_policy(mode, args),
+        minutes=args.minutes,
+        interval=args.interval,
+    )
+    greeted_before = len(site.state.greeted)
+    try:
+        open_recommend_page(boos)
+        try:
+            boos._run_greet_loop(10 ** 9)
+        except MarathonFinished:
+            pass
+    finally:
+        boos.close()
+
+    samples = boos.samples
+    site_greeted = site.state.greeted[greeted_before:]
+    targets = set(boos.targets)
+    return {
+        "samples": samples,
+        "final": samples[-1] if samples else None,
+        "recycler": boos.page_recycler.stats(),
+        "greeted": boos.phases.counters.get("greeted", 0),
+        "mistargeted": sorted(g for g in set(site_greeted) if g not in targets),
+        "duplicate_greets": len(site_greeted) - len(set(site_greeted)),
+    }
+
+
+def run_benchmark(args) -> dict:
+    config = FakeSiteConfig(
+        card_total=0,
+        api_latency_ms=args.latency_ms,
+        detail_latency_ms=args.detail_latency_ms,
+        show_download_popup=False,
+    )
+    results = {}
+    with FakeSite(config) as site, tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            results[mode] = run_mode(args, site, tmp, mode)
+    return {
+        "config": {
+            "minutes": args.minutes,
+            "interval_s": args.interval,
+            "max_cards": args.max_cards,
+            "max_heap_mb": args.max_heap_mb,
+            "max_age_min": args.max_age_min,
+            "browser": args.browser,
+        },
+        "modes": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="长时间运行下页面回收策略的内存与扫描耗时对比")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--minutes", type=float, default=120, help="每种方式的运行时长")
+    parser.add_argument("--interval", type=float, default=60, help="采样间隔秒数")
+    parser.add_argument("--max-cards", type=int, default=600)
+    parser.add_argument("--max-heap-mb", type=float, default=512)
+    parser.add_argument("--max-age-min", type=float, default=30)
+    parser.add_argument("--latency-ms", type=int, default=50)
+    parser.add_argument("--detail-latency-ms", type=int, default=100)
+    parser.add_argument("--pacing", choices=sorted(PACING_PROFILES), default="none")
+    parser.add_argument("--browser", choices=["edge", "chrome"], default="edge")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run_benchmark(args)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"{'方式':<8}{'打招呼':>8}{'卡片':>8}{'堆(MB)':>10}{'RSS(MB)':>10}{'扫描p95(ms)':>14}")
+    for mode, data in result["modes"].items():
+        final = data["final"] or {}
+        print(f"{mode:<8}{data['greeted']:>8}{str(final.get('dom_cards')):>8}{str(final.get('heap_mb')):>10}"
+              f"{str(final.get('rss_mb')):>10}{str(final.get('scan', {}).get('p95_ms')):>14}")
+
+    failed = False
+    for mode, data in result["modes"].items():
+        if data["mistargeted"] or data["duplicate_greets"]:
+            failed = True
+            print(f"[{mode}] 点击未打中目标：{len(data['mistargeted'])} 人，重复打招呼：{data['duplicate_greets']} 次")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""精简加载模式对比：普通加载 vs eager 加载策略 + 头像与统计拦截。
+
+在本地替身站点（带头像图片、字体、统计脚本等诱饵资源，其中字体在精简模式下照常加载）上分别测量：
+- 登录页二维码能否正常显示（精简模式不能误拦二维码）；
+- 首页 driver.get 返回耗时、进入推荐牛人页到首屏卡片出现的耗时；
+- 站点发出的字节数与请求数（即浏览器实际下载量）；
+- 浏览器进程树的常驻内存（仅 Linux，读取 /proc；其他平台为 null）。
+
+用法：
+    python -m benchmarks.bench_page_load --runs 3 --scrolls 3
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks.browser import make_headless_driver
+from benchmarks.fake_site import SESSION_COOKIE, FakeSite, FakeSiteConfig
+from common.processed_store import ProcessedStore
+from core import selectors
+from core.boos_driver import BoosDriver
+
+DEFAULT_OUTPUT = os.path.join("bench_results", "page_load.json")
+MODES = {"normal": False, "lean": True}
+
+
+def process_tree_rss_mb(root_pid: int) -> float | None:
+    """root_pid 及其全部子孙进程的 RSS 之和（MB）；非 Linux 返回 None"""
+    if not os.path.isdir("/proc"):
+        return None
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # comm 字段可能含空格，从最后一个 ')' 之后再切分
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    total_kb, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return round(total_kb / 1024, 1)
+
+
+def qr_loaded(driver) -> bool:
+    return bool(driver.execute_script(
+        "const img = document.querySelector(arguments[0]);"
+        "return !!img && img.complete && img.naturalWidth > 0;",
+        selectors.QRCODE_IMG_CSS,
+    ))
+
+
+def run_once(args, site: FakeSite, tmp: str, lean: bool) -> dict:
+    driver = make_headless_driver(args.browser, headless=not args.headed, lean=lean)
+    boos = BoosDriver(
+        logger=logging.getLogger("bench_page_load"),
+        driver=driver,
+        base_url=site.url,
+        processed_store=ProcessedStore(os.path.join(tmp, f"processed-{time.monotonic_ns()}.db")),
+    )
+    try:
+        before = site.stats()
+
+        # 登录页：确认二维码没有被拦截
+        driver.get(site.url)
+        boos._click_login_if_present(timeout_seconds=3)
+        boos._click_app_scan_login()
+        boos._get_qrcode()
+        try:
+            qr_ok = WebDriverWait(driver, 5).until(qr_loaded)
+        except TimeoutException:
+            qr_ok = False
+
+        # 登录后首页与推荐牛人页
+        driver.add_cookie({"name": SESSION_COOKIE, "value": "1", "path": "/"})
+        start = time.perf_counter()
+        driver.get(site.url)
+        load_s = time.perf_counter() - start
+        boos._click_recommend_talents()
+        frame = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS))
+        )
+        driver.switch_to.frame(frame)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selectors.CARD_SELECTOR_CANDIDATES[0]))
+        )
+        ready_s = time.perf_counter() - start
+        driver.switch_to.default_content()
+
+        for _ in range(args.scrolls):
+            boos._scroll_down_list()
+        # 给异步的图片 / 统计请求一点时间落地
+        time.sleep(args.settle)
+
+        after = site.stats()
+        rss = process_tree_rss_mb(driver.service.process.pid)
+    finally:
+        boos.close()
+
+    return {
+        "qr_ok": bool(qr_ok),
+        "load_ms": load_s * 1000,
+        "ready_ms": ready_s * 1000,
+        "bytes": after["bytes_sent"] - before["bytes_sent"],
+        "requests": after["requests"] - before["requests"],
+        "rss_mb": rss,
+    }
+
+
+def summarize(runs: list[dict]) -> dict:
+    summary = {"qr_ok": all(r["qr_ok"] for r in runs)}
+    for key in ("load_ms", "ready_ms", "bytes", "requests", "rss_mb"):
+        values = [r[key] for r in runs if r[key] is not None]
+        summary[key] = round(statistics.median(values), 1) if values else None
+    return summary
+
+
+def savings(normal: dict, lean: dict) -> dict:
+    result = {}
+    for key in ("load_ms", "ready_ms", "bytes", "requests", "rss_mb"):
+        if normal[key] and lean[key] is not None:
+            result[key] = f"{(normal[key] - lean[key]) / normal[key]:+.1%}"
+    return result
+
+
+def run_benchmark(args) -> dict:
+    config = FakeSiteConfig(api_latency_ms=args.latency_ms, show_download_popup=False, decoy_assets=True)
+    results = {}
+    with FakeSite(config) as site, tempfile.TemporaryDirectory() as tmp:
+        for mode, lean in MODES.items():
+            results[mode] = summarize([run_once(args, site, tmp, lean) for _ in range(args.runs)])
+    results["savings"] = savings(results["normal"], results["lean"])
+    results["config"] = {"runs": args.runs, "scrolls": args.scrolls, "browser": args.browser}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="普通加载与精简加载模式的对比")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--scrolls", type=int, default=3, help="进入列表后滚动加载的次数")
+    parser.add_argument("--settle", type=float, default=1.0, help="统计前等待异步请求完成的秒数")
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--browser", choices=["edge", "chrome"], default="edge")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run_benchmark(args)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"{'指标':<12}{'普通':>14}{'精简':>14}{'节省':>10}")
+    for key in ("load_ms", "ready_ms", "bytes", "requests", "rss_mb"):
+        print(f"{key:<12}{str(result['normal'][key]):>14}{str(result['lean'][key]):>14}{result['savings'].get(key, '-'):>10}")
+    print(f"二维码正常显示：普通 {result['normal']['qr_ok']}，精简 {result['lean']['qr_ok']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""基于页面快照的离线回归与基准：选择器检查 + 真实页面规模下的扫描 / 匹配耗时。
+
+对每个快照（core.dom_capture 在真实会话中保存，经 benchmarks.replay_site 回放）：
+1. 选择器检查：按快照类型检查 core/selectors.py 中的选择器与绝对 XPath 是否仍能命中元素
+   （在主文档和各 iframe 中查找），网站改版导致失效时一眼可见；
+2. 推荐列表快照：用 BoosDriver 的真实扫描代码读取卡片快照，记录卡片数、扫描耗时中位数、
+   返回数据量、关键词命中数与打分后的候选人数。
+
+没有真实快照时可用 --record-fake 先从替身站点采集一组，验证采集与回放流程本身。
+
+用法：
+    python -m benchmarks.bench_replay captures/ [--strict]
+    python -m benchmarks.bench_replay --record-fake captures-fake/ --cards 300
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.browser import make_headless_driver, open_recommend_page
+from benchmarks.fake_site import FakeSite, FakeSiteConfig
+from benchmarks.replay_site import ReplaySite
+from common.processed_store import ProcessedStore
+from core import selectors
+from core.boos_driver import BoosDriver
+from core.card_locator import CardLocator
+from core.card_snapshot import SNAPSHOT_CARDS_JS
+from core.dom_capture import DomRecorder
+
+DEFAULT_OUTPUT = os.path.join("bench_results", "replay.json")
+
+# 快照类型 -> [(检查名, 候选定位方式)]；任一候选命中即通过
+SELECTOR_CHECKS = {
+    "recommend": [
+        ("RECOMMEND_TALENTS_SELECTORS", selectors.RECOMMEND_TALENTS_SELECTORS),
+        ("RECOMMEND_FRAME_CSS", [("css", selectors.RECOMMEND_FRAME_CSS)]),
+        ("CARD_SELECTOR_CANDIDATES", [("css", css) for css in selectors.CARD_SELECTOR_CANDIDATES]),
+        ("JOB_DROPDOWN_LABEL_CSS", [("css", selectors.JOB_DROPDOWN_LABEL_CSS)]),
+        ("JOB_ITEM_CSS", [("css", selectors.JOB_ITEM_CSS)]),
+    ],
+    "detail": [
+        ("DETAIL_GREET_BUTTON_XPATH", [("xpath", selectors.DETAIL_GREET_BUTTON_XPATH)]),
+        ("DETAIL_GREET_BUTTON_CSS", [("css", selectors.DETAIL_GREET_BUTTON_CSS)]),
+        ("DETAIL_CLOSE_XPATH", [("xpath", selectors.DETAIL_CLOSE_XPATH)]),
+        ("DETAIL_CLOSE_CSS", [("css", selectors.DETAIL_CLOSE_CSS)]),
+    ],
+    "download_popup": [
+        ("DOWNLOAD_LINK_XPATH", [("xpath", selectors.DOWNLOAD_LINK_XPATH)]),
+        ("DOWNLOAD_CLOSE_ICON_XPATH", [("xpath", selectors.DOWNLOAD_CLOSE_ICON_XPATH)]),
+        ("DOWNLOAD_CLOSE_ICON_CSS", [("css", selectors.DOWNLOAD_CLOSE_ICON_CSS)]),
+    ],
+    "limit_dialog": [
+        ("LIMIT_DIALOG_XPATH", [("xpath", selectors.LIMIT_DIALOG_XPATH)]),
+        ("LIMIT_DIALOG_CLOSE_XPATH", [("xpath", selectors.LIMIT_DIALOG_CLOSE_XPATH)]),
+    ],
+}
+
+
+def make_boos(args, base_url: str, tmp: str, name: str, recorder: DomRecorder | None = None) -> BoosDriver:
+    driver = make_headless_driver(args.browser, headless=not args.headed)
+    return BoosDriver(
+        logger=logging.getLogger("bench_replay"),
+        driver=driver,
+        base_url=base_url,
+        processed_store=ProcessedStore(os.path.join(tmp, f"{name}.db")),
+        dom_recorder=recorder,
+    )
+
+
+def count_matches(driver, locators) -> int:
+    """在主文档及各 iframe 中统计候选定位方式命中的元素数（第一个命中的候选为准）"""
+    driver.switch_to.default_content()
+    contexts = [None] + driver.find_elements(By.TAG_NAME, "iframe")
+    for kind, value in locators:
+        by = By.XPATH if kind == "xpath" else By.CSS_SELECTOR
+        total = 0
+        for frame in contexts:
+            try:
+                driver.switch_to.default_content()
+                if frame is not None:
+                    driver.switch_to.frame(frame)
+                total += len(driver.find_elements(by, value))
+            except Exception:
+                continue
+        if total:
+            driver.switch_to.default_content()
+            return total
+    driver.switch_to.default_content()
+    return 0
+
+
+def bench_scan(boos: BoosDriver, repeats: int) -> dict:
+    """用真实扫描代码读取整页卡片快照，并做关键词匹配与打分"""
+    durations, cards, frame = [], [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        frame, cards = boos._snapshot_cards_any_frame()
+        durations.append(time.perf_counter() - start)
+    payload = 0
+    if cards:
+        boos._switch_to_card_frame(frame)
+        raw = boos.driver.execute_script(SNAPSHOT_CARDS_JS, selectors.CARD_SELECTOR_CANDIDATES, 0, None)
+        payload = len(json.dumps(raw, ensure_ascii=False).encode("utf-8"))
+    matcher = boos.keyword_matcher
+    return {
+        "cards": len(cards),
+        "visible": sum(1 for c in cards if c.visible),
+        "online": sum(1 for c in cards if c.online),
+        "keyword_matched": sum(1 for c in cards if matcher.matches(c.text)),
+        "ranked": len(boos.candidate_scorer.rank(cards)),
+        # 第一次包含定位探测，单独列出
+        "first_scan_ms": round(durations[0] * 1000, 2),
+        "scan_ms": round(statistics.median(durations[1:] or durations) * 1000, 2),
+        "payload_bytes": payload,
+    }
+
+
+def replay_fixtures(args, tmp: str) -> list[dict]:
+    rows = []
+    with ReplaySite(args.path) as site:
+        if not site.fixtures:
+            return rows
+        boos = make_boos(args, site.url, tmp, "replay")
+        try:
+            for name, fixture in site.fixtures.items():
+                boos.driver.get(site.fixture_url(name))
+                # 每个快照是新文档，上一个快照缓存的 iframe 位置已失效
+                boos.card_locator = CardLocator()
+                checks = {
+                    check: count_matches(boos.driver, locators)
+                    for check, locators in SELECTOR_CHECKS.get(fixture.kind, [])
+                }
+                row = {
+                    "name": name,
+                    "kind": fixture.kind,
+                    "redacted": fixture.redacted,
+                    "bytes": fixture.nbytes,
+                    "checks": checks,
+                    "failed": [check for check, count in checks.items() if not count],
+                }
+                if fixture.kind == "recommend":
+                    row["scan"] = bench_scan(boos, args.repeats)
+                rows.append(row)
+        finally:
+            boos.close()
+    return rows
+
+
+def record_fake_fixtures(args, tmp: str):
+    """从替身站点采集一组快照（下载弹层 / 推荐列表 / 详情弹层 / 上限弹窗），用于验证采集与回放流程"""
+    config = FakeSiteConfig(card_total=args.cards, page_size=100, api_latency_ms=0, detail_latency_ms=0, decoy_assets=False)
+    recorder = DomRecorder(args.record_fake, redact=not args.no_redact, min_interval_s=0)
+    with FakeSite(config) as site:
+        boos = make_boos(args, site.url, tmp, "record", recorder)
+        try:
+            driver = boos.driver
+            # 进入推荐页时关闭下载弹层，即采集 download_popup
+            open_recommend_page(boos)
+            frame = driver.find_element(By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS)
+            driver.switch_to.frame(frame)
+            css = selectors.CARD_SELECTOR_CANDIDATES[0]
+            boos._wait(30, poll_frequency=0.05).until(lambda d: d.execute_script(
+                "var n = document.querySelectorAll(arguments[0]).length;"
+                "if (n < arguments[1]) loadMore(arguments[1] - n);"
+                "return n >= arguments[1];",
+                css, args.cards,
+            ))
+            boos._capture_dom("recommend", frame)
+
+            boos._switch_to_card_frame(frame)
+            boos._safe_click(driver.find_element(By.CSS_SELECTOR, css))
+            if boos._wait_ready("detail_panel", boos._find_greet_button, 5) is not None:
+                boos._capture_dom("detail", frame)
+            boos._close_detail_page()
+
+            driver.switch_to.default_content()
+            driver.execute_script("window.showLimitDialog();")
+            boos._handle_limit_dialog(timeout_seconds=2)
+        finally:
+            boos.close()
+    print(f"已采集 {sum(recorder.counts.values())} 个快照到 {args.record_fake}：{recorder.counts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="页面快照回放：选择器检查与扫描/匹配基准")
+    parser.add_argument("path", nargs="?", help="快照文件或快照目录")
+    parser.add_argument("--repeats", type=int, default=7, help="每个推荐列表快照的扫描次数")
+    parser.add_argument("--strict", action="store_true", help="有选择器检查未通过时以非零状态退出")
+    parser.add_argument("--record-fake", metavar="DIR", help="先从替身站点采集快照到该目录")
+    parser.add_argument("--cards", type=int, default=300, help="--record-fake 时列表加载的卡片数")
+    parser.add_argument("--no-redact", action="store_true", help="--record-fake 时不脱敏")
+    parser.add_argument("--browser", choices=["edge", "chrome"], default="edge")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.record_fake:
+            record_fake_fixtures(args, tmp)
+            args.path = args.path or args.record_fake
+        if not args.path:
+            parser.error("需要指定快照路径或 --record-fake")
+        rows = replay_fixtures(args, tmp)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"path": args.path, "browser": args.browser, "fixtures": rows}, f, ensure_ascii=False, indent=2)
+
+    print(f"{'快照':<36}{'类型':<16}{'大小(KB)':>10}{'卡片':>8}{'命中':>8}{'候选':>8}{'扫描(ms)':>10}  失效的选择器")
+    for row in rows:
+        scan = row.get("scan", {})
+        print(f"{row['name']:<36}{row['kind']:<16}{row['bytes'] // 1024:>10}{scan.get('cards', '-'):>8}"
+              f"{scan.get('keyword_matched', '-'):>8}{scan.get('ranked', '-'):>8}{scan.get('scan_ms', '-'):>10}  "
+              f"{', '.join(row['failed']) or '-'}")
+
+    failed = sum(1 for row in rows if row["failed"])
+    if not rows:
+        print("没有找到快照")
+    elif failed:
+        print(f"\n{failed}/{len(rows)} 个快照中有选择器失效")
+    if args.strict and (failed or not rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
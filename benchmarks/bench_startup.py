@@ -0,0 +1,138 @@
+"""启动耗时对比：冷启动 + 注入 cookie vs 持久化浏览器配置热启动。
+
+冷启动：临时配置启动浏览器 → 打开首页 → 逐个 add_cookie（cookies.json）→ 刷新 → 检测登录入口。
+热启动：使用已登录过的配置目录启动浏览器 → 打开首页 → 检测登录入口。
+两种方式都要执行的下载弹层 / 登录按钮探测不计入。
+
+用法：
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.browser import make_headless_driver
+from benchmarks.fake_site import SESSION_COOKIE, FakeSite, FakeSiteConfig
+from common.cookie_store import save_cookies
+from common.processed_store import ProcessedStore
+from core.boos_driver import BoosDriver
+from core.driver_factory import mark_profile_warm
+
+DEFAULT_OUTPUT = os.path.join("bench_results", "startup.json")
+STAGES = ["launch", "homepage", "cookies", "session_ready"]
+
+
+def session_cookie() -> dict:
+    # 带过期时间，浏览器才会把它持久化到配置目录
+    return {"name": SESSION_COOKIE, "value": "1", "path": "/", "expiry": int(time.time()) + 7 * 86400}
+
+
+def write_cookie_file(path: str, extra: int):
+    """模拟真实 cookies.json：会话 cookie 加若干普通 cookie"""
+    cookies = [session_cookie()]
+    cookies += [{"name": f"c{i}", "value": "x" * 32, "path": "/"} for i in range(extra)]
+    save_cookies(path, cookies)
+
+
+def prime_profile(args, site: FakeSite, profile_dir: str):
+    """首次运行：在配置目录里完成一次登录，供后续热启动使用"""
+    driver = make_headless_driver(args.browser, headless=not args.headed, profile_dir=profile_dir)
+    try:
+        driver.get(site.url)
+        driver.add_cookie(session_cookie())
+        driver.get(site.url)
+    finally:
+        driver.quit()
+    mark_profile_warm(profile_dir)
+
+
+def timed_startup(args, site: FakeSite, tmp: str, cookie_path: str, profile_dir: str | None) -> dict[str, float]:
+    timings = {}
+    start = time.perf_counter()
+    driver = make_headless_driver(args.browser, headless=not args.headed, profile_dir=profile_dir)
+    timings["launch"] = time.perf_counter() - start
+
+    boos = BoosDriver(
+        logger=logging.getLogger("bench_startup"),
+        driver=driver,
+        base_url=site.url,
+        cookie_path=cookie_path,
+        processed_store=ProcessedStore(os.path.join(tmp, "processed.db")),
+        profile_dir=profile_dir,
+    )
+    try:
+        driver.get(site.url)
+        timings["homepage"] = time.perf_counter() - start
+        if boos._inject_cookies_if_present():
+            driver.refresh()
+        timings["cookies"] = time.perf_counter() - start
+        if not boos._has_recommend_talents_menu(timeout_seconds=10):
+            raise RuntimeError("未检测到登录后的推荐牛人入口")
+        timings["session_ready"] = time.perf_counter() - start
+    finally:
+        boos.close()
+    return timings
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    return {
+        stage: {
+            "median_ms": round(statistics.median(r[stage] for r in runs) * 1000, 1),
+            "min_ms": round(min(r[stage] for r in runs) * 1000, 1),
+        }
+        for stage in STAGES
+    }
+
+
+def run_benchmark(args) -> dict:
+    config = FakeSiteConfig(api_latency_ms=args.latency_ms, show_download_popup=False)
+    with FakeSite(config) as site, tempfile.TemporaryDirectory() as tmp:
+        cookie_path = os.path.join(tmp, "cookies.json")
+        write_cookie_file(cookie_path, args.cookies)
+        profile_dir = os.path.join(tmp, "profile")
+        prime_profile(args, site, profile_dir)
+
+        cold = [timed_startup(args, site, tmp, cookie_path, None) for _ in range(args.runs)]
+        warm = [timed_startup(args, site, tmp, cookie_path, profile_dir) for _ in range(args.runs)]
+
+    cold_summary, warm_summary = summarize(cold), summarize(warm)
+    cold_ready = cold_summary["session_ready"]["median_ms"]
+    warm_ready = warm_summary["session_ready"]["median_ms"]
+    return {
+        "config": {"runs": args.runs, "cookies": args.cookies + 1, "browser": args.browser},
+        "cold": cold_summary,
+        "warm": warm_summary,
+        "speedup": round(cold_ready / warm_ready, 2) if warm_ready else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="冷启动与持久化配置热启动的耗时对比")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cookies", type=int, default=30, help="cookies.json 中除会话 cookie 外的数量")
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--browser", choices=["edge", "chrome"], default="edge")
+    parser.add_argument("--headed", action="store_true", help="显示浏览器窗口")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    result = run_benchmark(args)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    print(f"{'阶段（累计）':<16}{'冷启动(ms)':>14}{'热启动(ms)':>14}")
+    for stage in STAGES:
+        print(f"{stage:<16}{result['cold'][stage]['median_ms']:>14.1f}{result['warm'][stage]['median_ms']:>14.1f}")
+    print(f"就绪耗时加速比：{result['speedup']}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""基准脚本共用：启动无头浏览器、在替身站点上完成登录并进入推荐牛人页。"""
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from benchmarks.fake_site import SESSION_COOKIE
+from core import selectors
+from core.driver_factory import apply_lean_options, enable_request_blocking, profile_arguments
+
+
+def make_headless_driver(browser: str = "edge", headless: bool = True, profile_dir: str | None = None, lean: bool = False):
+    """创建无头 Edge/Chrome（Edge 为程序默认使用的浏览器）；profile_dir 为持久化配置目录，lean 为精简加载模式"""
+    if browser == "chrome":
+        options = webdriver.ChromeOptions()
+    else:
+        options = webdriver.EdgeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1280,900")
+    if profile_dir:
+        for arg in profile_arguments(profile_dir):
+            options.add_argument(arg)
+    else:
+        options.add_argument("--no-first-run")
+    if lean:
+        apply_lean_options(options)
+    driver = webdriver.Chrome(options=options) if browser == "chrome" else webdriver.Edge(options=options)
+    if lean:
+        enable_request_blocking(driver)
+    return driver
+
+
+def open_recommend_page(boos, timeout: float = 10):
+    """写入替身站点的会话 cookie，进入推荐牛人页并等待首屏卡片"""
+    driver = boos.driver
+    driver.get(boos.base_url)
+    driver.add_cookie({"name": SESSION_COOKIE, "value": "1", "path": "/"})
+    driver.get(boos.base_url)
+    boos._close_download_popup_if_present(timeout_seconds=2)
+    boos._click_recommend_talents()
+    frame = WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS))
+    )
+    driver.switch_to.frame(frame)
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, selectors.CARD_SELECTOR_CANDIDATES[0]))
+    )
+    driver.switch_to.default_content()
@@ -0,0 +1,548 @@
+"""推荐牛人页面的本地替身站点（离线压测 / 端到端基准用）。
+
+页面结构与 core/selectors.py 以及 boos_driver.py 中的绝对 XPath 保持一致：
+登录按钮、带失效提示（.invalid-box）的扫码二维码、推荐牛人菜单、
+iframe[name='recommendFrame'] 中可无限滚动的 [data-geekid] 卡片与 .online-marker、
+带打招呼按钮的详情弹层、登录后的下载弹层、每日上限 <h3> 提示。
+接口延迟、卡片数量、在线/关键词比例等均可配置，真实的 BoosDriver 代码无需修改即可无头运行。
+
+用法：
+    python -m benchmarks.fake_site --port 8765 --cards 2000 --latency-ms 150
+    # 然后 BoosDriver(base_url="http://127.0.0.1:8765/")
+"""
+
+import argparse
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from core.boos_driver import DEFAULT_TARGET_KEYWORDS
+
+SESSION_COOKIE = "fake_session"
+
+SURNAMES = "王李张刘陈杨黄赵吴周徐孙马朱胡郭何高林罗"
+OTHER_JOBS = ["前端开发", "产品经理", "会计", "销售代表", "平面设计", "行政专员", "教师", "护士"]
+ACTIVE_TAGS = ["刚刚活跃", "今日活跃", "3日内活跃", "本周活跃", "2周内活跃"]
+CITIES = ["朝阳区", "海淀区", "丰台区", "通州区", "大兴区", "昌平区"]
+
+
+@dataclass
+class FakeSiteConfig:
+    card_total: int = 500  # 列表总卡片数（0 表示无限）
+    page_size: int = 15  # 每次滚动加载的卡片数
+    initial_cards: int = 15  # 首屏卡片数
+    api_latency_ms: int = 150  # 卡片接口延迟
+    detail_latency_ms: int = 300  # 详情弹层渲染延迟
+    greet_latency_ms: int = 100  # 打招呼接口延迟
+    online_ratio: float = 0.4
+    keyword_ratio: float = 0.3
+    daily_limit: int = 0  # 每日打招呼上限（0 表示不限）
+    limit_dialog_delay_ms: int = 0  # >0 时达到上限后按钮先变为“继续沟通”，延迟该毫秒数才弹出上限提示
+    qr_ttl_s: float = 30.0  # 二维码失效时间
+    scan_delay_s: float = 3.0  # 模拟“扫码成功”的时间（<0 表示永不自动登录）
+    show_download_popup: bool = True
+    decoy_assets: bool = True  # 附带头像图片/字体/统计脚本，用于测量资源拦截效果
+    seed: int = 7
+
+
+def make_card(index: int, config: FakeSiteConfig) -> dict:
+    """按序号确定性地生成一张卡片"""
+    rnd = random.Random(config.seed * 1_000_003 + index)
+    keyword = rnd.random() < config.keyword_ratio
+    job = rnd.choice(DEFAULT_TARGET_KEYWORDS) if keyword else rnd.choice(OTHER_JOBS)
+    return {
+        "geekid": f"{rnd.getrandbits(64):016x}{index:06d}~",
+        "name": rnd.choice(SURNAMES) + rnd.choice(["先生", "女士", "同学"]),
+        "age": rnd.randint(19, 52),
+        "exp": f"{rnd.randint(1, 15)}年",
+        "job": job,
+        "city": rnd.choice(CITIES),
+        "salary": f"{rnd.randint(4, 9)}-{rnd.randint(10, 16)}K",
+        "online": rnd.random() < config.online_ratio,
+        "active": rnd.choice(ACTIVE_TAGS),
+    }
+
+
+def make_png(size: int = 180, cell: int = 12, seed: int = 0) -> bytes:
+    """生成一张黑白方格 PNG（不依赖 Pillow）"""
+    rnd = random.Random(seed)
+    cells = size // cell
+    grid = [[rnd.random() < 0.5 for _ in range(cells)] for _ in range(cells)]
+    rows = []
+    for y in range(size):
+        row = bytearray([0])  # filter: none
+        for x in range(size):
+            on = grid[min(y // cell, cells - 1)][min(x // cell, cells - 1)]
+            row.append(0 if on else 255)
+        rows.append(bytes(row))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(b"".join(rows), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+# ==========================================
+# 页面模板
+# ==========================================
+LOGIN_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>BOSS直聘（本地替身）</title>
+<style>
+body { font-family: sans-serif; margin: 0; }
+.header { height: 56px; display: flex; align-items: center; justify-content: space-between; padding: 0 24px; background: #00bebd; }
+.login-panel { display: none; width: 360px; margin: 60px auto; padding: 24px; border: 1px solid #ddd; text-align: center; }
+.qr-box { position: relative; width: 180px; height: 180px; margin: 16px auto; }
+.invalid-box { display: none; position: absolute; inset: 0; background: rgba(255,255,255,.92); padding-top: 60px; }
+</style></head>
+<body>
+<div><div>
+  <div class="header"><span>BOSS直聘</span><a ka="header-login" href="javascript:;" id="login-btn">登录/注册</a></div>
+  <div class="login-panel" id="panel">
+    <div><div class="switch-tip" id="switch">APP扫码登录</div></div>
+    <div id="qr-area" style="display:none">
+      <div class="qr-tip">请使用 BOSS直聘 APP 扫码</div>
+      <div>
+        <div class="qr-title">扫码登录</div>
+        <div>
+          <div class="qr-box">
+            <img id="qr" alt="二维码" width="180" height="180">
+            <div class="invalid-box"><p>二维码已失效</p><button type="button" id="refresh">点击刷新</button></div>
+          </div>
+        </div>
+      </div>
+    </div>
+  </div>
+</div></div>
+<script>
+var CONFIG = __CONFIG__;
+var qrTimer = null, scanTimer = null;
+function showQr() {
+    document.getElementById('qr').src = '/wapi/zpweixin/qrcode/getqrcode?t=' + Date.now();
+    document.querySelector('.invalid-box').style.display = 'none';
+    clearTimeout(qrTimer);
+    qrTimer = setTimeout(function () {
+        document.querySelector('.invalid-box').style.display = 'block';
+    }, CONFIG.qr_ttl_s * 1000);
+}
+document.getElementById('login-btn').onclick = function () {
+    document.getElementById('panel').style.display = 'block';
+};
+document.getElementById('switch').onclick = function () {
+    document.getElementById('qr-area').style.display = 'block';
+    showQr();
+    if (CONFIG.scan_delay_s >= 0) {
+        scanTimer = setTimeout(function () {
+            document.cookie = '__COOKIE__=1; path=/; max-age=86400';
+            location.href = '/';
+        }, CONFIG.scan_delay_s * 1000);
+    }
+};
+document.getElementById('refresh').onclick = showQr;
+</script>
+</body></html>
+"""
+
+# body 直接子元素的顺序需与 selectors 中的绝对 XPath 对应：
+# div[5] 下载弹层，div[7] 上限弹窗
+MAIN_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>BOSS直聘 - 招聘者（本地替身）</title>
+__DECOY_HEAD__
+<style>
+body { font-family: sans-serif; margin: 0; }
+#main { display: flex; height: 100vh; }
+.menu { width: 160px; background: #f5f6f7; padding-top: 16px; }
+.menu-item-content { padding: 10px 16px; }
+.content { flex: 1; display: flex; flex-direction: column; }
+iframe[name=recommendFrame] { flex: 1; border: 0; width: 100%; }
+.popup { display: none; position: fixed; inset: 0; background: rgba(0,0,0,.4); z-index: 100; }
+.popup > div { width: 360px; margin: 120px auto; background: #fff; padding: 24px; position: relative; }
+.popup i { position: absolute; right: 12px; top: 12px; width: 16px; height: 16px; cursor: pointer; }
+.popup i:before { content: '\\00d7'; }
+</style></head>
+<body>
+<div id="main">
+  <div class="menu">
+    <div class="menu-item-content"><a ka="menu-geek-recommend" href="javascript:;" id="menu-recommend"><span>推荐牛人</span></a></div>
+    <div class="menu-item-content"><a href="javascript:;"><span>沟通</span></a></div>
+  </div>
+  <div class="content" id="content"><p style="padding:24px">欢迎使用</p></div>
+</div>
+<div></div>
+<div></div>
+<div></div>
+<div class="popup" id="download-popup"><div>
+  <div><div><div><a href="javascript:;">立即下载</a></div></div></div>
+  <div><i class="icon-close"></i></div>
+</div></div>
+<div></div>
+<div class="popup" id="limit-dialog"><div>
+  <div><h3>今日主动沟通数已达上限</h3><p>购买权益后可继续沟通</p></div>
+  <div><i class="boss-popup__close"></i></div>
+</div></div>
+<script>
+var CONFIG = __CONFIG__;
+function hide(id) { document.getElementById(id).style.display = 'none'; }
+document.querySelector('#download-popup i').onclick = function () { hide('download-popup'); };
+document.querySelector('#limit-dialog i').onclick = function () { hide('limit-dialog'); };
+document.addEventListener('keydown', function (e) {
+    if (e.key === 'Escape') { hide('download-popup'); hide('limit-dialog'); }
+});
+if (CONFIG.show_download_popup) {
+    setTimeout(function () { document.getElementById('download-popup').style.display = 'block'; }, 300);
+}
+window.showLimitDialog = function () { document.getElementById('limit-dialog').style.display = 'block'; };
+document.getElementById('menu-recommend').onclick = function () {
+    var content = document.getElementById('content');
+    content.innerHTML = '';
+    var frame = document.createElement('iframe');
+    frame.name = 'recommendFrame';
+    frame.src = '/web/frame/recommend/?jobid=fake-job-1';
+    content.appendChild(frame);
+};
+</script>
+</body></html>
+"""
+
+# body/div[2] 为详情弹层，打招呼按钮位置与 DETAIL_GREET_BUTTON_XPATH 一致
+FRAME_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+__DECOY_HEAD__
+<style>
+html, body { margin: 0; height: 100%; font-family: sans-serif; }
+#app { display: flex; flex-direction: column; height: 100%; }
+.job-selecter-wrap { padding: 8px 16px; border-bottom: 1px solid #eee; }
+.ui-dropmenu-list { display: none; }
+.list-wrap { flex: 1; overflow-y: auto; }
+ul.card-list { list-style: none; margin: 0; padding: 0; }
+li.card-item { border-bottom: 1px solid #f0f0f0; }
+.card-inner { display: flex; align-items: center; gap: 12px; padding: 16px; min-height: 72px; cursor: pointer; }
+.card-inner img.avatar { width: 48px; height: 48px; border-radius: 50%; }
+.online-marker { width: 8px; height: 8px; border-radius: 50%; background: #00bebd; display: inline-block; }
+.loading { padding: 12px; text-align: center; color: #999; }
+#detail { display: none; position: fixed; inset: 0; background: rgba(0,0,0,.3); }
+#detail > div { position: absolute; left: 10%; right: 10%; top: 5%; bottom: 5%; background: #fff; }
+#detail .iboss-close { position: absolute; right: 12px; top: 12px; width: 16px; height: 16px; cursor: pointer; }
+#detail .iboss-close:before { content: '\\00d7'; }
+.btn-greet { padding: 8px 24px; background: #00bebd; color: #fff; border: 0; }
+</style></head>
+<body>
+<div id="app">
+  <div class="job-selecter-wrap">
+    <div class="ui-dropmenu-label">配送员 _ 北京</div>
+    <div class="ui-dropmenu-list"><ul class="job-list">
+      <li class="job-item curr">配送员 _ 北京</li><li class="job-item">仓库管理员 _ 北京</li>
+    </ul></div>
+  </div>
+  <div class="list-wrap" id="list-wrap">
+    <ul class="card-list" id="card-list"></ul>
+    <div class="loading" id="loading"></div>
+  </div>
+</div>
+<div id="detail"><div>
+  <div><div><div><div><div>
+    <div class="detail-head">牛人详情</div>
+    <div><div><div><div><div><div>
+      <div id="detail-body"></div>
+      <div><div><span><div><button type="button" class="btn btn-greet" id="greet-btn">打招呼</button></div></span></div></div>
+    </div></div></div></div></div></div>
+  </div></div></div></div></div>
+  <div><i class="iboss-close" id="detail-close"></i></div>
+</div></div>
+<script>
+var CONFIG = __CONFIG__;
+var loaded = 0, loading = false, exhausted = false, current = null;
+var list = document.getElementById('card-list');
+var wrap = document.getElementById('list-wrap');
+
+function esc(s) { return String(s).replace(/[&<>"]/g, function (c) { return '&#' + c.charCodeAt(0) + ';'; }); }
+function render(card) {
+    var li = document.createElement('li');
+    li.className = 'card-item';
+    li.innerHTML = '<div class="card-inner" data-geekid="' + esc(card.geekid) + '">'
+        + (CONFIG.decoy_assets ? '<img class="avatar" src="/static/avatar/' + (card.age % 12) + '.png">' : '')
+        + '<div><div class="name">' + esc(card.name) + (card.online ? ' <span class="online-marker"></span>' : '') + '</div>'
+        + '<div class="base-info">' + card.age + '岁 · ' + esc(card.exp) + ' · ' + esc(card.city) + '</div>'
+        + '<div class="expect">期望：' + esc(card.job) + ' ' + esc(card.salary) + '</div>'
+        + '<div class="active-tag">' + esc(card.active) + '</div></div></div>';
+    li.firstChild.onclick = function () { openDetail(card); };
+    list.appendChild(li);
+}
+function loadMore(count) {
+    if (loading || exhausted) return;
+    loading = true;
+    document.getElementById('loading').textContent = '加载中...';
+    fetch('/api/cards?offset=' + loaded + '&count=' + count).then(function (r) { return r.json(); }).then(function (data) {
+        data.cards.forEach(render);
+        loaded += data.cards.length;
+        exhausted = !data.has_more;
+        loading = false;
+        document.getElementById('loading').textContent = exhausted ? '没有更多了' : '';
+    });
+}
+wrap.addEventListener('scroll', function () {
+    if (wrap.scrollTop + wrap.clientHeight >= wrap.scrollHeight - 200) loadMore(CONFIG.page_size);
+});
+function openDetail(card) {
+    current = card;
+    var btn = document.getElementById('greet-btn');
+    btn.style.display = 'none';
+    btn.textContent = '打招呼';
+    document.getElementById('detail-body').textContent = '加载中...';
+    document.getElementById('detail').style.display = 'block';
+    setTimeout(function () {
+        if (current !== card) return;
+        document.getElementById('detail-body').innerHTML = '<h2>' + esc(card.name) + '</h2><p>' + esc(card.job) + '</p>';
+        btn.style.display = '';
+        fetch('/api/view?geekid=' + encodeURIComponent(card.geekid), {method: 'POST'});
+    }, CONFIG.detail_latency_ms);
+}
+function closeDetail() { current = null; document.getElementById('detail').style.display = 'none'; }
+document.getElementById('detail-close').onclick = closeDetail;
+document.addEventListener('keydown', function (e) {
+    if (e.key === 'Escape') closeDetail();
+    if (e.key === 'ArrowRight' && current) {
+        var items = list.querySelectorAll('[data-geekid]');
+        for (var i = 0; i < items.length - 1; i++) {
+            if (items[i].getAttribute('data-geekid') === current.geekid) { items[i + 1].click(); break; }
+        }
+    }
+});
+document.getElementById('greet-btn').onclick = function () {
+    var btn = this, card = current;
+    if (!card || btn.textContent !== '打招呼') return;
+    fetch('/api/greet?geekid=' + encodeURIComponent(card.geekid), {method: 'POST'})
+        .then(function (r) { return r.json(); })
+        .then(function (data) {
+            if (data.limit && CONFIG.limit_dialog_delay_ms > 0) {
+                btn.textContent = '继续沟通';
+                setTimeout(function () { window.top.showLimitDialog(); }, CONFIG.limit_dialog_delay_ms);
+                return;
+            }
+            if (data.limit) { window.top.showLimitDialog(); return; }
+            btn.textContent = '继续沟通';
+        });
+};
+loadMore(CONFIG.initial_cards);
+</script>
+</body></html>
+"""
+
+DECOY_HEAD = """<link rel="stylesheet" href="/static/font.css">
+<script src="/hm.baidu.com/hm.js" async></script>"""
+
+
+# ==========================================
+# HTTP 服务
+# ==========================================
+class FakeSiteState:
+    def __init__(self, config: FakeSiteConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.greeted: list[str] = []
+        self.viewed = 0
+        self.cards_served = 0
+        self.requests = 0
+        self.bytes_sent = 0
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "greeted": len(self.greeted),
+                "viewed": self.viewed,
+                "cards_served": self.cards_served,
+                "requests": self.requests,
+                "bytes_sent": self.bytes_sent,
+            }
+
+
+class FakeSiteHandler(BaseHTTPRequestHandler):
+    server_version = "FakeBoss/1.0"
+    state: FakeSiteState  # 由 make_handler 注入
+
+    def log_message(self, format, *args):
+        pass
+
+    # -------- 工具 --------
+    @property
+    def config(self) -> FakeSiteConfig:
+        return self.state.config
+
+    def _logged_in(self) -> bool:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return SESSION_COOKIE in cookie
+
+    def _send(self, body: bytes, content_type: str, status: HTTPStatus = HTTPStatus.OK, cache: bool = False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "max-age=3600" if cache else "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+        with self.state.lock:
+            self.state.requests += 1
+            self.state.bytes_sent += len(body)
+
+    def _send_json(self, payload: dict):
+        self._send(json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+
+    def _page(self, template: str) -> bytes:
+        config_json = json.dumps(asdict(self.config))
+        html = (
+            template.replace("__CONFIG__", config_json)
+            .replace("__COOKIE__", SESSION_COOKIE)
+            .replace("__DECOY_HEAD__", DECOY_HEAD if self.config.decoy_assets else "")
+        )
+        return html.encode("utf-8")
+
+    @staticmethod
+    def _sleep_ms(ms: int):
+        if ms > 0:
+            time.sleep(ms / 1000)
+
+    # -------- 路由 --------
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path
+
+        if path == "/":
+            template = MAIN_HTML if self._logged_in() else LOGIN_HTML
+            self._send(self._page(template), "text/html; charset=utf-8")
+        elif path.startswith("/web/frame/recommend"):
+            self._send(self._page(FRAME_HTML), "text/html; charset=utf-8")
+        elif path == "/wapi/zpweixin/qrcode/getqrcode":
+            self._send(make_png(seed=int(query.get("t", ["0"])[0]) % 100000), "image/png")
+        elif path == "/api/cards":
+            self._sleep_ms(self.config.api_latency_ms)
+            offset = int(query.get("offset", ["0"])[0])
+            count = int(query.get("count", [str(self.config.page_size)])[0])
+            total = self.config.card_total
+            end = offset + count if total <= 0 else min(offset + count, total)
+            cards = [make_card(i, self.config) for i in range(offset, end)]
+            with self.state.lock:
+                self.state.cards_served += len(cards)
+            self._send_json({"cards": cards, "has_more": total <= 0 or end < total})
+        elif path == "/api/stats":
+            self._send_json(self.state.snapshot())
+        elif path.startswith("/static/avatar/"):
+            self._send(make_png(size=96, cell=8, seed=hash(path) % 1000), "image/png", cache=True)
+        elif path == "/static/font.css":
+            css = "@font-face { font-family: Decoy; src: url(/static/decoy.woff2); } body { font-family: Decoy, sans-serif; }"
+            self._send(css.encode(), "text/css", cache=True)
+        elif path == "/static/decoy.woff2":
+            self._send(bytes(64 * 1024), "font/woff2", cache=True)
+        # 统计脚本按路径模拟第三方统计域名，便于按域名拦截的规则生效
+        elif path == "/hm.baidu.com/hm.js":
+            self._send(b"/* tracker */ var _t = new Image(); _t.src = '/hm.baidu.com/hm.gif?' + Date.now();", "text/javascript")
+        elif path == "/hm.baidu.com/hm.gif":
+            self._send(b"GIF89a\x01\x00\x01\x00\x00\x00\x00;", "image/gif")
+        else:
+            self._send(b"not found", "text/plain", HTTPStatus.NOT_FOUND)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        geekid = query.get("geekid", [""])[0]
+
+        if url.path == "/api/greet":
+            self._sleep_ms(self.config.greet_latency_ms)
+            with self.state.lock:
+                limit = self.config.daily_limit and len(self.state.greeted) >= self.config.daily_limit
+                if not limit:
+                    self.state.greeted.append(geekid)
+            self._send_json({"ok": not limit, "limit": bool(limit)})
+        elif url.path == "/api/view":
+            with self.state.lock:
+                self.state.viewed += 1
+            self._send_json({"ok": True})
+        else:
+            self._send(b"not found", "text/plain", HTTPStatus.NOT_FOUND)
+
+
+class FakeSite:
+    """在后台线程中运行的替身站点，可作为上下文管理器使用"""
+
+    def __init__(self, config: FakeSiteConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.state = FakeSiteState(config or FakeSiteConfig())
+        handler = type("BoundFakeSiteHandler", (FakeSiteHandler,), {"state": self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def config(self) -> FakeSiteConfig:
+        return self.state.config
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeSite":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="FakeSite", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def stats(self) -> dict:
+        return self.state.snapshot()
+
+    def __enter__(self) -> "FakeSite":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="推荐牛人页面本地替身站点")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cards", type=int, default=500, help="卡片总数，0 表示无限")
+    parser.add_argument("--page-size", type=int, default=15)
+    parser.add_argument("--latency-ms", type=int, default=150)
+    parser.add_argument("--detail-latency-ms", type=int, default=300)
+    parser.add_argument("--daily-limit", type=int, default=0)
+    parser.add_argument("--limit-dialog-delay-ms", type=int, default=0, help="上限弹窗晚于按钮状态变化出现的毫秒数")
+    parser.add_argument("--qr-ttl", type=float, default=30.0)
+    parser.add_argument("--scan-delay", type=float, default=3.0)
+    args = parser.parse_args()
+
+    config = FakeSiteConfig(
+        card_total=args.cards,
+        page_size=args.page_size,
+        api_latency_ms=args.latency_ms,
+        detail_latency_ms=args.detail_latency_ms,
+        daily_limit=args.daily_limit,
+        limit_dialog_delay_ms=args.limit_dialog_delay_ms,
+        qr_ttl_s=args.qr_ttl,
+        scan_delay_s=args.scan_delay,
+    )
+    site = FakeSite(config, host=args.host, port=args.port).start()
+    print(f"替身站点已启动：{site.url}（Ctrl+C 退出）")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
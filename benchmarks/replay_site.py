@@ -0,0 +1,142 @@
+"""页面快照回放站点：把 core.dom_capture 保存的快照原样提供给浏览器（离线回归 / 基准用）。
+
+每个快照对应一个地址：
+    /replay/<快照名>/                顶层文档
+    /replay/<快照名>/frame/<name>    其中的 iframe 文档（快照中 iframe 的 src 已改为该相对路径）
+    /api/fixtures                    快照列表（类型、卡片数、大小）
+    /                                快照索引页
+快照中已去掉脚本与外部资源，回放页面是静态的：滚动不会加载新卡片，点击也不会打开详情，
+适合检查选择器是否仍然有效、测量真实页面规模下的扫描与匹配耗时。
+
+用法：
+    python -m benchmarks.replay_site captures/ --port 8766
+"""
+
+import argparse
+import html
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlparse
+
+from core.dom_capture import TOP_DOCUMENT, CaptureFixture, iter_fixture_paths, load_fixture
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    server_version = "BossReplay/1.0"
+    fixtures: dict[str, CaptureFixture]  # 由 ReplaySite 注入
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body: bytes, content_type: str, status: HTTPStatus = HTTPStatus.OK):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_found(self):
+        self._send(b"not found", "text/plain", HTTPStatus.NOT_FOUND)
+
+    def _index(self) -> bytes:
+        rows = "".join(
+            f'<li><a href="/replay/{quote(name)}/">{html.escape(name)}</a> '
+            f"{html.escape(fixture.kind)} · {fixture.nbytes // 1024} KB</li>"
+            for name, fixture in self.fixtures.items()
+        )
+        return f'<!DOCTYPE html><meta charset="utf-8"><title>页面快照</title><ul>{rows}</ul>'.encode("utf-8")
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/":
+            self._send(self._index(), "text/html; charset=utf-8")
+            return
+        if path == "/api/fixtures":
+            payload = [
+                {"name": name, "kind": f.kind, "redacted": f.redacted, "bytes": f.nbytes, "cards": f.meta.get("cards", {})}
+                for name, f in self.fixtures.items()
+            ]
+            self._send(json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+            return
+
+        # /replay/<name>/ 或 /replay/<name>/frame/<key>
+        parts = path.split("/")
+        if len(parts) < 4 or parts[1] != "replay":
+            self._not_found()
+            return
+        fixture = self.fixtures.get(unquote(parts[2]))
+        rest = parts[3:]
+        if rest == [""]:
+            key = TOP_DOCUMENT
+        elif len(rest) == 2 and rest[0] == "frame":
+            key = unquote(rest[1])
+        else:
+            key = None
+        document = fixture.documents.get(key) if fixture and key else None
+        if document is None:
+            self._not_found()
+            return
+        self._send(document.encode("utf-8"), "text/html; charset=utf-8")
+
+
+class ReplaySite:
+    """在后台线程中运行的回放站点，可作为上下文管理器使用；path 为快照文件或快照目录"""
+
+    def __init__(self, path: str, host: str = "127.0.0.1", port: int = 0):
+        self.fixtures: dict[str, CaptureFixture] = {}
+        for fixture_path in iter_fixture_paths(path):
+            fixture = load_fixture(fixture_path)
+            self.fixtures[fixture.name] = fixture
+        handler = type("BoundReplayHandler", (ReplayHandler,), {"fixtures": self.fixtures})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def fixture_url(self, name: str) -> str:
+        return f"{self.url}replay/{quote(name)}/"
+
+    def start(self) -> "ReplaySite":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="ReplaySite", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "ReplaySite":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="页面快照回放站点")
+    parser.add_argument("path", help="快照文件或快照目录")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    site = ReplaySite(args.path, host=args.host, port=args.port).start()
+    print(f"回放站点已启动：{site.url}（共 {len(site.fixtures)} 个快照，Ctrl+C 退出）")
+    for name, fixture in site.fixtures.items():
+        print(f"  [{fixture.kind}] {site.fixture_url(name)}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == "__main__":
+    main()
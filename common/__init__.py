@@ -1,4 +1,7 @@
 """通用工具模块（与具体业务页面无关的公共能力）。"""
 
-from .cookie_store import load_cookies, save_cookies, sanitize_cookie
+from .cancellation import CancellationToken, TaskCancelled
+from .compact_id_set import CompactIdSet
+from .cookie_store import live_cookies, load_cookies, save_cookies, sanitize_cookie, session_status
 from .logger_config import setup_logging
+from .processed_store import ProcessedStore
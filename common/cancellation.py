@@ -0,0 +1,85 @@
+"""任务取消令牌：点击“停止”后，正在进行的睡眠 / 等待在一个轮询间隔内结束。
+
+所有睡眠都基于 threading.Event.wait，取消时立即唤醒；条件等待每个轮询间隔检查一次令牌。
+取消后抛出 TaskCancelled，由任务循环统一收尾。
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_POLL_INTERVAL = 0.1
+
+
+class TaskCancelled(BaseException):
+    """任务已被取消。
+
+    与 asyncio.CancelledError 一样继承 BaseException：流程中大量 `except Exception`
+    只用来吞掉页面元素相关的错误，不应把取消也吞掉。
+    """
+
+
+class CancellationToken:
+    def __init__(self):
+        self._event = threading.Event()
+        self._shield_depth = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """可以在任意线程调用"""
+        self._event.set()
+
+    def reset(self):
+        self._event.clear()
+
+    @contextmanager
+    def shielded(self):
+        """收尾期间（如关闭详情页）暂不响应取消，睡眠与等待照常进行"""
+        self._shield_depth += 1
+        try:
+            yield
+        finally:
+            self._shield_depth -= 1
+
+    def _interrupted(self) -> bool:
+        return self._event.is_set() and self._shield_depth == 0
+
+    def raise_if_cancelled(self):
+        if self._interrupted():
+            raise TaskCancelled()
+
+    def sleep(self, seconds: float):
+        """可被取消的 time.sleep"""
+        if seconds <= 0:
+            self.raise_if_cancelled()
+            return
+        if self._shield_depth:
+            time.sleep(seconds)
+            return
+        if self._event.wait(seconds):
+            raise TaskCancelled()
+
+    def wait_until(
+            self,
+            predicate: Callable[[], T],
+            timeout: float,
+            interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> T | None:
+        """轮询 predicate 直到返回真值（并返回该值）；超时返回 None，取消时抛出 TaskCancelled"""
+        deadline = time.monotonic() + timeout
+        while True:
+            self.raise_if_cancelled()
+            value = predicate()
+            if value:
+                return value
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self.sleep(min(interval, remaining))
@@ -0,0 +1,192 @@
+"""紧凑的去重集合：记录见过的 geekid，内存有上限。
+
+geekid 是较长的字符串，放进 Python set 每个约占上百字节，连续运行几天会一直增长。
+这里只保存 64 位哈希（开放寻址线性探测，array 存储），每个槽位 8 字节哈希 + 4 字节时间戳：
+- ttl_seconds：超过该时间的记录视为不存在（重新可被评估），在扩容/整理时回收；
+- max_items：达到上限后先回收过期记录，仍然过多则淘汰最早的记录，只保留约四分之三；
+- bloom_bits：可选的 Bloom 过滤器，绝大多数“没见过”的 ID 不需要探测哈希表。
+
+哈希使用内置 hash()（字符串会缓存自己的哈希值），只在进程内使用，不做持久化。
+64 位哈希的冲突概率可以忽略：百万级 ID 时约为 1e-7。
+"""
+
+import time
+from array import array
+from collections.abc import Callable, Iterable
+
+_MASK64 = (1 << 64) - 1
+_EMPTY = 0
+_MIN_CAPACITY = 16
+
+
+def _next_pow2(n: int) -> int:
+    return 1 << max(n - 1, 1).bit_length()
+
+
+def _key(item: str) -> int:
+    # 0 表示空槽位
+    return (hash(item) & _MASK64) or 1
+
+
+class CompactIdSet:
+    def __init__(
+            self,
+            max_items: int = 1 << 18,
+            ttl_seconds: float | None = None,
+            bloom_bits: int = 0,
+            bloom_hashes: int = 4,
+            initial_capacity: int = 1024,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self.bloom_hashes = bloom_hashes
+        self._clock = clock
+        self._epoch = clock()
+        # 装载因子不超过 1/2，最大槽位数为 max_items 的两倍（取 2 的幂）
+        self._max_capacity = _next_pow2(max_items * 2)
+        capacity = min(_next_pow2(max(initial_capacity, _MIN_CAPACITY)), self._max_capacity)
+        self._keys = array("Q", bytes(8 * capacity))
+        self._stamps = array("I", bytes(4 * capacity))
+        self._mask = capacity - 1
+        self._used = 0
+        self._bloom_mask = _next_pow2(bloom_bits) - 1 if bloom_bits else 0
+        self._bloom = bytearray((self._bloom_mask + 1) // 8 or 1) if bloom_bits else None
+        self.evicted = 0
+
+    # -------- 查询 / 写入 --------
+    def __contains__(self, item: str) -> bool:
+        key = _key(item)
+        if self._bloom is not None and not self._bloom_contains(key):
+            return False
+        slot = self._find(key)
+        if slot < 0:
+            return False
+        return not self._expired(self._stamps[slot], self._now())
+
+    def add(self, item: str) -> bool:
+        """加入集合；原本不存在（或已过期）返回 True"""
+        key = _key(item)
+        now = self._now()
+        slot = self._find(key)
+        if slot >= 0:
+            fresh = self._expired(self._stamps[slot], now)
+            self._stamps[slot] = now
+            return fresh
+        if self._used + 1 > min((self._mask + 1) // 2, self.max_items):
+            self._rebuild(now)
+        self._insert(key, now)
+        return True
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def clear(self):
+        capacity = self._mask + 1
+        self._keys = array("Q", bytes(8 * capacity))
+        self._stamps = array("I", bytes(4 * capacity))
+        self._used = 0
+        if self._bloom is not None:
+            self._bloom = bytearray(len(self._bloom))
+
+    def __len__(self) -> int:
+        """已占用的槽位数（含尚未回收的过期记录）"""
+        return self._used
+
+    # -------- 内存统计 --------
+    @property
+    def capacity(self) -> int:
+        return self._mask + 1
+
+    @property
+    def nbytes(self) -> int:
+        table = self._keys.itemsize * len(self._keys) + self._stamps.itemsize * len(self._stamps)
+        return table + (len(self._bloom) if self._bloom is not None else 0)
+
+    def bytes_per_id(self) -> float:
+        return self.nbytes / self._used if self._used else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "ids": self._used,
+            "capacity": self.capacity,
+            "bytes": self.nbytes,
+            "bytes_per_id": round(self.bytes_per_id(), 1),
+            "evicted": self.evicted,
+        }
+
+    # -------- 内部实现 --------
+    def _now(self) -> int:
+        return int(self._clock() - self._epoch)
+
+    def _expired(self, stamp: int, now: int) -> bool:
+        return self.ttl_seconds is not None and now - stamp >= self.ttl_seconds
+
+    def _find(self, key: int) -> int:
+        keys, mask = self._keys, self._mask
+        slot = key & mask
+        while True:
+            current = keys[slot]
+            if current == key:
+                return slot
+            if current == _EMPTY:
+                return -1
+            slot = (slot + 1) & mask
+
+    def _insert(self, key: int, stamp: int):
+        keys, mask = self._keys, self._mask
+        slot = key & mask
+        while keys[slot] != _EMPTY:
+            slot = (slot + 1) & mask
+        keys[slot] = key
+        self._stamps[slot] = stamp
+        self._used += 1
+        if self._bloom is not None:
+            self._bloom_add(key)
+
+    def _rebuild(self, now: int):
+        """扩容或整理：丢弃过期记录；已到容量上限时再淘汰最早的记录"""
+        entries = [
+            (key, stamp)
+            for key, stamp in zip(self._keys, self._stamps)
+            if key != _EMPTY and not self._expired(stamp, now)
+        ]
+        # 整理后至少留出 1/4 的余量，避免到达上限后每次写入都触发整理
+        keep = self.max_items * 3 // 4
+        if len(entries) >= self.max_items:
+            entries.sort(key=lambda e: e[1])
+            drop = len(entries) - keep
+            self.evicted += drop
+            entries = entries[drop:]
+
+        capacity = self._mask + 1
+        while capacity < self._max_capacity and len(entries) + 1 > capacity // 4:
+            capacity *= 2
+        self._mask = capacity - 1
+        self._keys = array("Q", bytes(8 * capacity))
+        self._stamps = array("I", bytes(4 * capacity))
+        self._used = 0
+        if self._bloom is not None:
+            self._bloom = bytearray(len(self._bloom))
+        for key, stamp in entries:
+            self._insert(key, stamp)
+
+    # 双重哈希：第 i 个位置为 (h1 + i * h2) & mask
+    def _bloom_add(self, key: int):
+        bloom, mask = self._bloom, self._bloom_mask
+        pos, step = key & 0xFFFFFFFF, (key >> 32) | 1
+        for _ in range(self.bloom_hashes):
+            bit = pos & mask
+            bloom[bit >> 3] |= 1 << (bit & 7)
+            pos += step
+
+    def _bloom_contains(self, key: int) -> bool:
+        bloom, mask = self._bloom, self._bloom_mask
+        pos, step = key & 0xFFFFFFFF, (key >> 32) | 1
+        for _ in range(self.bloom_hashes):
+            bit = pos & mask
+            if not bloom[bit >> 3] & (1 << (bit & 7)):
+                return False
+            pos += step
+        return True
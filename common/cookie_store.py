@@ -1,14 +1,42 @@
+"""cookies.json 读写。
+
+- 写入为原子操作（同目录临时文件 + os.replace），中途崩溃不会留下半个文件；
+- 读取结果按文件 mtime/大小缓存，文件未变化时不重复解析；
+- 可在打开浏览器之前判断本地登录态是否已过期，过期则直接走扫码登录。
+"""
+
 import json
 import os
+import tempfile
+import threading
 import time
 from typing import Any
 
+# 登录态相关的 cookie：全部过期即视为会话已失效
+SESSION_COOKIE_NAMES = ("wt2", "zp_at", "bst")
 
-def load_cookies(cookie_path: str) -> list[dict[str, Any]]:
-    if not os.path.exists(cookie_path):
+SESSION_MISSING = "missing"
+SESSION_EXPIRED = "expired"
+SESSION_VALID = "valid"
+
+_cache: dict[str, tuple[tuple[int, int], list[dict[str, Any]]]] = {}
+_cache_lock = threading.Lock()
+
+
+def _file_key(cookie_path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(cookie_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse(cookie_path: str) -> list[dict[str, Any]]:
+    try:
+        with open(cookie_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
         return []
-    with open(cookie_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
     if isinstance(data, dict) and "cookies" in data:
         cookies = data.get("cookies")
     else:
@@ -18,13 +46,75 @@ def load_cookies(cookie_path: str) -> list[dict[str, Any]]:
     return [c for c in cookies if isinstance(c, dict)]
 
 
+def load_cookies(cookie_path: str) -> list[dict[str, Any]]:
+    key = _file_key(cookie_path)
+    if key is None:
+        return []
+    path = os.path.abspath(cookie_path)
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is None or cached[0] != key:
+            cached = (key, _parse(cookie_path))
+            _cache[path] = cached
+    # 返回副本，调用方修改不会污染缓存
+    return [dict(c) for c in cached[1]]
+
+
 def save_cookies(cookie_path: str, cookies: list[dict[str, Any]]):
     payload = {
         "saved_at": int(time.time()),
         "cookies": cookies,
     }
-    with open(cookie_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    directory = os.path.dirname(os.path.abspath(cookie_path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".cookies-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, cookie_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    key = _file_key(cookie_path)
+    if key is not None:
+        with _cache_lock:
+            _cache[os.path.abspath(cookie_path)] = (key, [dict(c) for c in cookies if isinstance(c, dict)])
+
+
+def is_expired(cookie: dict[str, Any], now: float | None = None) -> bool:
+    """没有 expiry 的是会话 cookie，不视为过期"""
+    expiry = cookie.get("expiry")
+    if expiry is None:
+        return False
+    try:
+        return float(expiry) <= (time.time() if now is None else now)
+    except (TypeError, ValueError):
+        return False
+
+
+def live_cookies(cookies: list[dict[str, Any]], now: float | None = None) -> list[dict[str, Any]]:
+    now = time.time() if now is None else now
+    return [c for c in cookies if not is_expired(c, now)]
+
+
+def session_status(cookies: list[dict[str, Any]], now: float | None = None) -> str:
+    """根据 cookie 过期时间判断本地登录态：missing / expired / valid。
+
+    没有任何登录态 cookie 时无法从本地判断，只要还有未过期的 cookie 就返回 valid，
+    交给浏览器去验证。
+    """
+    if not cookies:
+        return SESSION_MISSING
+    now = time.time() if now is None else now
+    markers = [c for c in cookies if c.get("name") in SESSION_COOKIE_NAMES]
+    if markers:
+        return SESSION_VALID if any(not is_expired(c, now) for c in markers) else SESSION_EXPIRED
+    return SESSION_VALID if live_cookies(cookies, now) else SESSION_EXPIRED
 
 
 def sanitize_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
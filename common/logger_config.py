@@ -1,16 +1,205 @@
+"""日志配置。
+
+默认使用队列模式：业务线程里的 logger.info 只做一次入队，格式化、写文件、
+输出控制台以及 GUI 日志面板都由后台监听线程完成。日志文件按大小或每天零点轮转，
+旧文件压缩为 .gz 并只保留最近若干份；可选额外输出一份 JSON Lines 日志便于检索。
+"""
+
+import atexit
+import copy
+import datetime
+import glob
+import gzip
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import sys
+import time
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: logging.Handler | None = None
+# queued=False 时直接挂在根 logger 上的 handler
+_direct_handlers: list[logging.Handler] = []
+
+
+class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """按大小或每天零点轮转；轮转出的文件压缩为 <name>.<时间>.gz，只保留最近 backup_count 份"""
+
+    def __init__(
+            self,
+            filename: str,
+            max_bytes: int = 10 * 1024 * 1024,
+            backup_count: int = 14,
+            daily: bool = True,
+            encoding: str = "utf-8",
+    ):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        self.daily = daily
+        self.rollover_at = self._next_midnight() if daily else None
+
+    @staticmethod
+    def _next_midnight() -> float:
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        return time.mktime(tomorrow.timetuple())
+
+    def shouldRollover(self, record) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.isfile(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            self._compress(self.baseFilename, self._archive_name())
+            self._prune()
+
+        if self.daily:
+            self.rollover_at = self._next_midnight()
+        if not self.delay:
+            self.stream = self._open()
+
+    def _archive_name(self) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        target = f"{self.baseFilename}.{stamp}.gz"
+        n = 1
+        while os.path.exists(target):
+            target = f"{self.baseFilename}.{stamp}-{n}.gz"
+            n += 1
+        return target
+
+    @staticmethod
+    def _compress(source: str, target: str):
+        with open(source, "rb") as src, gzip.open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+    def _prune(self):
+        if self.backupCount <= 0:
+            return
+        archives = sorted(glob.glob(glob.escape(self.baseFilename) + ".*.gz"), key=os.path.getmtime)
+        for path in archives[:-self.backupCount]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """每条日志输出为一行 JSON"""
+
+    def format(self, record) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _EnqueueOnlyHandler(logging.handlers.QueueHandler):
+    """入队前只合并消息参数，时间与格式的拼接交给监听线程。
+
+    与 QueueHandler.prepare 一样在业务线程里算出 getMessage()：参数可能是之后还会被修改的对象；
+    异常先转成 exc_text 再清掉 exc_info，队列里不再持有 traceback 及其引用的栈帧。
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def stop_logging():
+    """停止后台监听线程并写出队列中剩余的日志，移除本模块挂上的 handler（重复调用无副作用）"""
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    while _direct_handlers:
+        handler = _direct_handlers.pop()
+        root.removeHandler(handler)
+        handler.close()
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+        _queue_handler = None
 
 
 def setup_logging(
-    log_file: str = "boos_auto.log",
-    level: int = logging.INFO,
+        log_file: str | None = "boos_auto.log",
+        level: int = logging.INFO,
+        queued: bool = True,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 14,
+        json_file: str | None = None,
+        console: bool = True,
+        extra_handlers: list[logging.Handler] | tuple = (),
 ) -> logging.Logger:
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
-    )
+    """配置根日志。
+
+    queued=False 时退回为同步写入（handler 直接挂在根 logger 上）。
+    log_file 为 None、console=False 时不写日志文件 / 不输出控制台（GUI 只输出到日志面板）。
+    extra_handlers 用于附加其他输出（如 GUI 日志面板），同样在监听线程中执行。
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: list[logging.Handler] = []
+
+    if log_file:
+        file_handler = CompressedRotatingFileHandler(log_file, max_bytes=max_bytes, backup_count=backup_count)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    if json_file:
+        json_handler = CompressedRotatingFileHandler(json_file, max_bytes=max_bytes, backup_count=backup_count)
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+    # 打包成无控制台的 GUI 程序时 sys.stderr 为 None
+    if console and sys.stderr is not None:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
+    handlers.extend(extra_handlers)
+
+    stop_logging()
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    if not queued:
+        for handler in handlers:
+            root.addHandler(handler)
+        _direct_handlers.extend(handlers)
+        return logging.getLogger(__name__)
+
+    global _listener, _queue_handler
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = _EnqueueOnlyHandler(log_queue)
+    root.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     return logging.getLogger(__name__)
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,190 @@
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+
+STATUSES = ("opened", "greeted", "skipped", "failed")
+# 只有打过招呼的牛人永久排除；其余状态（打开后中断 / 跳过 / 失败）过了重试窗口可再次处理
+FINAL_STATUS = "greeted"
+DEFAULT_RETRY_AFTER_S = 6 * 3600
+DEFAULT_DB_NAME = "processed.db"
+
+# SQLite 单条语句的参数个数上限（老版本为 999）
+_IN_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed (
+    geekid     TEXT NOT NULL,
+    job        TEXT NOT NULL,
+    status     TEXT NOT NULL,
+    opened_at  INTEGER,
+    greeted_at INTEGER,
+    skipped_at INTEGER,
+    failed_at  INTEGER,
+    updated_at INTEGER NOT NULL,
+    PRIMARY KEY (geekid, job)
+) WITHOUT ROWID
+"""
+
+_STOP = object()
+
+
+class ProcessedStore:
+    """跨运行持久化的“已处理牛人”记录（SQLite WAL，主键为 geekid + 职位）。
+
+    写入先进入内存队列，由后台线程批量提交，打招呼循环不会阻塞在磁盘 fsync 上；
+    尚未落盘的记录同样参与 seen() 查询。
+    retry_after_s：非 greeted 状态的记录在该秒数内视为已处理，之后可重新尝试。
+    """
+
+    def __init__(
+            self,
+            db_path: str = DEFAULT_DB_NAME,
+            flush_interval: float = 0.5,
+            batch_size: int = 200,
+            retry_after_s: float = DEFAULT_RETRY_AFTER_S,
+            clock=time.time,
+    ):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.retry_after_s = retry_after_s
+        self._clock = clock
+
+        self._read_conn = self._connect()
+        self._read_conn.execute(_SCHEMA)
+        self._read_conn.commit()
+        self._read_lock = threading.Lock()
+
+        # 尚未落盘的最新记录：(geekid, job) -> (status, 时间戳)
+        self._pending: dict[tuple[str, str], tuple[str, int]] = {}
+        self._pending_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="ProcessedStoreWriter", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # -------- 查询 --------
+    def _excludes(self, status: str, updated_at: int, retry_since: float) -> bool:
+        return status == FINAL_STATUS or updated_at > retry_since
+
+    def seen(self, geekids: Iterable[str | None], job: str = "") -> set[str]:
+        """批量返回应排除的 geekid：已打招呼，或其他状态的记录仍在重试窗口内"""
+        ids = list({gid for gid in geekids if gid})
+        if not ids:
+            return set()
+        retry_since = self._clock() - self.retry_after_s
+
+        found = set()
+        rest = []
+        with self._pending_lock:
+            for gid in ids:
+                pending = self._pending.get((gid, job))
+                if pending is None:
+                    rest.append(gid)
+                elif self._excludes(*pending, retry_since):
+                    found.add(gid)
+
+        with self._read_lock:
+            for i in range(0, len(rest), _IN_CHUNK):
+                chunk = rest[i:i + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._read_conn.execute(
+                    f"SELECT geekid FROM processed WHERE job = ? AND geekid IN ({placeholders}) "
+                    f"AND (status = ? OR updated_at > ?)",
+                    [job, *chunk, FINAL_STATUS, retry_since],
+                )
+                found.update(row[0] for row in rows)
+        return found
+
+    def status_of(self, geekid: str, job: str = "") -> str | None:
+        self.flush()
+        with self._read_lock:
+            row = self._read_conn.execute(
+                "SELECT status FROM processed WHERE geekid = ? AND job = ?", (geekid, job)
+            ).fetchone()
+        return row[0] if row else None
+
+    # -------- 写入 --------
+    def record(self, geekid: str | None, job: str = "", status: str = "opened"):
+        """记录一次状态变化（仅入队，不等待落盘）"""
+        if not geekid:
+            return
+        if status not in STATUSES:
+            raise ValueError(f"未知状态: {status}")
+        ts = int(self._clock())
+        with self._pending_lock:
+            self._pending[(geekid, job)] = (status, ts)
+        self._queue.put((geekid, job, status, ts))
+
+    def flush(self, timeout: float | None = None):
+        """等待当前队列中的记录全部落盘"""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        with self._read_lock:
+            self._read_conn.close()
+
+    # -------- 后台写线程 --------
+    def _writer_loop(self):
+        conn = self._connect()
+        running = True
+        while running:
+            batch = []
+            waiters = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            while True:
+                if item is _STOP:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if not running or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(conn, batch)
+            for w in waiters:
+                w.set()
+        conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list[tuple[str, str, str, int]]):
+        try:
+            with conn:
+                for geekid, job, status, ts in batch:
+                    column = f"{status}_at"
+                    conn.execute(
+                        f"INSERT INTO processed (geekid, job, status, {column}, updated_at) "
+                        f"VALUES (?, ?, ?, ?, ?) "
+                        f"ON CONFLICT (geekid, job) DO UPDATE SET "
+                        f"status = excluded.status, {column} = excluded.{column}, updated_at = excluded.updated_at",
+                        (geekid, job, status, ts, ts),
+                    )
+        except sqlite3.Error:
+            # 写入失败时保留 pending，至少保证本次运行内不会重复处理
+            return
+        with self._pending_lock:
+            for geekid, job, status, ts in batch:
+                # 写入期间又有新记录时保留较新的 pending
+                if self._pending.get((geekid, job)) == (status, ts):
+                    del self._pending[(geekid, job)]
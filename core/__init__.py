@@ -1,6 +1,12 @@
 """核心业务模块（流程/页面相关逻辑）。
 
 为了兼容历史代码，旧的 utils.* 会薄封装转发到这里。
+BoosDriver 依赖 selenium，按需导入：只用 core.selectors 等轻量模块时不会加载浏览器驱动栈。
 """
 
-from .boos_driver import BoosDriver
+
+def __getattr__(name):
+    if name == "BoosDriver":
+        from .boos_driver import BoosDriver
+        return BoosDriver
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
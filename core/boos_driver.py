@@ -1,18 +1,68 @@
+import base64
 import logging
 import os
 import time
 import random
-
-from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from collections import deque
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
-from common.cookie_store import load_cookies, sanitize_cookie, save_cookies
+from common.cancellation import CancellationToken, TaskCancelled
+from common.compact_id_set import CompactIdSet
+from common.cookie_store import SESSION_EXPIRED, live_cookies, load_cookies, sanitize_cookie, save_cookies, session_status
+from common.metrics import REGISTRY, JsonSnapshotWriter, MetricsRegistry, MetricsServer
+from common.processed_store import DEFAULT_DB_NAME, ProcessedStore
 from core import selectors
+from core.cancellable_wait import CancellableWait
+from core.card_locator import CardLocator
+from core.candidate_scorer import CandidateScorer, ScoredCard
+from core.card_snapshot import (
+    CARD_STATE_JS,
+    LOCATE_CARD_JS,
+    SNAPSHOT_CARDS_JS,
+    CardSnapshot,
+    ScanCursor,
+    parse_snapshot,
+    refresh_snapshot,
+)
+from core.command_stats import CommandStats, instrument_driver
+from core.dom_capture import DomRecorder
+from core.driver_factory import create_edge_driver, mark_profile_warm, profile_is_warm
+from core.funnel_metrics import GreetFunnel
+from core.keyword_matcher import KeywordMatcher
+from core.list_scroller import SCROLL_AND_WAIT_JS, ScrollResult, parse_scroll_result
+from core.pacing import GREET_OUTCOME_JS, PACING_PROFILES, PacingProfile, WaitStats, dwell
+from core.page_recycler import PAGE_STATS_JS, PRUNE_CARDS_JS, PageRecycler, RecyclePolicy
+from core.phase_timer import PhaseTimer, timed_phase
+
+
+BASE_URL = "https://www.zhipin.com/"
+
+# 默认关键词列表
+DEFAULT_TARGET_KEYWORDS = [
+    "快递员", "外卖员", "配送员", "保安", "货车司机", "送餐员",
+    "普工", "操作工", "服务员", "商务司机", "家政", "清洁工", "搬运工",
+    "司机", "送货员", "仓库管理员", "物流专员", "物流助理", "配送专员",
+    "仓库专员", "仓库管理员", "物流调度", "快递员兼职", "送餐兼职",
+    "兼职司机", "临时工", "钟点工", "搬家工", "保洁员", "家政服务",
+    "送货司机", "配送司机", "快递配送", "外卖配送", "物流司机",
+    "仓库工人", "仓储管理员", "物流操作员", "配送助理", "快递分拣员",
+    "送餐员兼职", "快递员全职", "外卖员全职", "配送员全职",
+    "保安兼职", "货车司机兼职", "司机兼职", "搬运工兼职",
+    "仓库管理员兼职", "物流专员兼职", "仓库专员兼职",
+    "物流调度兼职", "临时工兼职", "钟点工兼职", "保洁员兼职",
+    "家政服务兼职", "送货司机兼职"
+]
 
 
 class BoosDriver:
@@ -21,29 +71,129 @@ class BoosDriver:
             logger: logging.Logger | None = None,
             driver=None,
             cookie_path: str = "cookies.json",
+            processed_store: ProcessedStore | None = None,
+            pacing: PacingProfile | None = None,
+            base_url: str = BASE_URL,
+            instrument_commands: bool = False,
+            metrics_registry: MetricsRegistry | None = None,
+            metrics_port: int | None = None,
+            metrics_json_path: str | None = None,
+            profile_dir: str | None = None,
+            lean: bool = False,
+            recycle_policy: RecyclePolicy | None = None,
+            cancel_token: CancellationToken | None = None,
+            dom_recorder: DomRecorder | None = None,
     ):
         self.logger = logger or logging.getLogger(__name__)
-        self.driver = driver or webdriver.Edge()
+        # 启动计时：冷启动（临时配置 + 注入 cookie）与热启动（持久化配置）对比
+        self._startup_t0 = time.perf_counter()
+        self.startup_timings: dict[str, float] = {}
+        # profile_dir 为持久化浏览器配置目录；保存过登录态的目录视为热启动，登录态由浏览器自身保留
+        self.profile_dir = profile_dir
+        self.warm_start = profile_is_warm(profile_dir)
+        # lean：精简加载（eager 加载策略 + 拦截头像与第三方统计），见 core.driver_factory
+        self.driver = driver or create_edge_driver(profile_dir=profile_dir, lean=lean)
+        self._mark_startup("launch")
         self.cookie_path = cookie_path
+        self.base_url = base_url
+        # 已处理牛人记录（跨运行、跨任务共享）；默认与 cookies 文件放在同一目录
+        self.processed_store = processed_store or ProcessedStore(
+            os.path.join(os.path.dirname(os.path.abspath(cookie_path)), DEFAULT_DB_NAME)
+        )
+        # 卡片所在 iframe/选择器缓存
+        self.card_locator = CardLocator()
+        # 滚动加载：单次最长等待秒数；连续多少次没有新卡片视为列表到底
+        self.scroll_wait_timeout = 6.0
+        self.max_idle_scrolls = 3
+        # False 时每次打招呼后全量重新扫描（旧行为，便于基准对比）
+        self.match_queue_enabled = True
+        # 已评估卡片的去重集合：只存 geekid 哈希，超过上限淘汰最早的记录；超过 ttl 秒后可重新评估
+        self.evaluated_max_ids = 200_000
+        self.evaluated_ttl: float | None = 6 * 3600
+        # 取消令牌：所有睡眠与等待都会响应“停止”；滚动等待按 scroll_wait_slice 秒分段，段间检查令牌
+        self.cancel_token = cancel_token or CancellationToken()
+        self.scroll_wait_slice = 0.1
+        # 长时间运行的页面回收（卡片数 / JS 堆 / 时长触发），默认关闭，传入 recycle_policy 启用，见 core.page_recycler
+        self.page_recycler = PageRecycler(recycle_policy)
+        # 页面快照采集（离线回放 / 选择器回归用），None 表示不采集，见 core.dom_capture
+        self.dom_recorder = dom_recorder
+        self._script_timeout: float | None = None
+        # 详情页停留节奏（与就绪等待分开统计）
+        self.pacing = pacing or PACING_PROFILES["default"]
+        self.wait_stats = WaitStats()
+        # 分阶段计时（扫描/匹配/点击/详情/关闭/滚动）
+        self.phases = PhaseTimer()
+        # WebDriver 命令统计（可选，按阶段归类）
+        self.command_stats: CommandStats | None = None
+        if instrument_commands:
+            self.command_stats = CommandStats()
+            instrument_driver(self.driver, self.command_stats, lambda: self.phases.current)
+        # 打招呼漏斗指标；可选导出为本机 Prometheus 端点 / 定期 JSON 快照
+        registry = metrics_registry or REGISTRY
+        self.funnel = GreetFunnel(registry)
+        self._metrics_exporters = []
+        if metrics_port is not None:
+            server = MetricsServer(registry, port=metrics_port)
+            self._metrics_exporters.append(server)
+            self.logger.info(f"指标端点已启动：{server.url}")
+        if metrics_json_path:
+            self._metrics_exporters.append(JsonSnapshotWriter(metrics_json_path, registry))
         # 1. 关键词列表
-        self.target_keywords = [
-            "快递员", "外卖员", "配送员", "保安", "货车司机", "送餐员",
-            "普工", "操作工", "服务员", "商务司机", "家政", "清洁工", "搬运工",
-            "司机", "送货员", "仓库管理员", "物流专员", "物流助理", "配送专员",
-            "仓库专员", "仓库管理员", "物流调度", "快递员兼职", "送餐兼职",
-            "兼职司机", "临时工", "钟点工", "搬家工", "保洁员", "家政服务",
-            "送货司机", "配送司机", "快递配送", "外卖配送", "物流司机",
-            "仓库工人", "仓储管理员", "物流操作员", "配送助理", "快递分拣员",
-            "送餐员兼职", "快递员全职", "外卖员全职", "配送员全职",
-            "保安兼职", "货车司机兼职", "司机兼职", "搬运工兼职",
-            "仓库管理员兼职", "物流专员兼职", "仓库专员兼职",
-            "物流调度兼职", "临时工兼职", "钟点工兼职", "保洁员兼职",
-            "家政服务兼职", "送货司机兼职"
-        ]
+        self.target_keywords = list(DEFAULT_TARGET_KEYWORDS)
+        self._keyword_matcher: KeywordMatcher | None = None
+        self._keyword_matcher_source: tuple[str, ...] = ()
+        # 候选人打分：关键词权重（未列出的目标关键词权重为 1）与排除词
+        self.keyword_weights: dict[str, float] = {}
+        self.negative_keywords: list[str] = []
+        self._candidate_scorer: CandidateScorer | None = None
+        self._candidate_scorer_source: tuple = ()
+
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """target_keywords 编译后的匹配器（关键词列表变化时自动重建）"""
+        source = tuple(self.target_keywords)
+        if self._keyword_matcher is None or source != self._keyword_matcher_source:
+            self._keyword_matcher = KeywordMatcher(source)
+            self._keyword_matcher_source = source
+        return self._keyword_matcher
+
+    @property
+    def candidate_scorer(self) -> CandidateScorer:
+        """按关键词权重 / 活跃度 / 在线 / 排除词给卡片打分（配置变化时自动重建）"""
+        source = (tuple(self.target_keywords), tuple(sorted(self.keyword_weights.items())), tuple(self.negative_keywords))
+        if self._candidate_scorer is None or source != self._candidate_scorer_source:
+            weights = {kw: self.keyword_weights.get(kw, 1.0) for kw in self.target_keywords}
+            weights.update(self.keyword_weights)
+            self._candidate_scorer = CandidateScorer(weights, self.negative_keywords)
+            self._candidate_scorer_source = source
+        return self._candidate_scorer
+
+    # -------- 任务取消 --------
+    def stop_task(self):
+        """请求停止当前任务（可在任意线程调用）"""
+        self.cancel_token.cancel()
+
+    @property
+    def _stop_flag(self) -> bool:
+        # 兼容旧代码：读写都映射到取消令牌
+        return self.cancel_token.cancelled
+
+    @_stop_flag.setter
+    def _stop_flag(self, value: bool):
+        if value:
+            self.cancel_token.cancel()
+        else:
+            self.cancel_token.reset()
+
+    def _sleep(self, seconds: float):
+        self.cancel_token.sleep(seconds)
+
+    def _wait(self, timeout: float, poll_frequency: float = 0.5) -> CancellableWait:
+        return CancellableWait(self.driver, timeout, self.cancel_token, poll_frequency=poll_frequency)
 
     def _has_recommend_talents_menu(self, timeout_seconds: int = 3) -> bool:
         """判断是否已进入登录后的工作台"""
-        wait = WebDriverWait(self.driver, timeout_seconds)
+        wait = self._wait(timeout_seconds)
 
         def found(_):
             for kind, value in selectors.RECOMMEND_TALENTS_SELECTORS:
@@ -67,14 +217,30 @@ class BoosDriver:
             self.logger.error(f"检测推荐牛人入口时出错：{str(e)}")
             return False
 
+    def _mark_startup(self, stage: str):
+        self.startup_timings[stage] = time.perf_counter() - self._startup_t0
+
+    def _log_startup_report(self):
+        mode = "热启动（持久化配置）" if self.warm_start else "冷启动"
+        stages = "，".join(f"{k} {v:.2f}s" for k, v in self.startup_timings.items())
+        self.logger.info(f"启动耗时 [{mode}]：{stages}")
+
     def _inject_cookies_if_present(self) -> int:
-        if not os.path.exists(self.cookie_path):
+        if self.warm_start:
+            # 持久化配置里已经有登录态，不再逐个注入 cookies.json
             return 0
         cookies = load_cookies(self.cookie_path)
         if not cookies:
             return 0
+        # 先在本地按过期时间判断，已过期就不必再让浏览器去验证
+        if session_status(cookies) == SESSION_EXPIRED:
+            self.logger.info("本地保存的登录态已过期，直接扫码登录")
+            return 0
+        cookies = live_cookies(cookies)
 
-        self.driver.get("https://www.zhipin.com/")
+        # 调用方通常已经打开了首页，只有不在目标站点时才需要再导航一次
+        if not self.driver.current_url.startswith(self.base_url):
+            self.driver.get(self.base_url)
         applied = 0
         for c in cookies:
             try:
@@ -87,7 +253,7 @@ class BoosDriver:
 
     def _click_login_if_present(self, timeout_seconds: int = 3) -> bool:
         try:
-            wait = WebDriverWait(self.driver, timeout_seconds)
+            wait = self._wait(timeout_seconds)
             btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selectors.LOGIN_BUTTON_CSS)))
             self.logger.info("检测到登录按钮，准备点击")
             btn.click()
@@ -104,12 +270,15 @@ class BoosDriver:
             cookies = self.driver.get_cookies()
             save_cookies(self.cookie_path, cookies)
             self.logger.info(f"已保存 cookies：{self.cookie_path}")
+            if self.profile_dir:
+                mark_profile_warm(self.profile_dir)
         except Exception as e:
             self.logger.warning(f"保存 cookies 失败：{str(e)}")
 
     # -------- 基础工具 --------
+    @timed_phase("safe_click")
     def _safe_click(self, element, timeout: int = 10):
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self._wait(timeout)
         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
         wait.until(lambda d: element.is_displayed())
 
@@ -133,8 +302,82 @@ class BoosDriver:
             except Exception as js_e:
                 self.logger.error(f"JS点击也失败: {str(js_e)}")
 
+    def _find_displayed(self, locators):
+        """按顺序返回第一个可见元素，找不到返回 None"""
+        for by_mode, value in locators:
+            for el in self.driver.find_elements(by_mode, value):
+                try:
+                    if el.is_displayed():
+                        return el
+                except StaleElementReferenceException:
+                    continue
+        return None
+
+    def _wait_ready(self, name: str, condition, timeout: float):
+        """就绪等待：条件满足立即返回其结果，超时返回 None；耗时计入 wait_stats"""
+        start = time.monotonic()
+
+        def check(_):
+            try:
+                return condition()
+            except (NoSuchElementException, StaleElementReferenceException):
+                return None
+
+        try:
+            return self._wait(timeout, poll_frequency=0.2).until(check)
+        except TimeoutException:
+            return None
+        finally:
+            self.wait_stats.add(f"ready:{name}", time.monotonic() - start)
+
+    def _dwell(self, name: str, seconds: float, since: float | None = None):
+        """刻意停留（由 pacing 配置决定），耗时计入 wait_stats"""
+        slept = dwell(self.pacing, seconds, since, sleep=self.cancel_token.sleep)
+        self.wait_stats.add(f"dwell:{name}", slept)
+
+    def _switch_to_card_frame(self, frame):
+        self.driver.switch_to.default_content()
+        if frame is not None:
+            self.driver.switch_to.frame(frame)
+
+    def _capture_dom(self, kind: str, frame=None):
+        """采集模式下保存当前页面快照；结束后回到 frame 所在文档（None 为主文档）"""
+        recorder = self.dom_recorder
+        if recorder is None or not recorder.due(kind):
+            return
+        with self.phases.phase("capture"):
+            try:
+                path = recorder.capture(self.driver, kind)
+                self.logger.info(f"已保存页面快照：{path}")
+            except Exception as e:
+                self.logger.warning(f"保存页面快照失败：{str(e)}")
+            try:
+                self._switch_to_card_frame(frame)
+            except Exception:
+                pass
+
+    @timed_phase("find_cards")
     def _find_cards_any_frame(self, selector: str):
-        """在主文档及所有 iframe 中查找卡片元素"""
+        """在主文档及所有 iframe 中查找卡片元素（优先使用缓存的位置）"""
+        locator = self.card_locator
+        if locator.resolved and locator.selector == selector:
+            try:
+                self._switch_to_card_frame(locator.frame)
+                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    locator.hit()
+                    return locator.frame, elements
+            except Exception as e:
+                pass
+            locator.miss()
+
+        frame, elements = self._probe_cards_any_frame(selector)
+        if elements:
+            locator.remember(frame, selector)
+        return frame, elements
+
+    def _probe_cards_any_frame(self, selector: str):
+        self.card_locator.probed()
         try:
             elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
             if elements:
@@ -161,29 +404,176 @@ class BoosDriver:
         self.driver.switch_to.default_content()
         return None, []
 
+    def _find_cards(self):
+        """按候选选择器查找卡片；已缓存命中位置时先试缓存的选择器"""
+        candidates = list(selectors.CARD_SELECTOR_CANDIDATES)
+        cached = self.card_locator.selector
+        if cached in candidates:
+            candidates.remove(cached)
+            candidates.insert(0, cached)
+        for selector in candidates:
+            frame, els = self._find_cards_any_frame(selector)
+            if els:
+                return frame, els
+        return None, []
+
+    def _snapshot_cards(self, cursor: ScanCursor | None = None) -> list[CardSnapshot]:
+        """在当前文档中一次性读取卡片快照；传入游标时只读取上次之后新增的卡片"""
+        start, anchor = cursor.args() if cursor else (0, None)
+        raw = self.driver.execute_script(SNAPSHOT_CARDS_JS, selectors.CARD_SELECTOR_CANDIDATES, start, anchor)
+        if cursor:
+            cursor.advance(raw)
+        return parse_snapshot(raw)
+
+    @timed_phase("scan")
+    def _snapshot_cards_any_frame(self, cursor: ScanCursor | None = None):
+        """在主文档及所有 iframe 中批量读取卡片快照（优先使用缓存的位置）。
+
+        传入游标时为增量扫描：缓存位置仍有效则只返回新增卡片（可能为空列表）。
+        """
+        locator = self.card_locator
+        if locator.resolved:
+            try:
+                self._switch_to_card_frame(locator.frame)
+                snapshots = self._snapshot_cards(cursor)
+                if snapshots or (cursor and cursor.position):
+                    locator.hit()
+                    if snapshots:
+                        locator.remember(locator.frame, snapshots[0].selector)
+                    return locator.frame, snapshots
+            except Exception as e:
+                pass
+            locator.miss()
+
+        # 重新探测位置后游标不再可信，从头读取
+        if cursor:
+            cursor.reset()
+        frame, snapshots = self._probe_snapshot_any_frame(cursor)
+        if snapshots:
+            locator.remember(frame, snapshots[0].selector)
+        return frame, snapshots
+
+    def _probe_snapshot_any_frame(self, cursor: ScanCursor | None = None):
+        self.card_locator.probed()
+        try:
+            snapshots = self._snapshot_cards(cursor)
+            if snapshots:
+                return None, snapshots
+        except Exception as e:
+            self.logger.error(f"读取卡片快照时出错（当前文档）：{str(e)}")
+
+        self.driver.switch_to.default_content()
+        snapshots = self._snapshot_cards(cursor)
+        if snapshots:
+            return None, snapshots
+
+        frames = self.driver.find_elements(By.CSS_SELECTOR, "iframe")
+        for frame in frames:
+            try:
+                self.driver.switch_to.default_content()
+                self.driver.switch_to.frame(frame)
+                snapshots = self._snapshot_cards(cursor)
+                if snapshots:
+                    return frame, snapshots
+            except Exception as e:
+                continue
+
+        self.driver.switch_to.default_content()
+        return None, []
+
+    def _locate_card(self, snapshot: CardSnapshot):
+        """根据快照在当前文档中重新定位卡片元素（只在真正要点击时调用）"""
+        if snapshot.geekid:
+            # geekid 可能含引号等特殊字符，在页面内用 CSS.escape 拼接选择器；找不到即卡片已不在页面中
+            return self.driver.execute_script(LOCATE_CARD_JS, snapshot.geekid)
+        if self.page_recycler.pruned_cards:
+            # 页面回收删过卡片后，快照里记录的下标可能已指向另一张卡片
+            return None
+        els = self.driver.find_elements(By.CSS_SELECTOR, snapshot.selector)
+        if snapshot.index < len(els):
+            return els[snapshot.index]
+        return None
+
+    def _recheck_candidate(self, element, scored: ScoredCard) -> ScoredCard | None:
+        """出队点击前按卡片当前状态重新打分（排队期间牛人可能已下线）；不再符合条件时返回 None"""
+        card = refresh_snapshot(scored.card, self.driver.execute_script(CARD_STATE_JS, element))
+        rescored = self.candidate_scorer.score(card)
+        if not card.visible or not self.candidate_scorer.eligible(rescored):
+            return None
+        return rescored
+
+    def _detect_current_job(self) -> str:
+        """读取推荐牛人页当前选中的职位名称，用作已处理记录的分组键"""
+        candidates = [selectors.JOB_ITEM_CURRENT_CSS, selectors.JOB_DROPDOWN_LABEL_CSS]
+        try:
+            self.driver.switch_to.default_content()
+            contexts = [None] + self.driver.find_elements(By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS)
+            for frame in contexts:
+                self.driver.switch_to.default_content()
+                if frame is not None:
+                    self.driver.switch_to.frame(frame)
+                for css in candidates:
+                    for el in self.driver.find_elements(By.CSS_SELECTOR, css):
+                        text = (el.get_attribute("textContent") or "").strip()
+                        if text:
+                            return text
+        except Exception as e:
+            self.logger.warning(f"读取当前职位失败：{str(e)}")
+        finally:
+            try:
+                self.driver.switch_to.default_content()
+            except Exception:
+                pass
+        return ""
+
     def _click_app_scan_login(self):
         self.logger.info("等待APP扫码登录按钮加载...")
-        wait = WebDriverWait(self.driver, 10)
+        wait = self._wait(10)
         app_scan_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selectors.APP_SCAN_SWITCH_CSS)))
         app_scan_btn.click()
         self.logger.info("已点击APP扫码登录按钮")
 
     def _get_qrcode(self):
         self.logger.info("等待二维码图片加载...")
-        wait = WebDriverWait(self.driver, 20)
+        wait = self._wait(20)
         qr_code = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selectors.QRCODE_IMG_CSS)))
         self.logger.info("二维码图片已显示")
         wait.until(lambda driver: qr_code.size["width"] > 0 and qr_code.size["height"] > 0)
         qr_code_url = qr_code.get_attribute("src")
         self.logger.info(f"二维码URL: {qr_code_url}")
+        self._publish_qrcode(qr_code, qr_code_url, refreshed=False)
+
+    def _read_qrcode_png(self, qr_img, src: str | None = None) -> bytes | None:
+        """直接从已加载的页面取二维码图片字节：data: URI 直接解码，否则对元素截图，不再额外下载"""
+        if src and src.startswith("data:"):
+            header, _, payload = src.partition(",")
+            try:
+                return base64.b64decode(payload) if header.endswith(";base64") else payload.encode()
+            except ValueError:
+                pass
+        return qr_img.screenshot_as_png
+
+    def _publish_qrcode(self, qr_img, src: str | None, refreshed: bool):
+        try:
+            png = self._read_qrcode_png(qr_img, src)
+        except WebDriverException as e:
+            self.logger.warning(f"读取二维码图片失败: {str(e)}")
+            return
+        if png:
+            self._on_qrcode_image(png, refreshed)
+
+    def _on_qrcode_image(self, png: bytes, refreshed: bool):
+        """二维码图片就绪（首次加载或失效刷新后）；子类可覆盖以展示图片"""
+        self.logger.info(f"{'新的' if refreshed else ''}二维码图片已就绪（{len(png)} 字节）")
 
     def _close_download_popup_if_present(self, timeout_seconds: int = 3):
         try:
-            wait = WebDriverWait(self.driver, timeout_seconds)
+            wait = self._wait(timeout_seconds)
             try:
                 wait.until(EC.visibility_of_element_located((By.XPATH, selectors.DOWNLOAD_LINK_XPATH)))
             except TimeoutException:
                 return
+            self._capture_dom("download_popup")
 
             try:
                 close_btn = wait.until(EC.element_to_be_clickable((By.XPATH, selectors.DOWNLOAD_CLOSE_ICON_XPATH)))
@@ -201,7 +591,7 @@ class BoosDriver:
 
     def _click_recommend_talents(self):
         self.logger.info("准备点击推荐牛人按钮")
-        wait = WebDriverWait(self.driver, 10)
+        wait = self._wait(10)
         recommend_btn = None
         for kind, value in selectors.RECOMMEND_TALENTS_SELECTORS:
             try:
@@ -221,19 +611,165 @@ class BoosDriver:
 
     # -------- 核心工具：滚动与翻页 --------
 
-    def _scroll_down_list(self):
-        """【打招呼模式专用】向下滚动列表，触发加载更多"""
+    @timed_phase("scroll")
+    def _scroll_down_list(self, timeout: float | None = None) -> ScrollResult:
+        """【打招呼模式专用】滚动列表容器到底，等待新卡片加载（新卡片出现即返回）"""
+        timeout = self.scroll_wait_timeout if timeout is None else timeout
         self.logger.info("执行向下滚动 (Loading More)...")
         try:
-            # 1. 尝试滚动到页面底部
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-
-            # 2. 尝试发送 PageDown 键（辅助触发）
-            ActionChains(self.driver).send_keys(Keys.PAGE_DOWN).perform()
-            time.sleep(3)  # 等待新数据加载
+            # 1. 进入卡片所在的文档（优先使用缓存的位置）
+            locator = self.card_locator
+            if locator.resolved:
+                try:
+                    self._switch_to_card_frame(locator.frame)
+                except Exception:
+                    locator.miss()
+            if not locator.resolved:
+                self._find_cards()
+
+            # 2. 滚动真正的列表容器，并分段等待卡片数量增长（段间检查是否已取消）
+            slice_s = min(self.scroll_wait_slice, timeout)
+            if self._script_timeout is None or self._script_timeout < slice_s + 5:
+                self._script_timeout = slice_s + 5
+                self.driver.set_script_timeout(self._script_timeout)
+            deadline = time.monotonic() + timeout
+            raw = self.driver.execute_async_script(
+                SCROLL_AND_WAIT_JS, selectors.CARD_SELECTOR_CANDIDATES, int(slice_s * 1000), None
+            )
+            result = parse_scroll_result(raw)
+            while not result.grew and time.monotonic() < deadline:
+                self.cancel_token.raise_if_cancelled()
+                wait_ms = int(min(slice_s, deadline - time.monotonic()) * 1000)
+                if wait_ms <= 0:
+                    break
+                raw = self.driver.execute_async_script(
+                    SCROLL_AND_WAIT_JS, selectors.CARD_SELECTOR_CANDIDATES, wait_ms, result.before
+                )
+                result = parse_scroll_result(raw)
+            if result.grew:
+                self.logger.info(f"加载了 {result.new_cards} 个新卡片（共 {result.after} 个）")
+            else:
+                self.logger.info("滚动后没有新卡片加载")
+            return result
         except Exception as e:
             self.logger.warning(f"向下滚动失败: {str(e)}")
+            return ScrollResult(before=0, after=0, at_bottom=True)
+
+    # -------- 长时间运行：页面回收 --------
+
+    def _recycle_page_if_due(self, frame, cursor: ScanCursor, job: str) -> bool:
+        """扫描前检查是否需要回收页面（只在候选队列为空时调用）；回收后返回 True"""
+        recycler = self.page_recycler
+        if not recycler.policy.enabled or cursor.position == 0:
+            return False
+        if recycler.heap_sample_due():
+            try:
+                self._switch_to_card_frame(frame)
+                stats = self.driver.execute_script(PAGE_STATS_JS, selectors.CARD_SELECTOR_CANDIDATES) or {}
+                recycler.record_heap(stats.get("heap_bytes"))
+            except Exception as e:
+                self.logger.warning(f"读取页面内存失败：{str(e)}")
+                recycler.record_heap(None)
+            if recycler.last_heap_mb is not None:
+                self.funnel.browser_heap_mb.set(recycler.last_heap_mb)
+
+        reason = recycler.due(cursor.position)
+        if reason is None:
+            return False
+        return self._recycle_page(frame, cursor, job, reason)
+
+    @timed_phase("recycle")
+    def _recycle_page(self, frame, cursor: ScanCursor, job: str, reason: str) -> bool:
+        recycler = self.page_recycler
+        removed = 0
+        try:
+            if recycler.policy.mode == "prune":
+                # 游标之前的卡片都已评估过；保留最后一张作为增量扫描的锚点
+                self._switch_to_card_frame(frame)
+                raw = self.driver.execute_script(
+                    PRUNE_CARDS_JS, selectors.CARD_SELECTOR_CANDIDATES, cursor.position - 1
+                ) or {}
+                removed = int(raw.get("removed") or 0)
+                cursor.shift(removed)
+                self.logger.info(f"页面回收（{reason}）：已移除 {removed} 张处理过的卡片")
+            else:
+                self._reload_recommend_frame(job)
+                cursor.reset()
+                self.logger.info(f"页面回收（{reason}）：已重新加载推荐列表")
+        except Exception as e:
+            self.logger.warning(f"页面回收失败：{str(e)}")
+            # 同样重新计时，避免每次扫描都重试
+            recycler.recycled("failed")
+            return False
+        recycler.recycled(reason, removed)
+        self.funnel.page_recycles.inc()
+        return True
+
+    def _reload_recommend_frame(self, job: str):
+        """重新加载推荐牛人 iframe，等待新卡片出现后恢复筛选条件与职位"""
+        driver = self.driver
+        driver.switch_to.default_content()
+        frames = driver.find_elements(By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS)
+        if frames:
+            # 给旧文档打标记，据此区分新旧文档
+            driver.execute_script(
+                "arguments[0].contentWindow.__boosStale = true; arguments[0].contentWindow.location.reload();",
+                frames[0],
+            )
+        else:
+            driver.refresh()
+            self._click_recommend_talents()
+
+        def reloaded():
+            driver.switch_to.default_content()
+            frames = driver.find_elements(By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS)
+            if not frames:
+                return False
+            driver.switch_to.frame(frames[0])
+            return driver.execute_script(
+                "return !window.__boosStale && !!document.querySelector(arguments[0]);",
+                selectors.CARD_SELECTOR_CANDIDATES[-1],
+            )
+
+        if not self._wait_ready("frame_reloaded", reloaded, timeout=15):
+            raise TimeoutException("推荐列表重新加载超时")
+        self._restore_recommend_state(job)
+
+    def _restore_recommend_state(self, job: str):
+        """iframe 重新加载后：应用上次的筛选条件，并切回原来的职位"""
+        recover = self._wait_ready(
+            "recover_filter",
+            lambda: self._find_displayed([(By.CSS_SELECTOR, selectors.RECOVER_LAST_FILTER_APPLY_CSS)]),
+            timeout=2,
+        )
+        if recover is not None:
+            self._safe_click(recover)
+            self.logger.info("已应用上次的筛选条件")
+        if job and self._detect_current_job() != job:
+            if self._select_job(job):
+                self.logger.info(f"已切回职位：{job}")
+            else:
+                self.logger.warning(f"未能切回职位：{job}")
+
+    def _select_job(self, job: str) -> bool:
+        """在顶部职位下拉中选中指定职位"""
+        driver = self.driver
+        driver.switch_to.default_content()
+        contexts = [None] + driver.find_elements(By.CSS_SELECTOR, selectors.RECOMMEND_FRAME_CSS)
+        try:
+            for frame in contexts:
+                self._switch_to_card_frame(frame)
+                labels = driver.find_elements(By.CSS_SELECTOR, selectors.JOB_DROPDOWN_LABEL_CSS)
+                if not labels:
+                    continue
+                self._safe_click(labels[0])
+                for item in driver.find_elements(By.CSS_SELECTOR, selectors.JOB_ITEM_CSS):
+                    if (item.get_attribute("textContent") or "").strip() == job:
+                        self._safe_click(item)
+                        return True
+        except Exception as e:
+            self.logger.warning(f"切换职位失败：{str(e)}")
+        return False
 
     def _turn_page_right_detail(self):
         """【刷浏览量模式专用】在详情页按右键，切换下一位"""
@@ -246,7 +782,8 @@ class BoosDriver:
 
     # -------- 核心逻辑：自动打招呼 --------
 
-    def _handle_limit_dialog(self) -> bool:
+    @timed_phase("limit_dialog")
+    def _handle_limit_dialog(self, timeout_seconds: float = 2) -> bool:
         """检查并处理每日沟通上限提示。返回 True 表示遇到了上限。"""
         try:
             # 1. 检测是否有“今日主动沟通数已达上限”的文本
@@ -256,25 +793,21 @@ class BoosDriver:
             except:
                 pass
 
-            # 使用 contains 文本匹配，比较稳健
-            xpath_text = "//h3[contains(text(), '今日主动沟通数已达上限')]"
-
-            # 快速检查是否存在上限提示元素
+            # 快速检查是否存在上限提示元素（使用 contains 文本匹配，比较稳健）
             try:
-                # 显式等待短时间
-                wait = WebDriverWait(self.driver, 2)
-                el = wait.until(EC.presence_of_element_located((By.XPATH, xpath_text)))
-                if not el.is_displayed():
-                    return False
+                # 显式等待短时间；弹窗节点可能一直在文档中只是隐藏，要等到它可见，而不是只要存在
+                wait = self._wait(timeout_seconds)
+                el = wait.until(EC.visibility_of_element_located((By.XPATH, selectors.LIMIT_DIALOG_XPATH)))
             except TimeoutException:
                 return False
+            self._capture_dom("limit_dialog")
 
             self.logger.warning("【检测到】今日主动沟通数已达上限！准备关闭弹窗...")
 
             # 2. 尝试多种方式关闭弹窗
             close_strategies = [
                 (By.CSS_SELECTOR, ".boss-popup__close"),  # HTML中看到的类名
-                (By.XPATH, "/html/body/div[7]/div[1]/div[2]/i"),  # 用户指定的XPath
+                (By.XPATH, selectors.LIMIT_DIALOG_CLOSE_XPATH),  # 用户指定的XPath
                 (By.CSS_SELECTOR, ".dialog-close"),  # 常见备用
                 (By.CSS_SELECTOR, ".close-icon"),  # 常见备用
             ]
@@ -289,7 +822,6 @@ class BoosDriver:
                             # 强制使用JS点击，因为可能有遮罩层
                             self.driver.execute_script("arguments[0].click();", btn)
                             closed = True
-                            time.sleep(1)
                             break
                     if closed: break
                 except Exception as e:
@@ -299,8 +831,9 @@ class BoosDriver:
             if not closed:
                 self.logger.warning("未找到明确的关闭按钮，尝试按ESC键强行关闭...")
                 ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                time.sleep(1)
 
+            # 等待弹窗关闭动画结束
+            self._wait_ready("limit_dialog_closed", lambda: not el.is_displayed(), 1)
             return True
 
         except Exception as e:
@@ -316,149 +849,246 @@ class BoosDriver:
         self.logger.info(f"开始执行自动打招呼，目标人数：{target_count}")
 
         greeted_count = 0
-        processed_ids = set()
+        job = self._detect_current_job()
+        store = self.processed_store
+        self.logger.info(f"当前职位：{job or '未知'}")
+        idle_scrolls = 0
+        funnel = self.funnel
+        funnel.task_started()
+        self.page_recycler.reset()
+        # 一次扫描得到的候选人按得分排队依次处理，队列空了才再扫描（且只扫描新增卡片）
+        queue: deque[ScoredCard] = deque()
+        cursor = ScanCursor()
+        frame = None
+        # 本次任务已评估过的卡片；页面回收（重新加载列表）后不再重复评估
+        evaluated = self._new_evaluated_set()
 
-        while greeted_count < target_count:
-            # 1. 查找当前页面所有可见卡片
-            cards = []
-
-            for selector in selectors.CARD_SELECTOR_CANDIDATES:
-                frame, els = self._find_cards_any_frame(selector)
-                if els:
-                    cards = [e for e in els if e.is_displayed()]
-                    if cards:
+        try:
+            while greeted_count < target_count:
+                self.cancel_token.raise_if_cancelled()
+                if not self.match_queue_enabled:
+                    # 旧行为：每次打招呼后从头全量重新扫描
+                    queue.clear()
+                    cursor.reset()
+                    evaluated.clear()
+
+                if not queue:
+                    if idle_scrolls >= self.max_idle_scrolls:
+                        self.logger.warning(f"连续 {idle_scrolls} 次滚动都没有新卡片，列表已到底，结束任务。")
                         break
 
-            # 如果当前视图没卡片，直接滚动加载
-            if not cards:
-                self.logger.warning("当前视图未找到可见卡片，向下滚动刷新...")
-                self._scroll_down_list()
-                continue
+                    # 长时间运行：卡片过多 / 内存过高 / 运行过久时先回收页面
+                    self._recycle_page_if_due(frame, cursor, job)
 
-            # 2. 筛选符合条件的卡片
-            target_card = None
-            target_id = None
+                    # 1. 一次脚本调用读取上次扫描之后新增的卡片快照
+                    scan_start = time.perf_counter()
+                    frame, snapshots = self._snapshot_cards_any_frame(cursor)
+                    cards = [c for c in snapshots if c.visible and c.geekid not in evaluated]
+                    funnel.scan_seconds.observe(time.perf_counter() - scan_start)
+                    self._capture_dom("recommend", frame)
 
-            for card in cards:
-                try:
-                    gid = card.get_attribute("data-geekid")
-                    if gid in processed_ids:
+                    # 没有新卡片，直接滚动加载
+                    if not cards:
+                        self.logger.info("当前视图无新的卡片，向下滚动加载更多...")
+                        idle_scrolls = 0 if self._scroll_down_list().grew else idle_scrolls + 1
                         continue
 
-                    text_content = card.text
-                    has_keyword = any(kw in text_content for kw in self.target_keywords)
-
-                    is_online = False
-                    try:
-                        online_icon = card.find_element(By.CSS_SELECTOR, ".online-marker")
-                        if online_icon.is_displayed():
-                            is_online = True
-                    except:
-                        is_online = False
-
-                    if has_keyword and is_online:
-                        target_card = card
-                        target_id = gid
-                        self.logger.info(f"找到匹配牛人 [在线]: {text_content.replace(chr(10), ' ')[:30]}...")
-                        break
-
-                except Exception as e:
-                    continue
+                    # 2. 在 Python 侧打分排序，得到本批候选队列
+                    self.phases.incr("cards_scanned", len(cards))
+                    with self.phases.phase("match"):
+                        funnel.observe_cards(cards, self.keyword_matcher)
+                        evaluated.update(c.geekid for c in cards if c.geekid)
+                        processed_ids = store.seen([c.geekid for c in cards], job)
+                        queue.extend(self.candidate_scorer.rank(cards, exclude=processed_ids))
+
+                    if not queue:
+                        self.logger.info("新卡片中没有符合条件的牛人，向下滚动加载更多...")
+                        idle_scrolls = 0 if self._scroll_down_list().grew else idle_scrolls + 1
+                        continue
+                    self.logger.info(f"本次扫描 {len(cards)} 张新卡片，符合条件 {len(queue)} 人")
 
-            # 3. 执行操作
-            if target_card:
-                processed_ids.add(target_id)
+                # 3. 依次处理队列中的候选人：点击前按 data-geekid 重新定位元素
+                best = queue.popleft()
+                target_card, target_id = best.card, best.card.geekid
+                self.logger.info(f"找到匹配牛人 [在线] 得分 {best.score:g}（{'/'.join(best.hits)}）: {target_card.summary[:30]}...")
                 try:
                     self.logger.info(f"[{greeted_count + 1}/{target_count}] 正在点击牛人名片...")
-                    self._safe_click(target_card)
+                    greet_start = time.perf_counter()
+                    with self.phases.phase("click"):
+                        self._switch_to_card_frame(frame)
+                        element = self._locate_card(target_card)
+                        current = self._recheck_candidate(element, best) if element is not None else None
+                        if current is not None:
+                            store.record(target_id, job, "opened")
+                            self._safe_click(element)
+                    if element is None:
+                        store.record(target_id, job, "skipped")
+                        self.logger.warning("卡片已不在页面中，跳过此人")
+                        continue
+                    if current is None:
+                        # 不写入已处理记录：暂时离线的牛人在之后的任务（或 evaluated 过期后）仍会被重新评估
+                        self.logger.info("牛人已不符合条件（如已离线），本次跳过")
+                        continue
+                    funnel.clicked.inc()
 
                     status = self._perform_detail_actions()
+                    store.record(target_id, job, "greeted" if status == "SUCCESS" else "failed")
+                    funnel.greet_finished(status, time.perf_counter() - greet_start)
 
                     if status == "LIMIT_REACHED":
-                        print("\n" + "!" * 40)
-                        print("【停止任务】今日主动沟通数已达上限（需付费购买）。")
-                        print("已自动退出详情页，正在返回主菜单...")
-                        print("!" * 40 + "\n")
-                        return  # 直接返回，结束 _run_greet_loop
+                        self._on_limit_reached()
+                        break
                     elif status == "SUCCESS":
                         greeted_count += 1
+                        idle_scrolls = 0
+                        self.phases.incr("greeted")
                         self.logger.info(f"成功打招呼！当前进度: {greeted_count}/{target_count}")
+                        self._on_task_progress("greet", greeted_count, target_count)
                     else:
                         self.logger.warning("打招呼流程未完全成功，跳过此人")
 
                 except Exception as e:
+                    store.record(target_id, job, "failed")
                     self.logger.error(f"处理牛人卡片时出错: {str(e)}")
-            else:
-                self.logger.info("当前视图无更多符合条件的牛人，向下滚动加载更多...")
-                self._scroll_down_list()
-
-        self.logger.info("已达到目标打招呼人数。")
-
+        except TaskCancelled:
+            self.logger.info("用户停止了任务")
+
+        if greeted_count >= target_count:
+            self.logger.info("已达到目标打招呼人数。")
+        self.logger.info(f"已评估卡片去重统计：{evaluated.stats()}")
+        self._finish_task()
+
+    # -------- 任务进度回调（GUI 版覆盖以转发给界面） --------
+    def _on_task_progress(self, task: str, done: int, target: int = 0):
+        """greet：已打招呼 / 目标人数；browse：已翻页数"""
+
+    def _on_limit_reached(self):
+        print("\n" + "!" * 40)
+        print("【停止任务】今日主动沟通数已达上限（需付费购买）。")
+        print("已自动退出详情页，正在返回主菜单...")
+        print("!" * 40 + "\n")
+
+    def _new_evaluated_set(self) -> CompactIdSet:
+        return CompactIdSet(max_items=self.evaluated_max_ids, ttl_seconds=self.evaluated_ttl)
+
+    def _finish_task(self):
+        """任务结束（无论正常结束还是中途退出）时调用"""
+        self.cancel_token.reset()
+        self.funnel.task_finished()
+        self._log_task_stats()
+
+    def _log_task_stats(self):
+        self.logger.info(f"卡片定位缓存统计：{self.card_locator.stats()}")
+        self.logger.info(f"页面回收统计：{self.page_recycler.stats()}")
+        if self.dom_recorder is not None:
+            self.logger.info(f"页面快照统计：{self.dom_recorder.counts}")
+        self.logger.info(f"等待耗时统计：{self.wait_stats.summary()}")
+        self.logger.info(f"阶段耗时统计：{self.phases.summary()}")
+        if self.command_stats is not None:
+            self.logger.info(f"WebDriver 命令统计（共 {self.command_stats.total} 次）：\n{self.command_stats.format_table()}")
+
+    @timed_phase("close")
     def _close_detail_page(self):
         """关闭详情页的通用方法"""
+        locators = [
+            (By.XPATH, selectors.DETAIL_CLOSE_XPATH),
+            (By.CSS_SELECTOR, selectors.DETAIL_CLOSE_CSS),
+        ]
+
+        # 详情弹层与卡片在同一文档中时（例如 recommendFrame 内），当前文档即可直接找到关闭按钮
+        close_btn = None
         try:
-            self.driver.switch_to.default_content()
-        except:
+            close_btn = self._find_displayed(locators)
+        except Exception:
             pass
 
-        close_xpath = "/html/body/div[2]/div[1]/div[2]/i"
         try:
-            wait = WebDriverWait(self.driver, 3)
-            close_btn = wait.until(EC.element_to_be_clickable((By.XPATH, close_xpath)))
+            if close_btn is None:
+                try:
+                    self.driver.switch_to.default_content()
+                except:
+                    pass
+                close_btn = self._wait_ready("close_button", lambda: self._find_displayed(locators), 3)
+            if close_btn is None:
+                raise NoSuchElementException("未找到详情页关闭按钮")
             self._safe_click(close_btn)
             self.logger.info("已关闭详情页")
         except Exception:
+            ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+        finally:
             try:
-                close_btn = self.driver.find_element(By.CSS_SELECTOR, ".iboss-close, .dialog-close")
-                self.driver.execute_script("arguments[0].click();", close_btn)
-            except Exception:
-                ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
+                self.driver.switch_to.default_content()
+            except:
+                pass
+
+    def _find_greet_button(self):
+        return self._find_displayed([
+            (By.XPATH, selectors.DETAIL_GREET_BUTTON_XPATH),
+            (By.CSS_SELECTOR, selectors.DETAIL_GREET_BUTTON_CSS),
+        ])
 
+    def _greet_outcome(self, btn, before_text: str):
+        """打招呼后的结果：'limit' / 'greeted'，尚无变化时返回 None"""
+        try:
+            return self.driver.execute_script(GREET_OUTCOME_JS, btn, before_text, selectors.LIMIT_DIALOG_XPATH)
+        except StaleElementReferenceException:
+            # 按钮已被替换，说明状态已经变化
+            return "greeted"
+
+    @timed_phase("detail")
     def _perform_detail_actions(self) -> str:
         """
-        进入详情页后的动作：停留5s -> 打招呼 -> 检查上限 -> 停留3s -> 关闭
+        进入详情页后的动作：等待详情渲染 -> 停留 -> 打招呼 -> 等待结果/检查上限 -> 停留 -> 关闭
+        就绪等待条件满足即继续；停留时长由 self.pacing 决定。
         返回状态: 'SUCCESS', 'FAILED', 'LIMIT_REACHED'
         """
+        pacing = self.pacing
+        entered_at = time.monotonic()
         try:
-            self.logger.info("进入详情，停留 5 秒...")
-            time.sleep(5)
+            # 1. 等待详情面板渲染（打招呼按钮出现）
+            btn = self._wait_ready("detail_panel", self._find_greet_button, pacing.ready_timeout)
+            if btn is not None:
+                self._capture_dom("detail", self.card_locator.frame)
 
-            # 点击打招呼
-            greet_btn_xpath = "/html/body/div[2]/div[1]/div[1]/div/div/div[1]/div/div[2]/div/div/div[1]/div/div/div[2]/div/span/div/button"
-            greet_clicked = False
+            # 2. 刻意停留（从进入详情开始计时，页面加载时间已包含在内）
+            self._dwell("detail", pacing.detail_dwell, since=entered_at)
 
-            try:
-                # 尝试查找并点击
-                btn = self.driver.find_element(By.XPATH, greet_btn_xpath)
+            # 3. 点击打招呼
+            greet_clicked = False
+            if btn is None:
+                self.logger.error("未找到打招呼按钮")
+            else:
+                before_text = (btn.text or "").strip()
                 self._safe_click(btn)
                 greet_clicked = True
                 self.logger.info("已点击打招呼按钮")
-            except Exception as e:
-                try:
-                    btn = self.driver.find_element(By.CSS_SELECTOR, ".btn.btn-greet")
-                    self._safe_click(btn)
-                    greet_clicked = True
-                except Exception as e:
-                    self.logger.error(f"未找到打招呼按钮: {str(e)}")
 
             if greet_clicked:
-                # 点击后等待一下，检查是否出现上限提示
-                time.sleep(2)
-
-                # 检查是否出现上限弹窗
-                if self._handle_limit_dialog():
-                    time.sleep(1)  # 等待弹窗关闭动画
+                # 等待按钮状态变化或上限弹窗出现
+                clicked_at = time.monotonic()
+                self._wait_ready("greet_result", lambda: self._greet_outcome(btn, before_text), pacing.ready_timeout)
+                # 无论结果如何都检查上限弹窗：按钮文字可能先变化，弹窗随后才出现
+                limit_reached = self._handle_limit_dialog(timeout_seconds=pacing.limit_check)
+                # 上限弹窗在主文档中，回到卡片所在文档再关闭详情页
+                self._switch_to_card_frame(self.card_locator.frame)
+                if limit_reached:
                     self._close_detail_page()  # 关闭详情页
                     return "LIMIT_REACHED"
+                # 检查弹窗的等待计入打招呼后的停留
+                self._dwell("after_greet", pacing.after_greet, since=clicked_at)
 
-            self.logger.info("停留 3 秒...")
-            time.sleep(3)
+            self._dwell("before_close", pacing.before_close)
 
             # 关闭详情页
             self._close_detail_page()
 
             return "SUCCESS" if greet_clicked else "FAILED"
 
+        except TaskCancelled:
+            # 停止任务时同样关闭详情页，回到列表
+            with self.cancel_token.shielded():
+                self._close_detail_page()
+            raise
         except Exception as e:
             self.logger.error(f"详情页操作异常: {str(e)}")
             try:
@@ -476,49 +1106,51 @@ class BoosDriver:
         2. 循环：按右键 (向右翻页)，默认限制时长
         """
         self.logger.info(f"准备进入刷浏览量模式，默认限时 {max_minutes} 分钟...")
+        self.funnel.task_started()
 
-        cards = []
-        for selector in selectors.CARD_SELECTOR_CANDIDATES:
-            frame, els = self._find_cards_any_frame(selector)
-            if els:
-                cards = [e for e in els if e.is_displayed()]
-                if cards:
-                    break
+        try:
+            frame, els = self._find_cards()
+            cards = [e for e in els if e.is_displayed()]
+
+            if not cards:
+                # 没有打开详情页时按右方向键没有任何作用，直接结束任务
+                self.logger.warning("未找到卡片，无法进入详情页，结束刷浏览量任务。")
+                self._finish_task()
+                return
 
-        if cards:
             self.logger.info("正在打开第一个牛人卡片，进入详情页...")
             self._safe_click(cards[0])
-            time.sleep(3)  # 等待详情打开
-        else:
-            self.logger.warning("未找到卡片，无法进入详情页，请手动打开一个详情页。")
-            self._scroll_down_list()
+            self._sleep(3)  # 等待详情打开
 
-        self.logger.info(f"开始执行翻页（每3秒按一次右方向键）。限时 {max_minutes} 分钟。按 Ctrl+C 可在控制台中断。")
-        print(f"\n正在刷浏览量... (程序将在详情页不断按 '→' 键切换下一位，限时 {max_minutes} 分钟)")
+            self.logger.info(f"正在刷浏览量：在详情页每3秒按一次右方向键切换下一位，限时 {max_minutes} 分钟。")
 
-        start_time = time.time()
-        end_time = start_time + (max_minutes * 60)
+            start_time = time.time()
+            end_time = start_time + (max_minutes * 60)
 
-        try:
+            pages = 0
             while time.time() < end_time:
                 self._turn_page_right_detail()
+                self.funnel.browse_pages.inc()
+                pages += 1
+                self._on_task_progress("browse", pages)
 
                 # 偶尔输出一下剩余时间
                 remaining = int(end_time - time.time())
                 if remaining > 0 and remaining % 60 == 0:
                     self.logger.info(f"剩余时间: {remaining // 60} 分钟")
 
-                time.sleep(3)
+                self._sleep(3)
 
             self.logger.info("刷浏览量任务时间结束。")
-            print("\n时间到，已结束刷浏览量任务，返回主菜单。")
 
-            # 任务结束，尝试退出详情页
-            self._close_detail_page()
-
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, TaskCancelled):
             self.logger.info("用户中断刷浏览量模式。")
 
+        # 任务结束（含中途停止），尝试退出详情页
+        with self.cancel_token.shielded():
+            self._close_detail_page()
+        self._finish_task()
+
     # -------- 新增：扫码检测逻辑 --------
     def _wait_for_scan_login(self):
         """轮询检测是否扫码成功，以及二维码是否需要刷新"""
@@ -549,45 +1181,66 @@ class BoosDriver:
                     btn = invalid_box_btns[0]
                     if btn.is_displayed():
                         self.logger.warning("检测到二维码已失效，正在自动点击刷新...")
+                        old_imgs = self.driver.find_elements(By.CSS_SELECTOR, selectors.QRCODE_IMG_CSS)
+                        old_src = old_imgs[0].get_attribute("src") if old_imgs else None
                         self._safe_click(btn)
-                        # 等待刷新动画
-                        time.sleep(3)
+                        # 等待新二维码加载完成（src 变化且图片解码完毕），而不是固定等待刷新动画
+                        self._wait_ready("qrcode_refreshed", lambda: self.driver.execute_script(
+                            "const img = document.querySelector(arguments[0]);"
+                            "return !!img && img.src !== arguments[1] && img.complete && img.naturalWidth > 0;",
+                            selectors.QRCODE_IMG_CSS, old_src,
+                        ), timeout=5)
                         self.logger.info("二维码已刷新。")
 
-                        # --- 获取新二维码URL ---
+                        # --- 取新二维码图片并推送 ---
                         try:
                             # 重新查找二维码图片元素
                             qr_img = self.driver.find_element(By.CSS_SELECTOR, selectors.QRCODE_IMG_CSS)
                             new_src = qr_img.get_attribute("src")
                             self.logger.info(f"新的二维码URL: {new_src}")
+                            self._publish_qrcode(qr_img, new_src, refreshed=True)
                         except Exception as e:
-                            self.logger.warning(f"获取新二维码URL失败: {str(e)}")
+                            self.logger.warning(f"获取新二维码失败: {str(e)}")
                         # ---------------------
             except Exception as e:
                 pass
 
-            time.sleep(1)
+            self._sleep(1)
 
     # -------- 对外 API --------
-    def login_and_run(self):
-        self.logger.info("=" * 50)
-        self.logger.info("开始BOSS直聘自动流程")
-        self.logger.info("=" * 50)
+    def _on_login_status(self, message: str):
+        """登录流程的阶段提示；子类可覆盖以显示在界面上"""
+        self.logger.info(message)
 
+    def login(self):
+        """打开首页并完成登录，最后进入推荐牛人页（命令行与 GUI 共用）。
+
+        优先复用本地 cookie 或持久化配置中的登录态，失效时扫码登录，阻塞到扫码成功或任务被取消。
+        """
+        self._on_login_status("正在打开BOSS直聘首页...")
         try:
-            self.driver.get("https://www.zhipin.com/")
+            self.driver.get(self.base_url)
         except Exception as e:
             self.logger.error(f"打开BOSS直聘首页时出错：{str(e)}")
 
-        self._inject_cookies_if_present()
+        self._mark_startup("homepage")
+        applied = self._inject_cookies_if_present()
+        self._mark_startup("cookies")
         self._close_download_popup_if_present(timeout_seconds=2)
         self._click_login_if_present(timeout_seconds=3)
 
-        if self._has_recommend_talents_menu(timeout_seconds=4):
+        # 既没有可用 cookie 也不是热启动时不可能已登录，跳过登录入口探测直接扫码
+        session_possible = applied > 0 or self.warm_start
+        if session_possible:
+            self._on_login_status("正在验证登录态...")
+        if session_possible and self._has_recommend_talents_menu(timeout_seconds=4):
             self.logger.info("已检测到推荐牛人入口，视为登录成功")
+            self._mark_startup("session_ready")
+            self._log_startup_report()
             self._persist_cookies()
             self._close_download_popup_if_present(timeout_seconds=2)
         else:
+            self._on_login_status("等待扫码登录...")
             self._click_app_scan_login()
             self._get_qrcode()
 
@@ -600,6 +1253,13 @@ class BoosDriver:
         self._click_recommend_talents()
         self._close_download_popup_if_present(timeout_seconds=2)
 
+    def login_and_run(self):
+        self.logger.info("=" * 50)
+        self.logger.info("开始BOSS直聘自动流程")
+        self.logger.info("=" * 50)
+
+        self.login()
+
         self.logger.info("等待用户手动筛选...")
         print("\n" + "=" * 40)
         print("【步骤1】请在浏览器中手动选择：")
@@ -638,7 +1298,40 @@ class BoosDriver:
             else:
                 print("无效的选择，请重新输入。")
 
+    def clear_session(self):
+        """退出登录：删除本地 cookies.json；持久化配置模式下同时清空浏览器里的 cookie"""
+        if os.path.exists(self.cookie_path):
+            try:
+                os.remove(self.cookie_path)
+            except OSError as e:
+                self.logger.warning(f"删除 cookies 文件失败：{str(e)}")
+        if self.profile_dir:
+            try:
+                mark_profile_warm(self.profile_dir, False)
+                self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception as e:
+                self.logger.warning(f"清除浏览器 cookie 失败：{str(e)}")
+
     def close(self):
         self.logger.info("正在关闭浏览器...")
-        self.driver.quit()
+        try:
+            self.driver.quit()
+        except Exception as e:
+            # quit 失败时浏览器可能已无响应，直接结束驱动进程，避免残留
+            self.logger.warning(f"正常退出浏览器失败，强制结束驱动进程：{str(e)}")
+            self._kill_driver_process()
+        finally:
+            self.processed_store.close()
+            for exporter in self._metrics_exporters:
+                exporter.stop()
         self.logger.info("浏览器已关闭")
+
+    def _kill_driver_process(self):
+        process = getattr(getattr(self.driver, "service", None), "process", None)
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.kill()
+            process.wait(timeout=5)
+        except Exception as e:
+            self.logger.warning(f"结束驱动进程失败：{str(e)}")
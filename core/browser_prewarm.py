@@ -0,0 +1,90 @@
+"""浏览器预热：在用户操作界面的同时于后台启动 msedgedriver 与浏览器。
+
+首次登录时直接取走已就绪的实例，省去等待浏览器启动的时间；
+没有被取走的实例在程序退出时关闭，不会残留浏览器进程。
+本模块不直接依赖 selenium，浏览器由调用方传入的 factory 创建。
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+
+class BrowserPrewarmer:
+    def __init__(self, factory: Callable[[], object], logger: logging.Logger | None = None):
+        self._factory = factory
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._driver = None
+        self._closed = False
+        self.startup_seconds: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._driver is not None
+
+    def start(self):
+        """开始后台预热；已有实例在启动中或尚未被取走时不重复启动"""
+        with self._lock:
+            if self._closed or self._driver is not None:
+                return
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._done.clear()
+            self._thread = threading.Thread(target=self._run, name="BrowserPrewarm", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            driver = self._factory()
+        except Exception as e:
+            self.logger.warning(f"浏览器预热失败，将在登录时再启动：{str(e)}")
+            self._done.set()
+            return
+
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._driver = driver
+                self.startup_seconds = time.perf_counter() - start
+        if closed:
+            # 启动期间程序已退出，直接关掉
+            self._quit(driver)
+        else:
+            self.logger.info(f"浏览器已在后台预热完成（{self.startup_seconds:.1f}s）")
+        self._done.set()
+
+    def acquire(self, timeout: float | None = None):
+        """取走预热好的浏览器（每个实例只交付一次）。
+
+        仍在启动中则等待其完成；没有启动过、启动失败或等待超时返回 None，由调用方自行创建。
+        """
+        with self._lock:
+            if self._thread is None:
+                return None
+        self._done.wait(timeout)
+        with self._lock:
+            driver, self._driver = self._driver, None
+        return driver
+
+    def shutdown(self, timeout: float = 15.0):
+        """关闭未被取走的实例；仍在启动中的最多等待 timeout 秒"""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        with self._lock:
+            driver, self._driver = self._driver, None
+        if driver is not None:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"关闭预热浏览器失败：{str(e)}")
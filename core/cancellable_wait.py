@@ -0,0 +1,39 @@
+"""可取消的显式等待，用法与 WebDriverWait 相同（wait.until(EC.xxx(...))）。
+
+WebDriverWait 在两次轮询之间直接 time.sleep，点击“停止”后要等当前等待超时才能退出；
+这里改为在取消令牌上等待（Event.wait），取消时立即唤醒并抛出 TaskCancelled。
+"""
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from common.cancellation import CancellationToken
+
+
+class CancellableWait:
+    def __init__(
+            self,
+            driver,
+            timeout: float,
+            token: CancellationToken,
+            poll_frequency: float = 0.5,  # 与 WebDriverWait 默认值相同
+            ignored_exceptions: tuple[type[Exception], ...] = (NoSuchElementException,),
+    ):
+        self._driver = driver
+        self._timeout = timeout
+        self._token = token
+        self._poll = poll_frequency
+        self._ignored = ignored_exceptions
+
+    def until(self, method, message: str = ""):
+        """method(driver) 返回真值即返回该值；超时抛出 TimeoutException"""
+
+        def check():
+            try:
+                return method(self._driver)
+            except self._ignored:
+                return None
+
+        value = self._token.wait_until(check, self._timeout, self._poll)
+        if not value:
+            raise TimeoutException(message)
+        return value
@@ -0,0 +1,109 @@
+"""候选人打分排序：每日可打招呼次数有限，优先把次数用在同屏最合适的人身上。
+
+得分 = 命中关键词权重之和 + 活跃标签加分（如“刚刚活跃”）+ 在线加分 + 排除词扣分。
+所有计分词（目标关键词、活跃标签、排除词）编译进同一个不剪枝的 KeywordMatcher，
+每张卡片的文本只扫描一遍即可得到全部命中项，整批卡片的打分就是一次线性遍历。
+目标关键词之间常有包含关系（“货车司机兼职”里同时有“司机”“货车司机”“司机兼职”），
+相互重叠的命中合并为一段，每段只计权重最高的一个关键词，同一关键词也只计一次。
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from core.card_snapshot import CardSnapshot
+from core.keyword_matcher import KeywordMatcher
+
+ONLINE_BONUS = 2.0
+NEGATIVE_WEIGHT = -10.0
+# 越近期活跃加分越多
+ACTIVITY_WEIGHTS = {
+    "刚刚活跃": 3.0,
+    "今日活跃": 2.0,
+    "3日内活跃": 1.0,
+    "本周活跃": 0.5,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ScoredCard:
+    card: CardSnapshot
+    score: float
+    hits: tuple[str, ...]
+
+
+class CandidateScorer:
+    """keyword_weights 可以是 {关键词: 权重}，也可以是关键词列表（权重均为 1）。
+
+    只有命中至少一个目标关键词、总分大于 0（且 require_online 时在线）的卡片才会参与排序。
+    """
+
+    def __init__(
+            self,
+            keyword_weights: Mapping[str, float] | Iterable[str],
+            negative_keywords: Mapping[str, float] | Iterable[str] = (),
+            activity_weights: Mapping[str, float] | None = None,
+            online_bonus: float = ONLINE_BONUS,
+            require_online: bool = True,
+    ):
+        positive = _as_weights(keyword_weights, 1.0)
+        negative = _as_weights(negative_keywords, NEGATIVE_WEIGHT)
+        activity = dict(ACTIVITY_WEIGHTS if activity_weights is None else activity_weights)
+
+        weights: dict[str, float] = {}
+        for table in (positive, activity, negative):
+            for term, weight in table.items():
+                weights[term] = weights.get(term, 0.0) + weight
+        self.weights = weights
+        self.positive = frozenset(positive)
+        self.online_bonus = online_bonus
+        self.require_online = require_online
+        # 需要知道具体命中了哪些词，不能剪掉包含短词的长关键词
+        self._matcher = KeywordMatcher(weights, prune_redundant=False)
+
+    def score(self, card: CardSnapshot) -> ScoredCard:
+        spans = self._matcher.find_spans(card.text)
+        positive = self.positive
+        keywords = self._best_per_span([span for span in spans if span[2] in positive])
+        others = [term for _, _, term in spans if term not in positive]
+        hits = tuple(dict.fromkeys(keywords + others))
+        weights = self.weights
+        score = sum(weights[term] for term in hits)
+        if card.online:
+            score += self.online_bonus
+        return ScoredCard(card, score, hits)
+
+    def _best_per_span(self, spans: list[tuple[int, int, str]]) -> list[str]:
+        """把相互重叠的命中合并为一段，每段取权重最高（同权重取较长）的关键词"""
+        weights = self.weights
+        chosen = []
+        best, best_key, span_end = None, None, -1
+        for start, end, term in sorted(spans):
+            if start >= span_end and best is not None:
+                chosen.append(best)
+                best, best_key = None, None
+            key = (weights[term], end - start)
+            if best_key is None or key > best_key:
+                best, best_key = term, key
+            span_end = max(span_end, end) if start < span_end else end
+        if best is not None:
+            chosen.append(best)
+        return chosen
+
+    def eligible(self, scored: ScoredCard) -> bool:
+        if self.require_online and not scored.card.online:
+            return False
+        return scored.score > 0 and any(term in self.positive for term in scored.hits)
+
+    def rank(self, cards: Iterable[CardSnapshot], exclude: Iterable[str] = ()) -> list[ScoredCard]:
+        """给整批卡片打分，返回符合条件的卡片，按得分从高到低（同分按页面顺序）"""
+        excluded = set(exclude)
+        scored = [self.score(c) for c in cards if c.geekid not in excluded]
+        ranked = [s for s in scored if self.eligible(s)]
+        ranked.sort(key=lambda s: (-s.score, s.card.index))
+        return ranked
+
+
+def _as_weights(terms: Mapping[str, float] | Iterable[str], default: float) -> dict[str, float]:
+    if isinstance(terms, Mapping):
+        return {k: float(v) for k, v in terms.items() if k}
+    return {t: default for t in terms if t}
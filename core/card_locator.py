@@ -0,0 +1,43 @@
+"""卡片所在 (iframe, 选择器) 的会话级缓存。
+
+推荐牛人列表几乎总是在 recommendFrame 中、用第一个候选选择器就能命中，
+记住上一次命中的位置后，只有在缓存位置找不到卡片（或 iframe 已失效）时才重新逐个探测。
+"""
+
+
+class CardLocator:
+    def __init__(self):
+        self.frame = None  # None 表示主文档
+        self.selector: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self.probes = 0
+
+    @property
+    def resolved(self) -> bool:
+        return self.selector is not None
+
+    def remember(self, frame, selector: str):
+        self.frame = frame
+        self.selector = selector
+
+    def hit(self):
+        self.hits += 1
+
+    def miss(self):
+        """缓存位置未找到卡片：记录并清空，下次调用重新探测"""
+        self.misses += 1
+        self.frame = None
+        self.selector = None
+
+    def probed(self):
+        self.probes += 1
+
+    def stats(self) -> dict[str, int | float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "probes": self.probes,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
@@ -0,0 +1,210 @@
+"""牛人卡片批量快照：一次 execute_script 读出整屏卡片的纯数据记录。
+
+逐个卡片调用 is_displayed / get_attribute / .text / find_element 时，
+每个卡片都要走好几次 WebDriver HTTP 往返；这里改为在卡片所在文档里执行
+一段脚本，把所有卡片的关键字段一次性带回 Python 侧做筛选。
+
+滚动加载后列表越来越长，配合 ScanCursor 只读取上次扫描之后新增的卡片：
+页面内的 MutationObserver 记录新插入的卡片节点，增量扫描直接取出这些节点，
+不再对整个列表执行 querySelectorAll，每次扫描的开销与已加载的卡片总数无关。
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any
+
+# arguments[0]: 选择器候选列表（按从精确到宽松的顺序）
+# arguments[1]: 起始下标（游标，0 表示全量）；arguments[2]: 起始下标前一张卡片应有的 geekid
+# 全量读取时在卡片列表容器上挂一个 MutationObserver，把之后新插入的卡片节点记到 window.__boosScan.buffer；
+# 游标与锚点节点（上次读到的最后一张卡片）都对得上、且新卡片都排在锚点之后时只取出缓冲区里的新卡片，
+# 按文档顺序接着游标编号，不再遍历整个列表。页面回收删掉游标之前的卡片时由 PRUNE_CARDS_JS 同步减小 total。
+# 锚点节点已不在文档中（列表被整体替换，如切换职位/筛选条件）、有卡片插到锚点之前或下标对不上时走全量读取
+# 返回 {selector, total, start, cards: [[geekid, text, online, visible, index], ...]} 或 null
+SNAPSHOT_CARDS_JS = """
+var selectors = arguments[0];
+var start = arguments[1] || 0;
+var anchor = arguments[2] || null;
+function visible(el) {
+    if (!el) return false;
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+function row(el, i) {
+    return [
+        el.getAttribute('data-geekid'),
+        el.innerText || el.textContent || '',
+        visible(el.querySelector('.online-marker')),
+        visible(el),
+        i
+    ];
+}
+
+var state = window.__boosScan;
+if (state && start > 0 && start === state.total && state.anchor.isConnected &&
+        state.anchor.getAttribute('data-geekid') === anchor) {
+    // 尚未派发给回调的变更记录同样计入
+    state.collect(state.observer.takeRecords());
+    var added = state.buffer.splice(0, state.buffer.length);
+    var fresh = [], above = false;
+    for (var k = 0; k < added.length; k++) {
+        if (!added[k].isConnected) continue;
+        if (!(state.anchor.compareDocumentPosition(added[k]) & Node.DOCUMENT_POSITION_FOLLOWING)) {
+            above = true;
+            break;
+        }
+        fresh.push(added[k]);
+    }
+    // 有卡片插在锚点之前时，锚点之后所有卡片的下标都已变化，改走下面的全量读取
+    if (!above) {
+        fresh.sort(function (a, b) {
+            return a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1;
+        });
+        var rows = [];
+        for (var r = 0; r < fresh.length; r++) rows.push(row(fresh[r], start + r));
+        if (fresh.length) state.anchor = fresh[fresh.length - 1];
+        state.total = start + fresh.length;
+        return {selector: state.selector, total: state.total, start: start, cards: rows};
+    }
+}
+
+if (state) state.observer.disconnect();
+window.__boosScan = null;
+for (var s = 0; s < selectors.length; s++) {
+    var selector = selectors[s];
+    var nodes = document.querySelectorAll(selector);
+    if (!nodes.length) continue;
+    if (start > nodes.length ||
+        (start > 0 && anchor !== null && nodes[start - 1].getAttribute('data-geekid') !== anchor)) {
+        start = 0;
+    }
+    var cards = [];
+    for (var i = start; i < nodes.length; i++) cards.push(row(nodes[i], i));
+
+    // 观察同时包含第一张与最后一张卡片的最近容器，只记录其中新插入的卡片
+    var last = nodes[nodes.length - 1];
+    var container = nodes[0].parentNode;
+    while (container.parentNode && !container.contains(last)) container = container.parentNode;
+    var buffer = [], seen = new WeakSet();
+    for (var n = 0; n < nodes.length; n++) seen.add(nodes[n]);
+    var collect = function (mutations) {
+        for (var m = 0; m < mutations.length; m++) {
+            var list = mutations[m].addedNodes;
+            for (var j = 0; j < list.length; j++) {
+                var node = list[j];
+                if (node.nodeType !== 1) continue;
+                var found = node.matches(selector) ? [node] : node.querySelectorAll(selector);
+                for (var f = 0; f < found.length; f++) {
+                    if (!seen.has(found[f])) { seen.add(found[f]); buffer.push(found[f]); }
+                }
+            }
+        }
+    };
+    var observer = new MutationObserver(collect);
+    observer.observe(container, {childList: true, subtree: true});
+    window.__boosScan = {
+        selector: selector, total: nodes.length, anchor: last, buffer: buffer, observer: observer, collect: collect
+    };
+    return {selector: selector, total: nodes.length, start: start, cards: cards};
+}
+return null;
+"""
+
+# arguments[0]: 卡片元素；返回 [text, online, visible]（出队点击前重新确认牛人仍符合条件）
+CARD_STATE_JS = """
+var el = arguments[0];
+function visible(node) {
+    if (!node) return false;
+    if (!(node.offsetWidth || node.offsetHeight || node.getClientRects().length)) return false;
+    var style = window.getComputedStyle(node);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+return [el.innerText || el.textContent || '', visible(el.querySelector('.online-marker')), visible(el)];
+"""
+
+# arguments[0]: geekid；返回对应的卡片元素或 null（用 CSS.escape 处理引号、反斜杠等特殊字符）
+LOCATE_CARD_JS = """
+return document.querySelector('[data-geekid="' + CSS.escape(arguments[0]) + '"]');
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CardSnapshot:
+    """单个牛人卡片的快照（不持有 WebElement）。"""
+
+    geekid: str | None
+    text: str
+    online: bool
+    visible: bool
+    index: int
+    selector: str
+
+    @property
+    def summary(self) -> str:
+        return self.text.replace("\n", " ")
+
+
+def refresh_snapshot(snapshot: CardSnapshot, raw: Any) -> CardSnapshot:
+    """用 CARD_STATE_JS 的返回值更新快照中的文本、在线与可见状态"""
+    try:
+        text, online, visible = raw
+    except (TypeError, ValueError):
+        return snapshot
+    return replace(snapshot, text=text or snapshot.text, online=bool(online), visible=bool(visible))
+
+
+def parse_snapshot(raw: Any) -> list[CardSnapshot]:
+    """把 SNAPSHOT_CARDS_JS 的返回值转换为 CardSnapshot 列表。"""
+    if not isinstance(raw, dict):
+        return []
+    selector = raw.get("selector") or ""
+    snapshots = []
+    for row in raw.get("cards") or []:
+        try:
+            geekid, text, online, visible, index = row
+        except (TypeError, ValueError):
+            continue
+        snapshots.append(
+            CardSnapshot(
+                geekid=geekid,
+                text=text or "",
+                online=bool(online),
+                visible=bool(visible),
+                index=int(index),
+                selector=selector,
+            )
+        )
+    return snapshots
+
+
+class ScanCursor:
+    """增量扫描游标：记录已读到的位置及该位置前最后一张卡片的 geekid（锚点）"""
+
+    def __init__(self):
+        self.position = 0
+        self.anchor: str | None = None
+        self.resets = 0
+
+    def args(self) -> tuple[int, str | None]:
+        return self.position, self.anchor
+
+    def reset(self):
+        self.position = 0
+        self.anchor = None
+
+    def shift(self, removed: int):
+        """游标之前的卡片节点被删除（页面回收）后，位置随之前移，锚点不变"""
+        self.position = max(self.position - removed, 0)
+
+    def advance(self, raw: Any):
+        """根据 SNAPSHOT_CARDS_JS 的返回值推进游标"""
+        if not isinstance(raw, dict):
+            # 当前文档里找不到卡片列表
+            self.reset()
+            return
+        if raw.get("start", 0) == 0 and self.position > 0:
+            # 页面侧发现锚点不一致，从头读取了整个列表
+            self.resets += 1
+        cards = raw.get("cards") or []
+        if cards:
+            self.anchor = cards[-1][0]
+        self.position = int(raw.get("total") or 0)
@@ -0,0 +1,108 @@
+"""WebDriver 命令计数与计时（可选开启）。
+
+替换 driver 实例上的 execute 方法：WebElement 的所有操作同样经由
+driver.execute 发出，因此元素级命令（isDisplayed、getAttribute 等）也会被统计。
+每条命令按类型计数计时，并归到调用时所处的高层阶段（见 PhaseTimer.current）。
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+# selenium 用 executeScript 加标记注释实现了部分元素命令，按标记还原为具体命令名
+_SCRIPT_MARKERS = {
+    "/* isDisplayed */": "isDisplayed",
+    "/* getAttribute */": "getElementAttribute",
+}
+
+_COMMAND_ALIASES = {
+    "w3cExecuteScript": "executeScript",
+    "w3cExecuteScriptAsync": "executeAsyncScript",
+}
+
+
+def command_type(driver_command: str, params: dict | None) -> str:
+    name = _COMMAND_ALIASES.get(driver_command, driver_command)
+    if name == "executeScript" and params:
+        script = params.get("script") or ""
+        for marker, alias in _SCRIPT_MARKERS.items():
+            if script.startswith(marker):
+                return alias
+    return name
+
+
+class CommandStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {阶段: {命令: [次数, 总耗时秒]}}
+        self._data: dict[str, dict[str, list]] = {}
+
+    def record(self, phase: str, command: str, seconds: float):
+        with self._lock:
+            entry = self._data.setdefault(phase, {}).setdefault(command, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def reset(self):
+        with self._lock:
+            self._data.clear()
+
+    @property
+    def total(self) -> int:
+        with self._lock:
+            return sum(entry[0] for commands in self._data.values() for entry in commands.values())
+
+    def by_command(self) -> dict[str, dict[str, float]]:
+        merged: dict[str, list] = {}
+        with self._lock:
+            for commands in self._data.values():
+                for name, (count, seconds) in commands.items():
+                    entry = merged.setdefault(name, [0, 0.0])
+                    entry[0] += count
+                    entry[1] += seconds
+        return {name: _fmt(count, seconds) for name, (count, seconds) in merged.items()}
+
+    def by_phase(self) -> dict[str, dict[str, dict[str, float]]]:
+        with self._lock:
+            return {
+                phase: {name: _fmt(count, seconds) for name, (count, seconds) in commands.items()}
+                for phase, commands in self._data.items()
+            }
+
+    def summary(self) -> dict:
+        return {"total": self.total, "by_command": self.by_command(), "by_phase": self.by_phase()}
+
+    def format_table(self) -> str:
+        lines = [f"{'阶段':<14}{'命令':<24}{'次数':>8}{'总耗时(ms)':>14}{'平均(ms)':>12}"]
+        for phase, commands in sorted(self.by_phase().items()):
+            for name, stats in sorted(commands.items(), key=lambda kv: -kv[1]["total_ms"]):
+                lines.append(
+                    f"{phase:<14}{name:<24}{stats['count']:>8}{stats['total_ms']:>14.1f}{stats['avg_ms']:>12.2f}"
+                )
+        return "\n".join(lines)
+
+
+def _fmt(count: int, seconds: float) -> dict[str, float]:
+    return {
+        "count": count,
+        "total_ms": round(seconds * 1000, 1),
+        "avg_ms": round(seconds * 1000 / count, 2) if count else 0.0,
+    }
+
+
+def instrument_driver(driver, stats: CommandStats, phase_source: Callable[[], str] = lambda: "other"):
+    """给 driver 挂上命令统计；重复调用不会重复包装"""
+    if getattr(driver, "_command_stats", None) is stats:
+        return driver
+    execute = driver.execute
+
+    def instrumented_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            stats.record(phase_source(), command_type(driver_command, params), time.perf_counter() - start)
+
+    driver.execute = instrumented_execute
+    driver._command_stats = stats
+    return driver
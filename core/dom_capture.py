@@ -0,0 +1,264 @@
+"""真实会话中的页面快照（推荐列表 / 详情弹层 / 各类弹窗），供离线回放与回归测试。
+
+选择器和绝对 XPath 会随网站改版失效，而替身站点（benchmarks.fake_site）只能模仿已知的结构；
+这里在真实会话中把主文档及其 iframe 序列化为静态 HTML，压缩保存为快照文件，
+再由 benchmarks.replay_site 原样提供给浏览器，扫描、匹配与基准代码即可针对真实页面规模重复运行。
+
+序列化时在文档副本上处理，不影响正在操作的页面：
+- 去掉脚本与内联事件，同源样式表内联为 <style>，读取不到的外链样式表直接移除；
+- 图片等外部资源地址移到 data-capture-* 属性，回放时不访问外网；
+- iframe 的 src 改为回放服务器上对应文档的相对路径（frame/<name>）。
+可选脱敏（默认开启）：姓名等个人字段文本打码（保留长度），geekid 等 ID 属性替换为同格式的伪 ID
+（同一会话内映射一致），手机号 / 邮箱打码，链接去掉查询参数，不保留图片地址与页面标题。
+
+快照文件为 gzip 压缩的 JSON：{version, kind, captured_at, redacted, url, documents: {top, <frame>...}, meta}。
+"""
+
+import gzip
+import json
+import os
+import secrets
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+
+from selenium.webdriver.common.by import By
+
+from core import selectors
+from core.page_recycler import PAGE_STATS_JS
+
+FIXTURE_VERSION = 1
+FIXTURE_SUFFIX = ".json.gz"
+# 顶层文档中 iframe 的相对地址前缀，回放服务器按 <快照>/frame/<name> 提供对应文档
+REPLAY_FRAME_PATH = "frame/"
+TOP_DOCUMENT = "top"
+CAPTURE_KINDS = ("recommend", "detail", "download_popup", "limit_dialog")
+
+# arguments[0]: iframe 相对地址前缀；arguments[1]: 是否脱敏；
+# arguments[2]: 需要替换的 ID 属性名；arguments[3]: 需要打码的个人字段选择器；arguments[4]: 伪 ID 的盐
+# 返回 {html, url, title, elements}
+CAPTURE_DOCUMENT_JS = r"""
+var framePath = arguments[0], redact = arguments[1];
+var idAttrs = arguments[2], textSelectors = arguments[3], salt = arguments[4];
+var root = document.documentElement.cloneNode(true);
+function all(node, css) { return Array.prototype.slice.call(node.querySelectorAll(css)); }
+function remove(el) { if (el.parentNode) el.parentNode.removeChild(el); }
+function textNodes(node, fn) {
+    var walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        var parent = walker.currentNode.parentNode;
+        if (parent && parent.tagName !== 'STYLE') fn(walker.currentNode);
+    }
+}
+function pseudoId(value) {
+    var h = 2166136261, s = salt + value, out = '';
+    for (var i = 0; i < s.length; i++) { h ^= s.charCodeAt(i); h = Math.imul(h, 16777619) >>> 0; }
+    h = h || 1;
+    for (var j = 0; j < value.length; j++) {
+        var c = value.charAt(j);
+        if (!/[0-9a-zA-Z]/.test(c)) { out += c; continue; }
+        h ^= h << 13; h >>>= 0; h ^= h >>> 17; h ^= h << 5; h >>>= 0;
+        out += (h & 15).toString(16);
+    }
+    return out;
+}
+
+// 1. 样式表：同源的内联，跨域读取不到的移除；其余脚本与外链一律移除
+var links = all(document, 'link[rel~="stylesheet"]'), cloned = all(root, 'link[rel~="stylesheet"]');
+for (var i = 0; i < cloned.length; i++) {
+    var css = null;
+    try {
+        var sheet = links[i] && links[i].sheet;
+        if (sheet) css = Array.prototype.map.call(sheet.cssRules, function (r) { return r.cssText; }).join('\n');
+    } catch (e) {}
+    if (css === null) { remove(cloned[i]); continue; }
+    var style = document.createElement('style');
+    style.setAttribute('data-capture-href', redact ? '' : (cloned[i].getAttribute('href') || ''));
+    style.textContent = css;
+    cloned[i].parentNode.replaceChild(style, cloned[i]);
+}
+all(root, 'script, noscript, link, base').forEach(remove);
+
+// 2. iframe 指向回放服务器上的对应文档（顺序与 find_elements(By.TAG_NAME, 'iframe') 一致）
+all(root, 'iframe').forEach(function (el, i) {
+    var key = el.getAttribute('name') || ('frame' + i);
+    el.setAttribute('data-capture-src', el.getAttribute('src') || '');
+    el.setAttribute('src', framePath + encodeURIComponent(key));
+});
+
+// 3. 内联事件与外部资源
+var elements = root.getElementsByTagName('*');
+for (var k = 0; k < elements.length; k++) {
+    var el = elements[k];
+    for (var a = el.attributes.length - 1; a >= 0; a--) {
+        if (el.attributes[a].name.slice(0, 2) === 'on') el.removeAttribute(el.attributes[a].name);
+    }
+    if (/^(IMG|SOURCE|VIDEO|AUDIO)$/.test(el.tagName)) {
+        ['src', 'srcset', 'poster'].forEach(function (attr) {
+            if (!el.hasAttribute(attr)) return;
+            if (!redact) el.setAttribute('data-capture-' + attr, el.getAttribute(attr));
+            el.removeAttribute(attr);
+        });
+    }
+    if (redact && (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA')) el.removeAttribute('value');
+}
+
+// 4. 脱敏
+if (redact) {
+    textSelectors.forEach(function (css) {
+        all(root, css).forEach(function (el) {
+            textNodes(el, function (node) { node.nodeValue = node.nodeValue.replace(/[^\s·|,，、\/]/g, '*'); });
+        });
+    });
+    idAttrs.forEach(function (attr) {
+        all(root, '[' + attr + ']').forEach(function (el) { el.setAttribute(attr, pseudoId(el.getAttribute(attr))); });
+    });
+    textNodes(root, function (node) {
+        node.nodeValue = node.nodeValue
+            .replace(/1[3-9]\d{9}/g, '1**********')
+            .replace(/[\w.+-]+@[\w-]+(\.[\w-]+)+/g, '***@***');
+    });
+    all(root, '[href], [data-capture-src]').forEach(function (el) {
+        ['href', 'data-capture-src'].forEach(function (attr) {
+            var value = el.getAttribute(attr);
+            if (value && value.indexOf('?') >= 0) el.setAttribute(attr, value.split('?')[0]);
+        });
+    });
+    all(root, 'title').forEach(function (el) { el.textContent = ''; });
+}
+
+var doctype = document.doctype ? '<!DOCTYPE ' + document.doctype.name + '>\n' : '';
+return {
+    html: doctype + root.outerHTML,
+    url: location.origin + location.pathname,
+    title: redact ? '' : document.title,
+    elements: root.getElementsByTagName('*').length
+};
+"""
+
+
+@dataclass
+class CaptureFixture:
+    kind: str
+    captured_at: float
+    redacted: bool
+    url: str
+    # 文档名 -> HTML；顶层文档为 "top"，iframe 以 name（没有 name 时为 frame<序号>）命名
+    documents: dict[str, str]
+    meta: dict = field(default_factory=dict)
+    version: int = FIXTURE_VERSION
+
+    @property
+    def name(self) -> str:
+        return self.meta.get("name", "")
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(html.encode("utf-8")) for html in self.documents.values())
+
+
+def save_fixture(fixture: CaptureFixture, path: str):
+    # 先写临时文件再替换，避免中断时留下半个文件
+    tmp = path + ".tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(asdict(fixture), f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def load_fixture(path: str) -> CaptureFixture:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != FIXTURE_VERSION:
+        raise ValueError(f"不支持的快照版本：{data.get('version')}（{path}）")
+    fixture = CaptureFixture(**data)
+    fixture.meta.setdefault("name", os.path.basename(path)[: -len(FIXTURE_SUFFIX)])
+    return fixture
+
+
+def iter_fixture_paths(path: str) -> Iterator[str]:
+    """path 可以是单个快照文件或快照目录（按文件名排序）"""
+    if os.path.isfile(path):
+        yield path
+        return
+    for name in sorted(os.listdir(path)):
+        if name.endswith(FIXTURE_SUFFIX):
+            yield os.path.join(path, name)
+
+
+class DomRecorder:
+    """会话中按需保存页面快照；每种页面按最小间隔与数量上限采集，避免拖慢任务或占满磁盘"""
+
+    def __init__(
+            self,
+            directory: str,
+            redact: bool = True,
+            kinds: tuple[str, ...] = CAPTURE_KINDS,
+            min_interval_s: float = 300.0,
+            max_per_kind: int = 20,
+    ):
+        self.directory = directory
+        self.redact = redact
+        self.kinds = kinds
+        self.min_interval_s = min_interval_s
+        self.max_per_kind = max_per_kind
+        # 伪 ID 的盐只在本次会话内使用，不写入快照
+        self._salt = secrets.token_hex(8)
+        self._last: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def due(self, kind: str) -> bool:
+        if kind not in self.kinds or self.counts.get(kind, 0) >= self.max_per_kind:
+            return False
+        last = self._last.get(kind)
+        return last is None or time.monotonic() - last >= self.min_interval_s
+
+    def _capture_document(self, driver) -> dict:
+        return driver.execute_script(
+            CAPTURE_DOCUMENT_JS,
+            REPLAY_FRAME_PATH,
+            self.redact,
+            selectors.PERSONAL_ID_ATTRIBUTES,
+            selectors.PERSONAL_TEXT_SELECTORS,
+            self._salt,
+        )
+
+    def capture(self, driver, kind: str) -> str:
+        """序列化主文档及其直接包含的 iframe 并保存，返回快照文件路径；结束时停在主文档"""
+        # 失败也计入间隔，避免每次扫描都重试
+        self._last[kind] = time.monotonic()
+        driver.switch_to.default_content()
+        top = self._capture_document(driver)
+        documents = {TOP_DOCUMENT: top["html"]}
+        meta = {"title": top["title"], "elements": {TOP_DOCUMENT: top["elements"]}, "cards": {}}
+
+        for index, frame in enumerate(driver.find_elements(By.TAG_NAME, "iframe")):
+            key = frame.get_attribute("name") or f"frame{index}"
+            try:
+                driver.switch_to.default_content()
+                driver.switch_to.frame(frame)
+                doc = self._capture_document(driver)
+                stats = driver.execute_script(PAGE_STATS_JS, selectors.CARD_SELECTOR_CANDIDATES) or {}
+            except Exception:
+                # 跨域或已被移除的 iframe 不影响其余文档
+                continue
+            documents[key] = doc["html"]
+            meta["elements"][key] = doc["elements"]
+            meta["cards"][key] = stats.get("cards", 0)
+        driver.switch_to.default_content()
+
+        captured_at = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(captured_at))
+        name = f"{stamp}-{kind}-{self.counts.get(kind, 0) + 1:03d}"
+        fixture = CaptureFixture(
+            kind=kind,
+            captured_at=captured_at,
+            redacted=self.redact,
+            url=top["url"],
+            documents=documents,
+            meta={"name": name, **meta},
+        )
+        path = os.path.join(self.directory, name + FIXTURE_SUFFIX)
+        save_fixture(fixture, path)
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        return path
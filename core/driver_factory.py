@@ -0,0 +1,109 @@
+"""浏览器创建。
+
+持久化配置模式：使用专用的用户数据目录（--user-data-dir），登录态、缓存、
+Service Worker 在多次运行之间保留，热启动时无需逐个注入 cookie 再刷新页面。
+同一配置目录同一时间只能被一个浏览器实例使用。
+
+精简加载模式：pageLoadStrategy=eager（DOM 就绪即返回，不等图片等子资源），
+并通过 CDP Network.setBlockedURLs 只拦截牛人头像和第三方统计请求。
+字体、图标和其他图片照常加载（图标字体 / svg 缺失会改变按钮文字与布局），二维码同样不受影响。
+不使用浏览器的图片内容设置：它按页面所在站点生效，无法只放行二维码而拦截同一页面上的头像。
+"""
+
+import os
+import time
+
+from selenium import webdriver
+
+DEFAULT_PROFILE_DIR = "browser_profile"
+# 登录成功后写入配置目录的标记文件
+PROFILE_MARKER = ".boos_session"
+
+# 牛人头像（推荐列表里数量最多的图片）
+BLOCKED_AVATAR_PATTERNS = [
+    "*img.bosszhipin.com/*avatar*",
+    "*/avatar/*",
+]
+# 第三方统计 / 埋点
+BLOCKED_TRACKER_PATTERNS = [
+    "*hm.baidu.com/*",
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*sensorsdata.cn/*",
+]
+# 只关闭通知、密码保存等与自动化无关的浏览器提示，不拦截任何资源
+LEAN_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+}
+
+
+def profile_is_warm(profile_dir: str | None) -> bool:
+    """配置目录里是否保存过登录态（登录成功后写入标记文件，退出登录时删除）。
+
+    不以浏览器是否初始化过目录为准：预热启动的浏览器会先创建目录，但那时还没有登录。
+    """
+    return bool(profile_dir) and os.path.isfile(os.path.join(profile_dir, PROFILE_MARKER))
+
+
+def mark_profile_warm(profile_dir: str, warm: bool = True):
+    marker = os.path.join(profile_dir, PROFILE_MARKER)
+    if warm:
+        os.makedirs(profile_dir, exist_ok=True)
+        with open(marker, "w", encoding="utf-8") as f:
+            f.write(str(int(time.time())))
+    elif os.path.exists(marker):
+        os.remove(marker)
+
+
+def profile_arguments(profile_dir: str) -> list[str]:
+    os.makedirs(profile_dir, exist_ok=True)
+    return [
+        f"--user-data-dir={os.path.abspath(profile_dir)}",
+        "--profile-directory=Default",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+
+
+def apply_lean_options(options):
+    """精简加载模式的启动选项（Edge / Chrome 通用）"""
+    options.page_load_strategy = "eager"
+    options.add_experimental_option("prefs", LEAN_PREFS)
+    return options
+
+
+def enable_request_blocking(driver, patterns: list[str] | None = None) -> bool:
+    """通过 CDP 拦截匹配的请求；浏览器不支持时返回 False"""
+    if patterns is None:
+        patterns = BLOCKED_AVATAR_PATTERNS + BLOCKED_TRACKER_PATTERNS
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        return True
+    except Exception:
+        return False
+
+
+def build_edge_options(profile_dir: str | None = None, headless: bool = False, lean: bool = False) -> webdriver.EdgeOptions:
+    options = webdriver.EdgeOptions()
+    if profile_dir:
+        for arg in profile_arguments(profile_dir):
+            options.add_argument(arg)
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1280,900")
+    if lean:
+        apply_lean_options(options)
+    return options
+
+
+def create_edge_driver(profile_dir: str | None = None, headless: bool = False, lean: bool = False):
+    """创建 Edge；不传任何选项时与之前一样使用一次性的临时配置"""
+    if not profile_dir and not headless and not lean:
+        return webdriver.Edge()
+    driver = webdriver.Edge(options=build_edge_options(profile_dir, headless, lean))
+    if lean:
+        enable_request_blocking(driver)
+    return driver
@@ -0,0 +1,70 @@
+"""打招呼漏斗指标：卡片曝光 → 命中关键词 → 在线 → 点击 → 打招呼成功 → 触达上限。
+
+每张卡片（按 geekid）在一个会话中只计入一次漏斗，重复扫描不会重复计数。
+"""
+
+import time
+
+from common.compact_id_set import CompactIdSet
+from common.metrics import REGISTRY, MetricsRegistry
+
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 60.0)
+
+
+class GreetFunnel:
+    def __init__(self, registry: MetricsRegistry = REGISTRY):
+        self.registry = registry
+        self.cards_seen = registry.counter("boos_cards_seen_total", "扫描到的不重复卡片数")
+        self.keyword_matched = registry.counter("boos_cards_keyword_matched_total", "命中关键词的卡片数")
+        self.online = registry.counter("boos_cards_matched_online_total", "命中关键词且在线的卡片数")
+        self.clicked = registry.counter("boos_cards_clicked_total", "点击进入详情的次数")
+        self.greeted = registry.counter("boos_greet_success_total", "打招呼成功次数")
+        self.greet_failed = registry.counter("boos_greet_failed_total", "打招呼未成功次数")
+        self.limit_hit = registry.counter("boos_greet_limit_hit_total", "触达每日沟通上限次数")
+        self.browse_pages = registry.counter("boos_browse_pages_total", "刷浏览量模式翻页次数")
+        self.page_recycles = registry.counter("boos_page_recycles_total", "长时间运行中回收推荐列表页面的次数")
+        self.browser_heap_mb = registry.gauge("boos_browser_js_heap_megabytes", "推荐列表页面最近一次采样的 JS 堆大小")
+        self.task_running = registry.gauge("boos_task_running", "当前是否有任务在运行")
+        self.task_started_at = registry.gauge("boos_task_started_timestamp_seconds", "当前任务开始时间")
+        self.greeted_per_min = registry.gauge("boos_greet_success_per_minute", "当前任务平均每分钟打招呼数")
+        self.scan_seconds = registry.histogram("boos_scan_duration_seconds", "单次卡片扫描耗时", LATENCY_BUCKETS)
+        self.greet_seconds = registry.histogram("boos_greet_duration_seconds", "单个牛人从点击到关闭详情的耗时", LATENCY_BUCKETS)
+        # 只记录 geekid 哈希，长时间运行内存有上限（淘汰后的 ID 再次出现会重新计数）
+        self._observed = CompactIdSet(max_items=1 << 18)
+        self._task_start = 0.0
+        self._task_greets = 0
+
+    # -------- 任务生命周期 --------
+    def task_started(self):
+        self._task_start = time.time()
+        self._task_greets = 0
+        self.task_running.set(1)
+        self.task_started_at.set(self._task_start)
+
+    def task_finished(self):
+        self.task_running.set(0)
+
+    # -------- 漏斗 --------
+    def observe_cards(self, cards, matcher):
+        """记录新出现卡片的曝光、关键词命中与在线情况（同一 geekid 只记一次）"""
+        for card in cards:
+            if not card.geekid or not self._observed.add(card.geekid):
+                continue
+            self.cards_seen.inc()
+            if matcher.matches(card.text):
+                self.keyword_matched.inc()
+                if card.online:
+                    self.online.inc()
+
+    def greet_finished(self, status: str, seconds: float):
+        self.greet_seconds.observe(seconds)
+        if status == "SUCCESS":
+            self.greeted.inc()
+            self._task_greets += 1
+            elapsed_min = (time.time() - self._task_start) / 60 if self._task_start else 0
+            if elapsed_min > 0:
+                self.greeted_per_min.set(self._task_greets / elapsed_min)
+        elif status == "LIMIT_REACHED":
+            self.limit_hit.inc()
+        else:
+            self.greet_failed.inc()
@@ -0,0 +1,145 @@
+"""多关键词匹配：Aho–Corasick 自动机，一次扫描文本找出所有命中的关键词。
+
+`any(kw in text for kw in keywords)` 对每个关键词都要完整扫描一遍文本，
+关键词越多越慢；这里先对关键词去重、剔除“包含了更短关键词”的冗余项，
+再编译成自动机，匹配代价只与文本长度相关。
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+# 关键词较少时，C 实现的 `in` 逐个查找反而比纯 Python 的自动机遍历更快
+SMALL_SET_THRESHOLD = 48
+
+
+def _dedupe(keywords: Iterable[str]) -> list[str]:
+    seen = set()
+    result = []
+    for kw in keywords:
+        if not kw or kw in seen:
+            continue
+        seen.add(kw)
+        result.append(kw)
+    return result
+
+
+class KeywordMatcher:
+    """编译后的多关键词匹配器。
+
+    prune_redundant=True 时，若关键词 A 是关键词 B 的子串（如“司机”与“货车司机兼职”），
+    B 会被剔除——命中 B 的文本必然命中 A，对“是否命中”的判断没有影响。
+    需要知道具体命中了哪些长关键词时（例如按关键词加权打分），传 False。
+
+    精简后的关键词数不超过 small_set_threshold 时 matches 直接逐个 `in` 查找，不走自动机
+    （基准中传 0 可强制使用自动机）。
+    """
+
+    def __init__(
+            self,
+            keywords: Iterable[str],
+            prune_redundant: bool = True,
+            small_set_threshold: int = SMALL_SET_THRESHOLD,
+    ):
+        unique = _dedupe(keywords)
+        self._build(unique)
+        if prune_redundant:
+            unique = [kw for kw in unique if not self._contains_other(kw)]
+            self._build(unique)
+        self.uses_automaton = len(self.keywords) > small_set_threshold
+
+    # -------- 构建 --------
+    def _build(self, keywords: list[str]):
+        self.keywords = keywords
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+
+        for idx, kw in enumerate(keywords):
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(idx)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # 合并输出链，匹配时无需再沿 fail 指针回溯
+                outputs[nxt].extend(outputs[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(o) for o in outputs]
+
+    def _contains_other(self, keyword: str) -> bool:
+        """keyword 中是否包含另一个（不同的）关键词"""
+        return any(self.keywords[i] != keyword for i in self._iter_hits(keyword))
+
+    # -------- 匹配 --------
+    def _iter_hits(self, text: str):
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                yield from outputs[state]
+
+    def _iter_spans(self, text: str):
+        goto, fail, outputs, keywords = self._goto, self._fail, self._outputs, self.keywords
+        state = 0
+        for pos, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in outputs[state]:
+                yield pos - len(keywords[idx]), pos, idx
+
+    def matches(self, text: str) -> bool:
+        """文本是否命中任一关键词（命中即返回）"""
+        if not self.uses_automaton:
+            return any(kw in text for kw in self.keywords)
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        state = 0
+        for ch in text:
+            if state:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            else:
+                # 大部分字符停留在根节点，单独处理以减少字典查找
+                state = root.get(ch, 0)
+            if outputs[state]:
+                return True
+        return False
+
+    def find_all(self, text: str) -> list[str]:
+        """返回文本命中的全部关键词（按首次出现顺序去重）"""
+        hit: dict[int, None] = {}
+        for idx in self._iter_hits(text):
+            hit.setdefault(idx, None)
+        return [self.keywords[i] for i in hit]
+
+    def find_spans(self, text: str) -> list[tuple[int, int, str]]:
+        """返回每一处命中 (起始下标, 结束下标, 关键词)，按结束位置排列；同一关键词出现多次时各算一处"""
+        keywords = self.keywords
+        return [(start, end, keywords[idx]) for start, end, idx in self._iter_spans(text)]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __contains__(self, text: str) -> bool:
+        return self.matches(text)
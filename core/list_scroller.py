@@ -0,0 +1,91 @@
+"""推荐列表“滚动并等待新卡片”原语。
+
+在卡片所在文档里找到列表真正的滚动容器并滚到底，再用 MutationObserver
+等待卡片数量增长：新卡片一出现立即返回，超时则告诉调用方“没有更多了”。
+为了能及时响应“停止”，调用方可以把一次长等待拆成多段短等待：
+第一段负责滚动，之后的各段传入第一段的 before，只等待不再滚动。
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+# arguments[0]: 卡片选择器候选列表；arguments[1]: 最长等待毫秒数；
+# arguments[2]: 基准卡片数（省略或为 null 时取当前数量并滚动，否则只等待）；最后一个参数为回调
+SCROLL_AND_WAIT_JS = """
+var selectors = arguments[0];
+var timeoutMs = arguments[1];
+var baseline = arguments.length > 3 ? arguments[2] : null;
+var done = arguments[arguments.length - 1];
+
+function findCards() {
+    for (var s = 0; s < selectors.length; s++) {
+        var nodes = document.querySelectorAll(selectors[s]);
+        if (nodes.length) return nodes;
+    }
+    return [];
+}
+function scrollParent(el) {
+    while (el && el !== document.body && el !== document.documentElement) {
+        var style = window.getComputedStyle(el);
+        if (/(auto|scroll)/.test(style.overflowY) && el.scrollHeight > el.clientHeight) return el;
+        el = el.parentElement;
+    }
+    return document.scrollingElement || document.documentElement;
+}
+
+var cards = findCards();
+var before = baseline === null ? cards.length : baseline;
+var container = cards.length ? scrollParent(cards[cards.length - 1]) : (document.scrollingElement || document.documentElement);
+var isRoot = container === document.scrollingElement || container === document.documentElement;
+
+if (baseline === null) {
+    if (cards.length) cards[cards.length - 1].scrollIntoView({block: 'end'});
+    container.scrollTop = container.scrollHeight;
+    (isRoot ? window : container).dispatchEvent(new Event('scroll'));
+}
+
+var finished = false;
+var observer = new MutationObserver(function () {
+    if (findCards().length > before) finish();
+});
+var timer = setTimeout(finish, timeoutMs);
+observer.observe(isRoot ? document.body : container, {childList: true, subtree: true});
+if (findCards().length > before) finish();
+
+function finish() {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done({
+        before: before,
+        after: findCards().length,
+        at_bottom: container.scrollTop + container.clientHeight >= container.scrollHeight - 2
+    });
+}
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ScrollResult:
+    before: int
+    after: int
+    at_bottom: bool
+
+    @property
+    def grew(self) -> bool:
+        return self.after > self.before
+
+    @property
+    def new_cards(self) -> int:
+        return max(0, self.after - self.before)
+
+
+def parse_scroll_result(raw: Any) -> ScrollResult:
+    if not isinstance(raw, dict):
+        return ScrollResult(before=0, after=0, at_bottom=True)
+    return ScrollResult(
+        before=int(raw.get("before") or 0),
+        after=int(raw.get("after") or 0),
+        at_bottom=bool(raw.get("at_bottom")),
+    )
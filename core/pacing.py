@@ -0,0 +1,94 @@
+"""详情页节奏控制：把“等页面就绪”和“刻意停留”拆开。
+
+就绪等待（详情面板渲染、打招呼按钮状态变化、弹窗出现）满足条件立即返回；
+停留时间由 PacingProfile 单独配置，且从进入详情开始计时——页面加载本身
+耗掉的时间会从停留时间里扣除，不再叠加。
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+
+
+# 打招呼后的结果判断：arguments[0] 为打招呼按钮，arguments[1] 为点击前的按钮文案，
+# arguments[2] 为上限提示的 XPath。返回 'limit' / 'greeted' / null（尚无变化）
+GREET_OUTCOME_JS = """
+var btn = arguments[0], before = arguments[1], limitXpath = arguments[2];
+function shown(el) {
+    return !!(el && el.isConnected && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+}
+var doc;
+try { doc = window.top.document; } catch (e) { doc = document; }
+var docs = doc === document ? [document] : [doc, document];
+for (var i = 0; i < docs.length; i++) {
+    var h = docs[i].evaluate(limitXpath, docs[i], null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (shown(h)) return 'limit';
+}
+if (!shown(btn) || btn.disabled) return 'greeted';
+if ((btn.innerText || btn.textContent || '').trim() !== before) return 'greeted';
+return null;
+"""
+
+
+@dataclass(frozen=True)
+class PacingProfile:
+    """每位牛人的停留节奏（单位：秒）"""
+
+    detail_dwell: float = 5.0  # 进入详情后、打招呼前的停留（含页面加载时间）
+    after_greet: float = 0.0  # 打招呼后额外停留
+    before_close: float = 3.0  # 关闭详情前的停留
+    jitter: float = 0.0  # 随机抖动比例，例如 0.3 表示 ±30%
+    ready_timeout: float = 10.0  # 就绪等待的上限
+    limit_check: float = 1.0  # 打招呼后检查上限弹窗的最长等待（弹窗可能晚于按钮状态变化出现）
+
+    def seconds(self, base: float) -> float:
+        if base <= 0:
+            return 0.0
+        if self.jitter <= 0:
+            return base
+        return max(0.0, base * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+
+PACING_PROFILES = {
+    # 与旧版固定 sleep 的节奏一致
+    "default": PacingProfile(),
+    "fast": PacingProfile(detail_dwell=2.0, after_greet=0.0, before_close=1.0, jitter=0.3),
+    # 不做任何刻意停留（基准测试用）
+    "none": PacingProfile(detail_dwell=0.0, after_greet=0.0, before_close=0.0, ready_timeout=5.0, limit_check=0.5),
+}
+
+
+@dataclass
+class WaitStats:
+    """累计各类等待耗时，区分“就绪等待”和“刻意停留”"""
+
+    totals: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, name: str, seconds: float):
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            name: {
+                "count": self.counts[name],
+                "total_s": round(total, 3),
+                "avg_s": round(total / self.counts[name], 3),
+            }
+            for name, total in self.totals.items()
+        }
+
+
+def dwell(profile: PacingProfile, base: float, since: float | None = None, sleep=time.sleep) -> float:
+    """按配置停留；since 为计时起点（time.monotonic()），已过去的时间会被扣除。返回实际睡眠秒数。
+
+    sleep 可替换为可取消的睡眠（如 CancellationToken.sleep）。
+    """
+    target = profile.seconds(base)
+    if since is not None:
+        target -= time.monotonic() - since
+    if target > 0:
+        sleep(target)
+        return target
+    return 0.0
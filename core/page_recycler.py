@@ -0,0 +1,130 @@
+"""长时间运行时的页面回收策略。
+
+推荐列表无限滚动，卡片节点只增不减：浏览器内存和每次扫描/查找元素的耗时都会随任务时长增长。
+卡片数、JS 堆大小或距上次回收的时间任一超过阈值时回收一次页面：
+- prune：从 DOM 中删掉已经处理过的卡片节点（保留最后一张作为增量扫描的锚点）；
+- reload：重新加载推荐牛人 iframe，再恢复职位与筛选条件。
+已处理记录保存在 ProcessedStore 与任务内的已评估集合中，回收后不会重复评估同一个人。
+回收默认关闭（BoosDriver 不传 recycle_policy 时不回收）；启用时默认使用 reload。
+"""
+
+import time
+from dataclasses import dataclass
+
+RECYCLE_MODES = ("prune", "reload")
+
+# arguments[0]: 卡片选择器候选列表
+# 返回 {cards, heap_bytes}；performance.memory 只有 Chromium 内核提供，其他浏览器 heap_bytes 为 null
+PAGE_STATS_JS = """
+var selectors = arguments[0];
+var cards = 0;
+for (var s = 0; s < selectors.length; s++) {
+    var n = document.querySelectorAll(selectors[s]).length;
+    if (n) { cards = n; break; }
+}
+var mem = window.performance && window.performance.memory;
+return {cards: cards, heap_bytes: mem ? mem.usedJSHeapSize : null};
+"""
+
+# arguments[0]: 卡片选择器候选列表；arguments[1]: 删除下标小于该值的卡片
+# 卡片外层有只包含这一张卡片的 li 时连同 li 一起删除，不会误删包住整个列表的祖先 li；
+# 返回 {removed, total}（total 为删除后剩余的卡片数）
+PRUNE_CARDS_JS = """
+var selectors = arguments[0];
+var end = arguments[1];
+for (var s = 0; s < selectors.length; s++) {
+    var nodes = document.querySelectorAll(selectors[s]);
+    if (!nodes.length) continue;
+    end = Math.min(end, nodes.length);
+    for (var i = 0; i < end; i++) {
+        var el = nodes[i];
+        var li = el.closest('li');
+        var item = li && li.querySelectorAll(selectors[s]).length <= 1 ? li : el;
+        if (item.parentNode) item.parentNode.removeChild(item);
+    }
+    // 增量扫描（SNAPSHOT_CARDS_JS）记录的卡片数随之减少，与 ScanCursor.shift 保持一致
+    if (window.__boosScan) window.__boosScan.total -= end;
+    return {removed: end, total: nodes.length - end};
+}
+return {removed: 0, total: 0};
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RecyclePolicy:
+    """阈值为 0 表示不按该项触发；三项都为 0 即关闭回收"""
+
+    max_cards: int = 600
+    max_heap_mb: float = 512.0
+    max_age_s: float = 1800.0
+    # reload 只依赖 iframe 重新加载；prune 直接改动页面 DOM，需要确认网站结构后再启用
+    mode: str = "reload"
+    # 读取 JS 堆大小需要一次脚本调用，按间隔采样
+    heap_sample_interval_s: float = 30.0
+
+    def __post_init__(self):
+        if self.mode not in RECYCLE_MODES:
+            raise ValueError(f"未知的回收方式：{self.mode}（可选 {'/'.join(RECYCLE_MODES)}）")
+
+    @classmethod
+    def off(cls) -> "RecyclePolicy":
+        return cls(max_cards=0, max_heap_mb=0, max_age_s=0)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_cards or self.max_heap_mb or self.max_age_s)
+
+
+class PageRecycler:
+    """判断何时需要回收页面，并记录回收次数与最近一次内存采样"""
+
+    def __init__(self, policy: RecyclePolicy | None = None):
+        # 默认不回收，需要时显式传入 RecyclePolicy
+        self.policy = policy or RecyclePolicy.off()
+        self.last_heap_mb: float | None = None
+        self.recycles: dict[str, int] = {}
+        self.pruned_cards = 0
+        self._since = time.monotonic()
+        self._heap_sampled_at = 0.0
+
+    def reset(self):
+        """任务开始时重新计时"""
+        self._since = time.monotonic()
+        self._heap_sampled_at = 0.0
+
+    def heap_sample_due(self) -> bool:
+        policy = self.policy
+        if not policy.max_heap_mb:
+            return False
+        return time.monotonic() - self._heap_sampled_at >= policy.heap_sample_interval_s
+
+    def record_heap(self, heap_bytes: int | float | None):
+        self._heap_sampled_at = time.monotonic()
+        self.last_heap_mb = None if heap_bytes is None else heap_bytes / (1024 * 1024)
+
+    def due(self, cards: int) -> str | None:
+        """返回触发回收的原因（cards / heap / age），无需回收返回 None"""
+        policy = self.policy
+        if policy.max_cards and cards >= policy.max_cards:
+            return "cards"
+        if policy.max_heap_mb and self.last_heap_mb is not None and self.last_heap_mb >= policy.max_heap_mb:
+            return "heap"
+        if policy.max_age_s and time.monotonic() - self._since >= policy.max_age_s:
+            return "age"
+        return None
+
+    def recycled(self, reason: str, pruned: int = 0):
+        self.recycles[reason] = self.recycles.get(reason, 0) + 1
+        self.pruned_cards += pruned
+        self._since = time.monotonic()
+        # 回收后堆大小已变化，下次检查时重新采样
+        self.last_heap_mb = None
+        self._heap_sampled_at = 0.0
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.policy.mode,
+            "recycles": dict(self.recycles),
+            "pruned_cards": self.pruned_cards,
+            "last_heap_mb": None if self.last_heap_mb is None else round(self.last_heap_mb, 1),
+        }
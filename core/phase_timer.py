@@ -0,0 +1,73 @@
+"""打招呼流程分阶段计时（扫描、匹配、点击、详情、关闭、滚动）。
+
+阶段可以嵌套（例如 detail 内部的 close），各阶段分别计时；
+current 为当前最内层阶段，供其他统计（如 WebDriver 命令计数）归类使用。
+"""
+
+import functools
+import math
+import time
+from contextlib import contextmanager
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """最近秩法分位数，q 取 0~100"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {}
+        self.counters: dict[str, int] = {}
+        self._stack: list[str] = []
+
+    @property
+    def current(self) -> str:
+        return self._stack[-1] if self._stack else "other"
+
+    @contextmanager
+    def phase(self, name: str):
+        self._stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start)
+            self._stack.pop()
+
+    def incr(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def reset(self):
+        self.samples.clear()
+        self.counters.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """各阶段的次数、总耗时与 p50/p95（毫秒）"""
+        return {
+            name: {
+                "count": len(values),
+                "total_ms": round(sum(values) * 1000, 1),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p95_ms": round(percentile(values, 95) * 1000, 1),
+            }
+            for name, values in self.samples.items()
+        }
+
+
+def timed_phase(name: str):
+    """方法装饰器：把整个方法计入 self.phases 的指定阶段"""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            with self.phases.phase(name):
+                return fn(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -30,6 +30,18 @@ JOB_DROPDOWN_LABEL_CSS = ".job-selecter-wrap .ui-dropmenu-label"
 JOB_ITEM_CURRENT_CSS = ".job-selecter-wrap .ui-dropmenu-list .job-list .job-item.curr"
 JOB_ITEM_CSS = ".job-selecter-wrap .ui-dropmenu-list .job-list .job-item"
 
+# 牛人详情页：打招呼按钮 / 关闭按钮
+DETAIL_GREET_BUTTON_XPATH = (
+    "/html/body/div[2]/div[1]/div[1]/div/div/div[1]/div/div[2]/div/div/div[1]/div/div/div[2]/div/span/div/button"
+)
+DETAIL_GREET_BUTTON_CSS = ".btn.btn-greet"
+DETAIL_CLOSE_XPATH = "/html/body/div[2]/div[1]/div[2]/i"
+DETAIL_CLOSE_CSS = ".iboss-close, .dialog-close"
+
+# 每日主动沟通上限提示
+LIMIT_DIALOG_XPATH = "//h3[contains(text(), '今日主动沟通数已达上限')]"
+LIMIT_DIALOG_CLOSE_XPATH = "/html/body/div[7]/div[1]/div[2]/i"
+
 # 推荐牛人页主体 iframe
 RECOMMEND_FRAME_CSS = "iframe[name='recommendFrame']"
 
@@ -59,3 +71,7 @@ FILTER_CONFIRM_BUTTON_XPATH_CANDIDATES = [
     "//div[contains(@class,'filter') or contains(@class,'dialog') or contains(@class,'drawer')]//button[normalize-space()='确定']",
     "//div[contains(@class,'filter') or contains(@class,'dialog') or contains(@class,'drawer')]//button[normalize-space()='确认']",
 ]
+
+# 页面快照脱敏（core.dom_capture）：需要替换为伪 ID 的属性、需要打码文本的个人字段
+PERSONAL_ID_ATTRIBUTES = ["data-geekid", "data-uid", "data-securityid"]
+PERSONAL_TEXT_SELECTORS = [".name", ".geek-name", ".school-name", ".company-name"]
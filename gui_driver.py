@@ -0,0 +1,30 @@
+"""GUI 版驱动：在 BoosDriver 基础上把二维码与任务进度转发给界面，并支持中途停止（stop_task 见 BoosDriver）。
+
+登录、打招呼、刷浏览量的流程与命令行版共用 BoosDriver 中的实现，这里只覆盖状态与进度回调。
+
+依赖 selenium 与整个驱动栈，导入较重；gui_main 只在首次登录时（或后台预热线程中）才导入本模块，
+以便主窗口先显示出来。
+"""
+
+from core.boos_driver import BoosDriver
+from gui_worker import TaskProgress
+
+
+class GuiBoosDriver(BoosDriver):
+    def __init__(self, signals, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.signals = signals
+
+    def _on_login_status(self, message: str):
+        super()._on_login_status(message)
+        self.signals.update_status.emit(message)
+
+    def _on_qrcode_image(self, png: bytes, refreshed: bool):
+        # 图片字节在工作线程中取好，界面线程只负责解码显示
+        self.signals.qr_code_image.emit(png)
+
+    def _on_task_progress(self, task: str, done: int, target: int = 0):
+        self.signals.progress.emit(TaskProgress(task, done, target))
+
+    def _on_limit_reached(self):
+        self.logger.warning("今日沟通已达上限，停止任务")
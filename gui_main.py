@@ -1,18 +1,39 @@
 import sys
 import logging
-import requests
-import time
+import importlib
 import os
+import threading
+from collections import deque
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Signal, Slot, QThread, QObject, Qt
 from PySide6.QtGui import QIcon
 
 # 导入核心逻辑 (确保 core 文件夹在同一级目录)
-from core.boos_driver import BoosDriver
-from core import selectors
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# selenium 与驱动栈（gui_driver）较重，推迟到首次登录或后台预热时再导入，保证主窗口先显示
+from common import logger_config
+from core.browser_prewarm import BrowserPrewarmer
+from gui_worker import SessionWorker, WorkerState
+
+DRIVER_MODULE = "gui_driver"
+# 主窗口显示后延迟多久开始后台预热导入（避免与首帧绘制争抢 GIL）
+WARMUP_DELAY_MS = 500
+# 关闭窗口后等待工作线程退出浏览器的最长毫秒数，超时则强制结束驱动进程
+SHUTDOWN_TIMEOUT_MS = 15000
+
+
+# 登录 cookie 文件；已处理牛人记录（processed.db）保存在同一目录
+COOKIE_PATH = "cookies.json"
+# 持久化浏览器配置目录：设为目录名（如 "browser_profile"）即启用，登录态跨次运行保留，
+# 热启动无需注入 cookie；None 保持原来的临时配置
+BROWSER_PROFILE_DIR = None
+# 精简加载模式：不加载牛人头像和第三方统计脚本（字体、图标与二维码不受影响）
+LEAN_PAGE_LOAD = False
+# 浏览器预热：主窗口显示后即在后台启动浏览器，首次登录直接使用
+PREWARM_BROWSER = False
+# 页面快照采集：设为目录名（如 "captures"）即在会话中保存推荐列表/详情/弹窗的页面快照，
+# 用于离线回放（benchmarks.replay_site）；CAPTURE_REDACT 为 True 时对姓名、ID 等个人信息脱敏
+DOM_CAPTURE_DIR = None
+CAPTURE_REDACT = True
 
 
 def resource_path(relative_path):
@@ -205,240 +226,155 @@ def get_stylesheet() -> str:
 # ==========================================
 # 2. 信号与日志处理
 # ==========================================
-class LogSignal(QObject):
-    append_log = Signal(str)
+class LogView(QtWidgets.QWidget):
+    """日志面板：先缓冲、定时批量刷新，文档行数有上限，支持级别过滤与搜索。
 
+    日志记录可在任意线程写入（只做一次 deque.append），由 GUI 线程的定时器
+    每 FLUSH_INTERVAL_MS 合并为一次 appendPlainText。全部记录另存一份环形缓冲，
+    切换级别时从缓冲重绘；搜索只在缓冲中计数并在面板内定位，不会重绘整个控件。
+    """
 
-class QPlainTextEditLogger(logging.Handler):
-    def __init__(self, widget):
+    FLUSH_INTERVAL_MS = 100
+    MAX_BLOCKS = 5000
+    HISTORY_SIZE = 50000
+    LEVELS = [("全部", logging.NOTSET), ("INFO", logging.INFO), ("WARNING", logging.WARNING), ("ERROR", logging.ERROR)]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = deque()
+        self._history = deque(maxlen=self.HISTORY_SIZE)
+        self._min_level = logging.NOTSET
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        toolbar = QtWidgets.QHBoxLayout()
+        toolbar.setContentsMargins(12, 6, 12, 6)
+        self.cmb_level = QtWidgets.QComboBox()
+        for label, level in self.LEVELS:
+            self.cmb_level.addItem(label, level)
+        self.cmb_level.currentIndexChanged.connect(self._on_level_changed)
+        self.txt_search = QtWidgets.QLineEdit()
+        self.txt_search.setPlaceholderText("搜索日志，回车定位下一条")
+        self.txt_search.returnPressed.connect(self.find_next)
+        self.txt_search.textChanged.connect(self._update_match_count)
+        self.lbl_matches = QtWidgets.QLabel("")
+        self.lbl_matches.setObjectName("StatusLabel")
+        toolbar.addWidget(QtWidgets.QLabel("级别"))
+        toolbar.addWidget(self.cmb_level)
+        toolbar.addSpacing(12)
+        toolbar.addWidget(self.txt_search, 1)
+        toolbar.addWidget(self.lbl_matches)
+        layout.addLayout(toolbar)
+
+        self.text = QtWidgets.QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.text.setMaximumBlockCount(self.MAX_BLOCKS)
+        self.text.setUndoRedoEnabled(False)
+        layout.addWidget(self.text)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def enqueue(self, text: str, level: int = logging.INFO):
+        """线程安全：只入队，等待下一次定时刷新"""
+        self._pending.append((level, text))
+
+    def append(self, text: str, level: int = logging.INFO):
+        self.enqueue(text, level)
+
+    def flush(self):
+        if not self._pending:
+            return
+        lines = []
+        pending = self._pending
+        while pending:
+            level, text = pending.popleft()
+            self._history.append((level, text))
+            if level >= self._min_level:
+                lines.append(text)
+        if lines:
+            self.text.appendPlainText("\n".join(lines[-self.MAX_BLOCKS:]))
+        if self.txt_search.text():
+            self._update_match_count()
+
+    def search(self, keyword: str) -> list[str]:
+        """在环形缓冲中查找（包括已被面板行数上限挤出的旧日志）"""
+        return [text for level, text in self._history if level >= self._min_level and keyword in text]
+
+    def find_next(self):
+        keyword = self.txt_search.text()
+        if not keyword:
+            return
+        if not self.text.find(keyword):
+            # 到底后从头再找一次
+            self.text.moveCursor(QtGui.QTextCursor.Start)
+            self.text.find(keyword)
+
+    def _update_match_count(self):
+        keyword = self.txt_search.text()
+        self.lbl_matches.setText(f"匹配 {len(self.search(keyword))} 条" if keyword else "")
+
+    def _on_level_changed(self, index: int):
+        self._min_level = self.cmb_level.itemData(index)
+        self.flush()
+        lines = [text for level, text in self._history if level >= self._min_level]
+        self.text.setPlainText("\n".join(lines[-self.MAX_BLOCKS:]))
+        self.text.moveCursor(QtGui.QTextCursor.End)
+        self._update_match_count()
+
+
+class LogViewHandler(logging.Handler):
+    def __init__(self, view: LogView):
         super().__init__()
-        self.widget = widget
-        self.signal_emitter = LogSignal()
-        self.signal_emitter.append_log.connect(self.widget.appendPlainText)
+        self.view = view
 
     def emit(self, record):
         try:
-            msg = self.format(record)
-            self.signal_emitter.append_log.emit(msg)
+            self.view.enqueue(self.format(record), record.levelno)
         except Exception:
             pass
 
 
-class WorkerSignals(QObject):
-    log_message = Signal(str)
-    update_status = Signal(str)
-    qr_code_url = Signal(str)
-    login_success = Signal()
-    logout_success = Signal()
-    task_finished = Signal()
-    error_occurred = Signal(str)
-
-
 # ==========================================
 # 3. 核心业务逻辑 (Driver & Worker)
 # ==========================================
-class GuiBoosDriver(BoosDriver):
-    def __init__(self, signals, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.signals = signals
-        self._stop_flag = False
-
-    def _get_qrcode(self):
-        self.logger.info("正在获取二维码...")
+def warm_up_driver_imports():
+    """在后台线程中预先导入驱动栈，用户点击登录时通常已经导入完毕"""
+    def run():
         try:
-            wait = WebDriverWait(self.driver, 20)
-            qr_code = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selectors.QRCODE_IMG_CSS)))
-            wait.until(lambda driver: qr_code.size["width"] > 0)
-            url = qr_code.get_attribute("src")
-            self.signals.qr_code_url.emit(url)
+            importlib.import_module(DRIVER_MODULE)
         except Exception as e:
-            self.logger.error(f"获取二维码失败: {str(e)}")
-
-    def _run_browse_loop(self, max_minutes: int = 20):
-        self.logger.info(f"准备刷浏览量，限时 {max_minutes} 分钟...")
-        self._scroll_down_list()
-
-        cards = []
-        for selector in selectors.CARD_SELECTOR_CANDIDATES:
-            frame, els = self._find_cards_any_frame(selector)
-            if els:
-                cards = [e for e in els if e.is_displayed()]
-                if cards: break
-
-        if cards:
-            self._safe_click(cards[0])
-            time.sleep(3)
-        else:
-            self.logger.warning("未找到卡片")
-            return
+            logging.getLogger(__name__).warning(f"预加载浏览器驱动模块失败：{str(e)}")
 
-        self.logger.info("开始自动翻页...")
-        start_time = time.time()
-        end_time = start_time + (max_minutes * 60)
-
-        while time.time() < end_time:
-            if self._stop_flag:
-                self.logger.info("用户停止了任务")
-                break
-            self._turn_page_right_detail()
-            time.sleep(3)
-
-        if not self._stop_flag:
-            self.logger.info("任务时间结束")
-        self._close_detail_page()
-
-    def _run_greet_loop(self, target_count: int):
-        self.logger.info(f"开始自动打招呼，目标：{target_count}人")
-        greeted_count = 0
-        processed_ids = set()
-
-        while greeted_count < target_count:
-            if self._stop_flag:
-                self.logger.info("用户停止了任务")
-                break
-
-            cards = []
-            for selector in selectors.CARD_SELECTOR_CANDIDATES:
-                frame, els = self._find_cards_any_frame(selector)
-                if els:
-                    cards = [e for e in els if e.is_displayed()]
-                    if cards: break
-
-            if not cards:
-                self.logger.warning("向下滚动刷新...")
-                self._scroll_down_list()
-                continue
-
-            target_card = None
-            target_id = None
-            for card in cards:
-                if self._stop_flag: break
-                try:
-                    gid = card.get_attribute("data-geekid")
-                    if gid in processed_ids: continue
-                    text = card.text
-                    has_kw = any(k in text for k in self.target_keywords)
-                    is_online = False
-                    try:
-                        icon = card.find_element(By.CSS_SELECTOR, ".online-marker")
-                        if icon.is_displayed(): is_online = True
-                    except:
-                        pass
-
-                    if has_kw and is_online:
-                        target_card = card
-                        target_id = gid
-                        self.logger.info(f"找到匹配: {text.replace(chr(10), ' ')[:15]}...")
-                        break
-                except:
-                    continue
-
-            if target_card:
-                processed_ids.add(target_id)
-                try:
-                    self._safe_click(target_card)
-                    status = self._perform_detail_actions()
-                    if status == "LIMIT_REACHED":
-                        self.logger.warning("今日沟通已达上限，停止任务")
-                        break
-                    elif status == "SUCCESS":
-                        greeted_count += 1
-                        self.logger.info(f"进度: {greeted_count}/{target_count}")
-                except Exception as e:
-                    self.logger.error(f"操作出错: {e}")
-            else:
-                self.logger.info("当前屏无合适人选，滚动...")
-                self._scroll_down_list()
+    threading.Thread(target=run, name="ImportWarmup", daemon=True).start()
 
-    def stop_task(self):
-        self._stop_flag = True
 
+def launch_browser():
+    """预热用的浏览器工厂，在预热线程中执行（selenium 也在此时才导入）"""
+    from core.driver_factory import create_edge_driver
+    return create_edge_driver(profile_dir=BROWSER_PROFILE_DIR, lean=LEAN_PAGE_LOAD)
 
-class WorkerThread(QThread):
-    def __init__(self):
-        super().__init__()
-        self.signals = WorkerSignals()
-        self.driver = None
-        self.action = None
-        self.params = {}
 
-    def run(self):
-        try:
-            if not self.driver and self.action != 'logout':
-                self.driver = GuiBoosDriver(self.signals)
-
-            if self.action == 'login':
-                self._do_login()
-            elif self.action == 'logout':
-                self._do_logout()
-            elif self.action == 'greet':
-                if self.driver:
-                    self.driver._stop_flag = False
-                    self.driver._run_greet_loop(self.params.get('count', 5))
-                    self.signals.task_finished.emit()
-            elif self.action == 'browse':
-                if self.driver:
-                    self.driver._stop_flag = False
-                    self.driver._run_browse_loop(self.params.get('minutes', 20))
-                    self.signals.task_finished.emit()
-        except Exception as e:
-            self.signals.error_occurred.emit(str(e))
-
-    def _do_login(self):
-        try:
-            self.signals.update_status.emit("正在打开浏览器...")
-            self.driver.driver.get("https://www.zhipin.com/")
-            applied = self.driver._inject_cookies_if_present()
-
-            if applied > 0:
-                self.signals.log_message.emit(f"检测到 {applied} 个本地 Cookie")
-                self.signals.update_status.emit("验证 Cookie...")
-                self.driver.driver.refresh()
-                self.driver._click_login_if_present(3)
-
-                if self.driver._has_recommend_talents_menu(timeout_seconds=5):
-                    self.signals.log_message.emit("Cookie 验证成功")
-                    self.driver._persist_cookies()
-                    self.driver._click_recommend_talents()
-                    self.signals.login_success.emit()
-                    return
-                else:
-                    self.signals.log_message.emit("Cookie 已失效，需扫码")
-            else:
-                self.signals.log_message.emit("准备扫码登录")
-
-            self.signals.update_status.emit("等待获取二维码...")
-            self.driver._close_download_popup_if_present(2)
-            self.driver._click_login_if_present(2)
-            self.driver._click_app_scan_login()
-            self.driver._get_qrcode()
-            self.driver._wait_for_scan_login()
-            self.driver._persist_cookies()
-            self.driver._close_download_popup_if_present(2)
-            self.driver._click_recommend_talents()
-            self.signals.log_message.emit("扫码登录成功")
-            self.signals.login_success.emit()
-        except Exception as e:
-            raise e
-
-    def _do_logout(self):
-        self.signals.update_status.emit("正在退出...")
-        cookie_file = "cookies.json"
-        if os.path.exists(cookie_file):
-            try:
-                os.remove(cookie_file)
-            except:
-                pass
-        if self.driver:
-            try:
-                self.driver.close()
-            except:
-                pass
-            self.driver = None
-        self.signals.logout_success.emit()
-
-    def stop_current_task(self):
-        if self.driver: self.driver.stop_task()
+def create_gui_driver(signals, browser=None):
+    """在工作线程中创建 GUI 驱动（首次调用时才导入 selenium 与驱动栈）"""
+    from gui_driver import GuiBoosDriver
+    recorder = None
+    if DOM_CAPTURE_DIR:
+        from core.dom_capture import DomRecorder
+        recorder = DomRecorder(DOM_CAPTURE_DIR, redact=CAPTURE_REDACT)
+    return GuiBoosDriver(
+        signals,
+        driver=browser,
+        cookie_path=COOKIE_PATH,
+        profile_dir=BROWSER_PROFILE_DIR,
+        lean=LEAN_PAGE_LOAD,
+        dom_recorder=recorder,
+    )
 
 
 # ==========================================
@@ -452,17 +388,55 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setStyleSheet(get_stylesheet())
 
         # 后台线程初始化
-        self.worker = WorkerThread()
-        self.worker.signals.qr_code_url.connect(self.display_qr_code)
+        self.prewarmer = BrowserPrewarmer(launch_browser) if PREWARM_BROWSER else None
+        # 整个会话共用一个工作线程和浏览器，按钮只向它投递命令
+        self.worker = SessionWorker(create_gui_driver, self.prewarmer, cookie_path=COOKIE_PATH)
+        self._shutdown_requested = False
+        self._shutdown_finished = False
+        self.worker.signals.qr_code_image.connect(self.display_qr_code)
         self.worker.signals.log_message.connect(self.append_log)
         self.worker.signals.update_status.connect(self.update_status_label)
         self.worker.signals.login_success.connect(self.on_login_success)
         self.worker.signals.logout_success.connect(self.on_logout_success)
         self.worker.signals.task_finished.connect(self.on_task_finished)
         self.worker.signals.error_occurred.connect(self.on_error)
+        self.worker.signals.state_changed.connect(self.on_state_changed)
+        self.worker.signals.progress.connect(self.on_progress)
+        self.worker.start()
 
         self.init_ui()
         self.setup_logging()
+        QtCore.QTimer.singleShot(WARMUP_DELAY_MS, warm_up_driver_imports)
+        if self.prewarmer:
+            QtCore.QTimer.singleShot(WARMUP_DELAY_MS, self.prewarmer.start)
+
+    def closeEvent(self, event):
+        # 先隐藏窗口，工作线程在后台停止任务并退出浏览器（含驱动进程），结束后再退出程序
+        if self._shutdown_finished:
+            super().closeEvent(event)
+            return
+        event.ignore()
+        if self._shutdown_requested:
+            return
+        self._shutdown_requested = True
+        QtWidgets.QApplication.setQuitOnLastWindowClosed(False)
+        self.hide()
+        self.worker.finished.connect(self._finish_shutdown)
+        QtCore.QTimer.singleShot(SHUTDOWN_TIMEOUT_MS, self._finish_shutdown)
+        self.worker.shutdown()
+        if not self.worker.isRunning():
+            self._finish_shutdown()
+
+    def _finish_shutdown(self):
+        """工作线程结束（或等待超时）后关闭未被使用的预热浏览器并退出程序"""
+        if self._shutdown_finished:
+            return
+        self._shutdown_finished = True
+        if self.worker.isRunning():
+            self.worker.force_close()
+        if self.prewarmer:
+            self.prewarmer.shutdown()
+        QtWidgets.QApplication.quit()
 
     def init_ui(self):
         # 根容器
@@ -671,11 +645,9 @@ class MainWindow(QtWidgets.QMainWindow):
         """)
         log_layout.addWidget(log_header)
 
-        # 日志文本框
-        self.txt_log = QtWidgets.QPlainTextEdit()
-        self.txt_log.setReadOnly(True)
-        self.txt_log.setFrameShape(QtWidgets.QFrame.NoFrame)
-        log_layout.addWidget(self.txt_log)
+        # 日志面板（批量刷新 + 行数上限 + 级别过滤 / 搜索）
+        self.log_view = LogView()
+        log_layout.addWidget(self.log_view)
 
         # 使用 Splitter
         splitter = QtWidgets.QSplitter(Qt.Vertical)
@@ -697,34 +669,30 @@ class MainWindow(QtWidgets.QMainWindow):
         main_layout.addWidget(splitter)
 
     def setup_logging(self):
-        handler = QPlainTextEditLogger(self.txt_log)
+        handler = LogViewHandler(self.log_view)
         # 日志格式优化
         handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', "%H:%M:%S"))
-        logger = logging.getLogger('core.boos_driver')
-        logger.setLevel(logging.INFO)
-        # logger.addHandler(handler)
-        logging.getLogger().addHandler(handler)
+        # 队列模式：工作线程只负责入队，刷新日志面板在后台监听线程完成；
+        # 与之前一样只输出到日志面板，不写 boos_auto.log、不输出控制台
+        logger_config.setup_logging(log_file=None, console=False, extra_handlers=[handler])
 
     @Slot(str)
     def append_log(self, text):
-        self.txt_log.appendPlainText(text)
+        self.log_view.append(text)
 
     @Slot(str)
     def update_status_label(self, text):
         self.lbl_status.setText(f"当前状态：{text}")
 
-    @Slot(str)
-    def display_qr_code(self, url):
-        self.txt_log.appendPlainText(">> 二维码已加载，请扫码...")
+    @Slot(bytes)
+    def display_qr_code(self, png):
+        self.log_view.append(">> 二维码已加载，请扫码...")
         self.lbl_status.setText("当前状态：等待扫码")
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            image = QtGui.QImage()
-            image.loadFromData(response.content)
+        image = QtGui.QImage()
+        if image.loadFromData(png):
             pixmap = QtGui.QPixmap.fromImage(image)
             self.lbl_qr.setPixmap(pixmap.scaled(200, 200, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation))
-        except:
+        else:
             self.lbl_qr.setText("二维码加载失败")
 
     def start_login(self):
@@ -732,8 +700,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_logout.setEnabled(False)
         self.lbl_qr.setText("初始化中...")
         self.lbl_status.setText("当前状态：启动浏览器...")
-        self.worker.action = 'login'
-        self.worker.start()
+        self.worker.login()
 
     def on_login_success(self):
         self.lbl_qr.setText("已登录")
@@ -751,7 +718,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_login.setText("已连接")
         self.btn_logout.setEnabled(True)
         self.btn_start.setEnabled(True)
-        self.txt_log.appendPlainText(">> 系统就绪，请在右侧选择任务并开始。")
+        self.log_view.append(">> 系统就绪，请在右侧选择任务并开始。")
 
     def start_logout(self):
         reply = QtWidgets.QMessageBox.question(
@@ -761,10 +728,12 @@ class MainWindow(QtWidgets.QMainWindow):
         if reply == QtWidgets.QMessageBox.Yes:
             self.btn_logout.setEnabled(False)
             self.btn_start.setEnabled(False)
-            self.worker.action = 'logout'
-            self.worker.start()
+            self.worker.logout()
 
     def on_logout_success(self):
+        # 退出后为下一次登录重新预热一个浏览器
+        if self.prewarmer:
+            self.prewarmer.start()
         self.lbl_qr.clear()
         self.lbl_qr.setText("未连接")
         # 恢复默认灰色样式
@@ -785,35 +754,43 @@ class MainWindow(QtWidgets.QMainWindow):
         idx = self.tabs.currentIndex()
         if idx == 0:
             val = self.spin_greet_count.value()
-            self.worker.action = 'greet'
-            self.worker.params = {'count': val}
-            self.txt_log.appendPlainText(f"\n-------- [任务启动] 自动打招呼 (目标 {val} 人) --------")
+            self.worker.greet(val)
+            self.log_view.append(f"\n-------- [任务启动] 自动打招呼 (目标 {val} 人) --------")
         else:
             val = self.spin_browse_time.value()
-            self.worker.action = 'browse'
-            self.worker.params = {'minutes': val}
-            self.txt_log.appendPlainText(f"\n-------- [任务启动] 刷浏览量 (限时 {val} 分钟) --------")
+            self.worker.browse(val)
+            self.log_view.append(f"\n-------- [任务启动] 刷浏览量 (限时 {val} 分钟) --------")
 
         self.btn_start.setEnabled(False)
         self.btn_stop.setEnabled(True)
         self.btn_logout.setEnabled(False)
         self.lbl_status.setText("当前状态：任务运行中...")
-        self.worker.start()
 
     def stop_task(self):
-        self.txt_log.appendPlainText(">> 正在请求停止...")
-        self.worker.stop_current_task()
+        self.log_view.append(">> 正在请求停止...")
+        self.worker.stop()
         self.btn_stop.setEnabled(False)
 
+    def on_state_changed(self, event):
+        if event.new == WorkerState.STOPPING:
+            self.lbl_status.setText(f"当前状态：{event.new.value}...")
+        self.btn_stop.setEnabled(event.new == WorkerState.RUNNING)
+
+    def on_progress(self, event):
+        if event.target:
+            self.lbl_status.setText(f"当前状态：任务运行中 ({event.done}/{event.target})")
+        else:
+            self.lbl_status.setText(f"当前状态：任务运行中 (已完成 {event.done})")
+
     def on_task_finished(self):
-        self.txt_log.appendPlainText("-------- [系统] 任务已结束 --------")
+        self.log_view.append("-------- [系统] 任务已结束 --------")
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.btn_logout.setEnabled(True)
         self.lbl_status.setText("当前状态：在线 (空闲)")
 
     def on_error(self, msg):
-        self.txt_log.appendPlainText(f"[错误] {msg}")
+        self.log_view.append(f"[错误] {msg}", logging.ERROR)
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
         self.btn_login.setEnabled(True)
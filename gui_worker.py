@@ -0,0 +1,309 @@
+"""GUI 后台工作线程：整个会话只用一个线程和一个浏览器，界面通过命令队列驱动它。
+
+界面线程只负责投递命令（登录 / 打招呼 / 刷浏览量 / 停止 / 退出登录 / 关闭），
+工作线程按顺序执行，并通过信号回报状态变化与任务进度：
+- 任务运行中再次点击不会丢失或与当前任务竞争，而是排队，轮到时再按当时的状态判断是否执行；
+- 停止直接作用于取消令牌，不经过队列，当前等待立即结束；
+- 浏览器由工作线程创建、在多次任务间复用，退出登录和程序关闭时彻底退出（含驱动进程）。
+
+本模块不依赖 selenium，浏览器驱动由调用方传入的工厂函数在工作线程中创建。
+"""
+
+import logging
+import os
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from enum import Enum
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from common.cancellation import TaskCancelled
+
+
+class WorkerState(Enum):
+    IDLE = "未登录"
+    LOGGING_IN = "登录中"
+    READY = "在线 (空闲)"
+    RUNNING = "任务运行中"
+    STOPPING = "正在停止"
+    LOGGING_OUT = "正在退出"
+    SHUT_DOWN = "已关闭"
+
+
+# 允许的状态迁移；任何状态都可以直接进入 SHUT_DOWN
+TRANSITIONS = {
+    WorkerState.IDLE: {WorkerState.LOGGING_IN, WorkerState.LOGGING_OUT},
+    WorkerState.LOGGING_IN: {WorkerState.READY, WorkerState.IDLE},
+    WorkerState.READY: {WorkerState.RUNNING, WorkerState.LOGGING_OUT},
+    WorkerState.RUNNING: {WorkerState.STOPPING, WorkerState.READY},
+    WorkerState.STOPPING: {WorkerState.READY},
+    WorkerState.LOGGING_OUT: {WorkerState.IDLE},
+    WorkerState.SHUT_DOWN: set(),
+}
+
+# 命令 -> 执行时要求的状态
+LOGIN, GREET, BROWSE, LOGOUT, SHUTDOWN = "login", "greet", "browse", "logout", "shutdown"
+TASKS = (GREET, BROWSE)
+REQUIRED_STATES = {
+    LOGIN: {WorkerState.IDLE},
+    GREET: {WorkerState.READY},
+    BROWSE: {WorkerState.READY},
+    LOGOUT: {WorkerState.IDLE, WorkerState.READY},
+}
+
+
+@dataclass(frozen=True)
+class Command:
+    kind: str
+    params: dict = field(default_factory=dict)
+    # 投递时已发生过的停止次数；任务命令开始执行前又发生过停止则不再执行
+    generation: int = 0
+
+
+# -------- 进度事件（通过 WorkerSignals 发给界面） --------
+@dataclass(frozen=True)
+class StateChanged:
+    old: WorkerState
+    new: WorkerState
+
+
+@dataclass(frozen=True)
+class TaskProgress:
+    """task 为 greet / browse；greet 的 done/target 为已打招呼 / 目标人数，browse 为已翻页数（target 为 0）"""
+
+    task: str
+    done: int
+    target: int = 0
+
+
+@dataclass(frozen=True)
+class TaskFinished:
+    task: str
+    cancelled: bool
+
+
+class WorkerSignals(QObject):
+    log_message = Signal(str)
+    update_status = Signal(str)
+    qr_code_image = Signal(bytes)
+    login_success = Signal()
+    logout_success = Signal()
+    task_finished = Signal()
+    error_occurred = Signal(str)
+    state_changed = Signal(object)  # StateChanged
+    progress = Signal(object)  # TaskProgress
+    task_result = Signal(object)  # TaskFinished
+
+
+class SessionWorker(QThread):
+    """driver_factory(signals, browser) 创建 GUI 驱动；browser 为预热好的浏览器（可能为 None）。
+
+    cookie_path 应与驱动使用的 cookie 文件一致，浏览器尚未启动时退出登录直接删除该文件。
+    """
+
+    def __init__(
+            self,
+            driver_factory: Callable,
+            prewarmer=None,
+            logger: logging.Logger | None = None,
+            cookie_path: str = "cookies.json",
+    ):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.driver = None
+        self.prewarmer = prewarmer
+        self.logger = logger or logging.getLogger(__name__)
+        self.cookie_path = cookie_path
+        # 程序正在关闭：不再清除取消标记
+        self._shutting_down = False
+        # 停止次数，见 Command.generation
+        self._stop_generation = 0
+        self._driver_factory = driver_factory
+        self._commands: queue.Queue[Command] = queue.Queue()
+        self._state = WorkerState.IDLE
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> WorkerState:
+        return self._state
+
+    # -------- 界面线程调用 --------
+    def login(self):
+        self._submit(Command(LOGIN))
+
+    def greet(self, count: int):
+        self._submit(Command(GREET, {"count": count}))
+
+    def browse(self, minutes: int):
+        self._submit(Command(BROWSE, {"minutes": minutes}))
+
+    def logout(self):
+        self._submit(Command(LOGOUT))
+
+    def stop(self):
+        """停止当前任务，并丢弃排队中尚未开始的任务"""
+        self._discard_pending(TASKS)
+        # 与 run 中取出命令后清除取消标记互斥：已取出但尚未开始的任务同样不会执行
+        with self._lock:
+            self._stop_generation += 1
+            if self._state == WorkerState.RUNNING:
+                self._transition(WorkerState.STOPPING)
+            if self.driver is not None:
+                self.driver.stop_task()
+
+    def shutdown(self):
+        """程序退出：取消当前任务，由工作线程退出浏览器后结束（不等待，线程结束时发出 finished）"""
+        self._shutting_down = True
+        self._discard_pending(())
+        with self._lock:
+            if self.driver is not None:
+                self.driver.stop_task()
+        self._commands.put(Command(SHUTDOWN))
+        if not self.isRunning():
+            self._close_driver()
+
+    def force_close(self):
+        """工作线程卡在某个浏览器命令上未能按时退出：直接结束驱动进程，避免残留"""
+        self.logger.warning("工作线程未能及时退出，强制关闭浏览器")
+        self._close_driver()
+
+    def _submit(self, command: Command):
+        if self._state == WorkerState.SHUT_DOWN:
+            return
+        with self._lock:
+            command = replace(command, generation=self._stop_generation)
+        self._commands.put(command)
+
+    def _discard_pending(self, kinds):
+        """从队列中移除指定类型（为空则全部）尚未执行的命令"""
+        kept = []
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                break
+            if kinds and command.kind not in kinds:
+                kept.append(command)
+        for command in kept:
+            self._commands.put(command)
+
+    # -------- 工作线程 --------
+    def _transition(self, new: WorkerState):
+        old = self._state
+        if old == new:
+            return
+        if new != WorkerState.SHUT_DOWN and new not in TRANSITIONS[old]:
+            raise RuntimeError(f"非法的状态迁移：{old.name} -> {new.name}")
+        self._state = new
+        self.signals.state_changed.emit(StateChanged(old, new))
+
+    def _set_state(self, new: WorkerState):
+        with self._lock:
+            self._transition(new)
+
+    def run(self):
+        handlers = {LOGIN: self._do_login, GREET: self._do_task, BROWSE: self._do_task, LOGOUT: self._do_logout}
+        while True:
+            command = self._commands.get()
+            if command.kind == SHUTDOWN:
+                self._close_driver()
+                self._set_state(WorkerState.SHUT_DOWN)
+                return
+
+            state = self._state
+            if state not in REQUIRED_STATES[command.kind]:
+                self.signals.log_message.emit(f"已忽略“{command.kind}”：当前状态为{state.value}")
+                continue
+            with self._lock:
+                if command.kind in TASKS and command.generation != self._stop_generation:
+                    # 投递之后、开始之前用户点了停止
+                    self.signals.log_message.emit(f"已取消排队中的“{command.kind}”")
+                    continue
+                # 清除上一条命令留下的停止标记，否则登录等流程会立即被取消
+                if self.driver is not None and not self._shutting_down:
+                    self.driver.cancel_token.reset()
+            try:
+                handlers[command.kind](command)
+            except TaskCancelled:
+                # 登录等非任务流程中被取消（通常是程序正在关闭）
+                self.signals.log_message.emit(f"“{command.kind}”已取消")
+                self._recover()
+            except Exception as e:
+                self.signals.error_occurred.emit(str(e))
+                self._recover()
+
+    def _recover(self):
+        """命令执行出错后回到可继续操作的状态（浏览器保留，下次直接复用）"""
+        with self._lock:
+            state = self._state
+            if state == WorkerState.LOGGING_IN:
+                self._transition(WorkerState.IDLE)
+            elif state in (WorkerState.RUNNING, WorkerState.STOPPING):
+                self._transition(WorkerState.READY)
+            elif state == WorkerState.LOGGING_OUT:
+                self._transition(WorkerState.IDLE)
+
+    def _ensure_driver(self):
+        if self.driver is None:
+            # 有预热好的浏览器就直接接管，否则在这里启动
+            browser = self.prewarmer.acquire() if self.prewarmer else None
+            self.driver = self._driver_factory(self.signals, browser)
+        return self.driver
+
+    def _close_driver(self):
+        """退出浏览器与驱动进程（BoosDriver.close 内部调用 quit，失败时强制结束进程）"""
+        driver, self.driver = self.driver, None
+        if driver is None:
+            return
+        try:
+            driver.close()
+        except Exception as e:
+            self.logger.warning(f"关闭浏览器失败：{str(e)}")
+
+    def _do_login(self, command: Command):
+        self._set_state(WorkerState.LOGGING_IN)
+        self.signals.update_status.emit("正在打开浏览器...")
+        # 登录流程与命令行版共用 BoosDriver.login，阶段提示经 _on_login_status 转发到界面
+        self._ensure_driver().login()
+        self.signals.log_message.emit("登录成功")
+        self._set_state(WorkerState.READY)
+        self.signals.login_success.emit()
+
+    def _do_task(self, command: Command):
+        driver = self.driver
+        if driver is None:
+            raise RuntimeError("浏览器尚未启动，请先登录")
+        # 阶段耗时只统计本次任务，避免长时间会话中样本无限增长
+        driver.phases.reset()
+        self._set_state(WorkerState.RUNNING)
+        try:
+            if command.kind == GREET:
+                driver._run_greet_loop(command.params.get("count", 5))
+            else:
+                driver._run_browse_loop(command.params.get("minutes", 20))
+        finally:
+            with self._lock:
+                cancelled = self._state == WorkerState.STOPPING
+                self._transition(WorkerState.READY)
+        self.signals.task_result.emit(TaskFinished(command.kind, cancelled))
+        self.signals.task_finished.emit()
+
+    def _do_logout(self, command: Command):
+        self._set_state(WorkerState.LOGGING_OUT)
+        self.signals.update_status.emit("正在退出...")
+        driver = self.driver
+        if driver is not None:
+            try:
+                driver.clear_session()
+            except Exception as e:
+                self.logger.warning(f"清除登录态失败：{str(e)}")
+            self._close_driver()
+        else:
+            try:
+                os.remove(self.cookie_path)
+            except OSError:
+                pass
+        self._set_state(WorkerState.IDLE)
+        self.signals.logout_success.emit()
@@ -0,0 +1,49 @@
+from core.candidate_scorer import CandidateScorer
+from core.card_snapshot import CardSnapshot
+
+
+def card(text: str, online: bool = True, index: int = 0, geekid: str | None = None) -> CardSnapshot:
+    return CardSnapshot(geekid=geekid or f"g{index}", text=text, online=online, visible=True, index=index, selector=".card")
+
+
+def test_overlapping_keywords_do_not_inflate_score():
+    scorer = CandidateScorer(["司机", "货车司机", "司机兼职", "货车司机兼职"], activity_weights={}, online_bonus=0)
+    nested = scorer.score(card("期望职位：货车司机兼职"))
+    assert nested.score == 1
+    assert nested.hits == ("货车司机兼职",)
+    # 只写了“司机”的卡片与之同分
+    assert scorer.score(card("期望职位：司机")).score == 1
+
+
+def test_overlap_keeps_highest_weight():
+    scorer = CandidateScorer({"司机": 1, "货车司机": 3, "司机兼职": 2}, activity_weights={}, online_bonus=0)
+    # “货车司机”与“司机兼职”部分重叠，合并为一段取最高权重
+    scored = scorer.score(card("货车司机兼职"))
+    assert scored.score == 3
+    assert scored.hits == ("货车司机",)
+
+
+def test_separate_mentions_still_add_up():
+    scorer = CandidateScorer(["司机", "保安", "货车司机"], activity_weights={}, online_bonus=0)
+    assert scorer.score(card("货车司机 / 保安")).score == 2
+    # 同一关键词重复出现只计一次
+    assert scorer.score(card("司机 司机 司机")).score == 1
+
+
+def test_activity_online_and_negative_terms():
+    scorer = CandidateScorer(["司机"], negative_keywords=["实习"])
+    assert scorer.score(card("司机 刚刚活跃")).score == 1 + 3 + 2
+    assert scorer.score(card("司机 实习", online=False)).score == 1 - 10
+
+
+def test_rank_orders_by_score_and_excludes():
+    scorer = CandidateScorer({"司机": 1, "保安": 2}, activity_weights={}, online_bonus=0)
+    cards = [
+        card("司机", index=0),
+        card("保安", index=1),
+        card("程序员", index=2),
+        card("保安", index=3, online=False),
+        card("保安 司机", index=4),
+    ]
+    ranked = scorer.rank(cards, exclude={"g1"})
+    assert [s.card.index for s in ranked] == [4, 0]
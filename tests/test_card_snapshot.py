@@ -0,0 +1,55 @@
+from core.card_snapshot import ScanCursor, parse_snapshot, refresh_snapshot
+
+
+def raw(cards, total, start=0, selector=".card"):
+    return {"selector": selector, "total": total, "start": start, "cards": cards}
+
+
+def test_parse_snapshot():
+    cards = parse_snapshot(raw([["g1", "货车司机", 1, True, 0], ["g2", None, 0, False, 1], ["bad"]], 2))
+    assert [c.geekid for c in cards] == ["g1", "g2"]
+    assert cards[0].online and cards[0].visible and cards[0].selector == ".card"
+    assert cards[1].text == "" and not cards[1].online
+    assert parse_snapshot(None) == []
+
+
+def test_cursor_advances_to_total_and_anchor():
+    cursor = ScanCursor()
+    assert cursor.args() == (0, None)
+    cursor.advance(raw([["g1", "", 1, 1, 0], ["g2", "", 1, 1, 1]], 2))
+    assert cursor.args() == (2, "g2")
+    # 没有新卡片时位置不变，锚点保留
+    cursor.advance(raw([], 2, start=2))
+    assert cursor.args() == (2, "g2")
+    assert cursor.resets == 0
+
+
+def test_cursor_counts_page_side_reset():
+    cursor = ScanCursor()
+    cursor.advance(raw([["g1", "", 1, 1, 0]], 1))
+    cursor.advance(raw([["x1", "", 1, 1, 0]], 1, start=0))
+    assert cursor.resets == 1
+    assert cursor.args() == (1, "x1")
+
+
+def test_cursor_resets_when_list_missing():
+    cursor = ScanCursor()
+    cursor.advance(raw([["g1", "", 1, 1, 0]], 1))
+    cursor.advance(None)
+    assert cursor.args() == (0, None)
+
+
+def test_cursor_shift_after_prune():
+    cursor = ScanCursor()
+    cursor.advance(raw([[f"g{i}", "", 1, 1, i] for i in range(10)], 10))
+    cursor.shift(6)
+    assert cursor.args() == (4, "g9")
+    cursor.shift(100)
+    assert cursor.position == 0
+
+
+def test_refresh_snapshot_updates_state():
+    card = parse_snapshot(raw([["g1", "货车司机", 1, True, 3]], 4))[0]
+    fresh = refresh_snapshot(card, ["货车司机 刚刚活跃", False, True])
+    assert (fresh.text, fresh.online, fresh.visible, fresh.index) == ("货车司机 刚刚活跃", False, True, 3)
+    assert refresh_snapshot(card, None) is card
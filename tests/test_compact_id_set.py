@@ -0,0 +1,75 @@
+from common.compact_id_set import CompactIdSet
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_add_and_contains():
+    ids = CompactIdSet()
+    assert ids.add("a") is True
+    assert ids.add("a") is False
+    assert "a" in ids
+    assert "b" not in ids
+    assert len(ids) == 1
+
+
+def test_grows_past_initial_capacity():
+    ids = CompactIdSet(initial_capacity=16)
+    items = [f"geek-{i}" for i in range(1000)]
+    ids.update(items)
+    assert all(i in ids for i in items)
+    assert ids.capacity >= 2 * len(ids)
+
+
+def test_no_eviction_below_limit():
+    ids = CompactIdSet(max_items=1000, initial_capacity=16)
+    items = [f"geek-{i}" for i in range(1000)]
+    ids.update(items)
+    assert ids.evicted == 0
+    assert all(i in ids for i in items)
+
+
+def test_ttl_expires_and_readd_counts_as_new():
+    clock = FakeClock()
+    ids = CompactIdSet(ttl_seconds=10, clock=clock)
+    ids.add("a")
+    clock.now = 9
+    assert "a" in ids
+    clock.now = 10
+    assert "a" not in ids
+    assert ids.add("a") is True
+    assert "a" in ids
+
+
+def test_eviction_keeps_recent_ids_within_limit():
+    clock = FakeClock()
+    ids = CompactIdSet(max_items=100, initial_capacity=16, clock=clock)
+    for i in range(1000):
+        clock.now = i
+        ids.add(f"geek-{i}")
+    assert len(ids) <= 100
+    assert ids.evicted > 0
+    assert "geek-999" in ids
+    assert "geek-0" not in ids
+    # 淘汰后容量不超过上限对应的槽位数
+    assert ids.capacity <= 256
+
+
+def test_clear():
+    ids = CompactIdSet(bloom_bits=1024)
+    ids.update(["a", "b"])
+    ids.clear()
+    assert len(ids) == 0
+    assert "a" not in ids
+
+
+def test_bloom_has_no_false_negatives():
+    ids = CompactIdSet(bloom_bits=4096)
+    items = [f"geek-{i}" for i in range(300)]
+    ids.update(items)
+    assert all(i in ids for i in items)
@@ -0,0 +1,40 @@
+import pytest
+
+from core.keyword_matcher import KeywordMatcher
+
+
+def test_prunes_keywords_containing_shorter_ones():
+    matcher = KeywordMatcher(["司机", "货车司机兼职", "保洁", "司机"])
+    assert matcher.keywords == ["司机", "保洁"]
+
+
+def test_unpruned_reports_overlapping_keywords():
+    matcher = KeywordMatcher(["司机", "货车司机", "货车司机兼职"], prune_redundant=False)
+    assert sorted(matcher.find_all("招聘货车司机兼职")) == sorted(["司机", "货车司机", "货车司机兼职"])
+
+
+@pytest.mark.parametrize("threshold", [0, 48])
+def test_matches_on_both_paths(threshold):
+    matcher = KeywordMatcher(["司机", "保洁", "he", "she", "hers"], small_set_threshold=threshold)
+    assert matcher.uses_automaton is (threshold == 0)
+    assert matcher.matches("想找保洁工作")
+    assert matcher.matches("ushers")
+    assert not matcher.matches("程序员")
+    assert "ushers" in matcher
+
+
+def test_failure_links_find_suffix_matches():
+    matcher = KeywordMatcher(["abcd", "bce"], small_set_threshold=0)
+    assert matcher.find_all("abce") == ["bce"]
+    assert matcher.matches("abce")
+
+
+def test_empty_keywords_never_match():
+    matcher = KeywordMatcher(["", ""])
+    assert len(matcher) == 0
+    assert not matcher.matches("任意文本")
+
+
+def test_find_spans_reports_positions():
+    matcher = KeywordMatcher(["司机", "货车司机"], prune_redundant=False)
+    assert sorted(matcher.find_spans("招货车司机")) == [(1, 5, "货车司机"), (3, 5, "司机")]
@@ -0,0 +1,43 @@
+import io
+import logging
+
+import pytest
+
+from common import logger_config
+
+
+@pytest.fixture
+def buffer_handler():
+    buf = io.StringIO()
+    handler = logging.StreamHandler(buf)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    yield handler, buf
+    logger_config.stop_logging()
+
+
+def test_queued_record_is_formatted_before_enqueue(buffer_handler):
+    handler, buf = buffer_handler
+    logger_config.setup_logging(log_file=None, console=False, extra_handlers=[handler])
+    payload = {"n": 1}
+    logging.getLogger("t").info("payload=%s", payload)
+    # 入队后再修改参数不影响已记录的消息
+    payload["n"] = 2
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        logging.getLogger("t").exception("failed")
+    logger_config.stop_logging()
+
+    out = buf.getvalue()
+    assert "payload={'n': 1}" in out
+    assert "ValueError: bad" in out
+
+
+def test_direct_mode_does_not_stack_handlers(buffer_handler):
+    root = logging.getLogger()
+    before = len(root.handlers)
+    for _ in range(3):
+        logger_config.setup_logging(log_file=None, console=True, queued=False)
+    assert len(root.handlers) == before + 1
+    logger_config.stop_logging()
+    assert len(root.handlers) == before
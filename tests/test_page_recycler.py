@@ -0,0 +1,31 @@
+import pytest
+
+from core.page_recycler import PageRecycler, RecyclePolicy
+
+
+def test_recycling_is_opt_in():
+    recycler = PageRecycler()
+    assert not recycler.policy.enabled
+    assert recycler.due(10_000) is None
+
+
+def test_default_policy_reloads():
+    policy = RecyclePolicy()
+    assert policy.enabled
+    assert policy.mode == "reload"
+
+
+def test_due_by_cards_and_heap():
+    recycler = PageRecycler(RecyclePolicy(max_cards=100, max_heap_mb=256, max_age_s=0))
+    assert recycler.due(99) is None
+    assert recycler.due(100) == "cards"
+    recycler.record_heap(300 * 1024 * 1024)
+    assert recycler.due(10) == "heap"
+    recycler.recycled("heap")
+    assert recycler.due(10) is None
+    assert recycler.recycles == {"heap": 1}
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        RecyclePolicy(mode="restart")
@@ -0,0 +1,94 @@
+import pytest
+
+from common.processed_store import ProcessedStore
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    s = ProcessedStore(str(tmp_path / "processed.db"), flush_interval=0.01, retry_after_s=3600, clock=clock)
+    yield s
+    s.close()
+
+
+def test_greeted_is_excluded_permanently(store, clock):
+    store.record("g1", "job", "greeted")
+    assert store.seen(["g1"], "job") == {"g1"}
+    store.flush()
+    clock.now += 30 * 24 * 3600
+    assert store.seen(["g1"], "job") == {"g1"}
+
+
+@pytest.mark.parametrize("status", ["opened", "skipped", "failed"])
+def test_other_statuses_retry_after_window(store, clock, status):
+    store.record("g1", "job", status)
+    # 未落盘与已落盘两种情况都应在窗口内排除
+    assert store.seen(["g1"], "job") == {"g1"}
+    store.flush()
+    assert store.seen(["g1"], "job") == {"g1"}
+    clock.now += 3600
+    assert store.seen(["g1"], "job") == set()
+
+
+def test_pending_expires_before_flush(store, clock):
+    store.record("g1", "job", "failed")
+    clock.now += 3600
+    assert store.seen(["g1"], "job") == set()
+
+
+def test_latest_status_wins(store, clock):
+    store.record("g1", "job", "failed")
+    store.record("g1", "job", "greeted")
+    store.flush()
+    assert store.status_of("g1", "job") == "greeted"
+    clock.now += 7200
+    assert store.seen(["g1"], "job") == {"g1"}
+
+
+def test_scoped_by_job(store):
+    store.record("g1", "a", "greeted")
+    store.flush()
+    assert store.seen(["g1"], "a") == {"g1"}
+    assert store.seen(["g1"], "b") == set()
+
+
+def test_ignores_empty_ids_and_unknown_status(store):
+    store.record(None, "job", "greeted")
+    assert store.seen([None, "", "g1"], "job") == set()
+    with pytest.raises(ValueError):
+        store.record("g1", "job", "done")
+
+
+def test_persists_across_instances(tmp_path, clock):
+    path = str(tmp_path / "processed.db")
+    first = ProcessedStore(path, clock=clock)
+    first.record("g1", "job", "greeted")
+    first.record("g2", "job", "skipped")
+    first.close()
+
+    clock.now += 7 * 24 * 3600
+    second = ProcessedStore(path, clock=clock)
+    try:
+        assert second.seen(["g1", "g2", "g3"], "job") == {"g1"}
+    finally:
+        second.close()
+
+
+def test_seen_handles_more_ids_than_sqlite_parameter_limit(store):
+    ids = [f"g{i}" for i in range(1200)]
+    for gid in ids[::2]:
+        store.record(gid, "job", "greeted")
+    store.flush()
+    assert store.seen(ids, "job") == set(ids[::2])